@@ -0,0 +1,53 @@
+"""
+Memory vs. lookup time: set of str vs. the FingerprintSet duplicate index.
+
+Run with:  python -m benchmarks.bench_fingerprint_set [words]
+"""
+
+import sys
+import time
+import tracemalloc
+
+from lexicards.core.fingerprint_set import FingerprintSet
+
+
+def make_words(count: int):
+    """Yield synthetic known words."""
+    for i in range(count):
+        yield f"単語{i}"
+
+
+def measure(label: str, build, count: int) -> None:
+    """Build an index and report its retained memory and lookup time."""
+    tracemalloc.start()
+    index = build(make_words(count))
+    current, _ = tracemalloc.get_traced_memory()
+    tracemalloc.stop()
+
+    # Fresh str objects, as a saver sees them (no cached hash)
+    hits = [f"単語{i}" for i in range(0, count, 7)]
+    misses = [f"未知{i}" for i in range(0, count, 7)]
+
+    start = time.perf_counter()
+    for word in hits:
+        assert word in index
+    for word in misses:
+        assert word not in index
+    elapsed = time.perf_counter() - start
+
+    print(
+        f"{label:<15} {len(index):>9} words  {current / 2**20:8.1f} MiB"
+        f"  {current / len(index):6.1f} B/word"
+        f"  {elapsed * 1e9 / (len(hits) + len(misses)):7.0f} ns/lookup"
+    )
+
+
+def main():
+    count = int(sys.argv[1]) if len(sys.argv) > 1 else 500_000
+
+    measure("set[str]", set, count)
+    measure("FingerprintSet", FingerprintSet, count)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,64 @@
+"""
+Retirement benchmark: list.pop(random index) vs. WordStore O(1) retirement.
+
+Retires every card of a WordStore deck in random order, and extrapolates
+the list baseline from a sample of pops (a full run is quadratic).
+
+Run with:  python -m benchmarks.bench_retire [rows]
+"""
+
+import random
+import sys
+import time
+
+from lexicards.manager.word_store import WordStore
+
+LIST_SAMPLE = 20_000
+
+
+def make_rows(count: int):
+    """Yield a header row followed by synthetic word entries."""
+    yield ["Japanese", "English"]
+    for i in range(count):
+        yield [f"単語{i}", f"meaning number {i}"]
+
+
+def bench_list(count: int) -> float:
+    """Return the average seconds per random list.pop on a full deck."""
+    words = list(make_rows(count))[1:]
+    sample = min(LIST_SAMPLE, count)
+
+    start = time.perf_counter()
+    for _ in range(sample):
+        words.pop(random.randrange(len(words)))
+    return (time.perf_counter() - start) / sample
+
+
+def bench_store(count: int) -> float:
+    """Return the total seconds to retire every card of a WordStore."""
+    store = WordStore.from_rows(make_rows(count))
+
+    start = time.perf_counter()
+    while store:
+        store.pop(random.randrange(len(store)))
+    return time.perf_counter() - start
+
+
+def main():
+    count = int(sys.argv[1]) if len(sys.argv) > 1 else 1_000_000
+
+    per_pop = bench_list(count)
+    print(
+        f"list.pop        {per_pop * 1e6:8.2f} us/card"
+        f"  (~{per_pop * count / 2:7.1f} s to retire {count} cards)"
+    )
+
+    total = bench_store(count)
+    print(
+        f"WordStore.pop   {total / count * 1e6:8.2f} us/card"
+        f"  ({total:7.1f} s to retire {count} cards)"
+    )
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,98 @@
+"""
+Card search: a linear scan of the deck vs. the prefix trie and trigram index.
+
+Builds a synthetic deck of kana words with short English-like meanings,
+then times word-prefix and meaning-substring queries returning up to 20
+cards, before and after retiring a tenth of the deck.
+
+Run with:  python -m benchmarks.bench_search [cards] [queries]
+"""
+
+import random
+import sys
+import time
+
+from lexicards.manager.word_store import WordStore
+from lexicards.search.card_search import CardSearchIndex
+from lexicards.search.text_normalize import normalize_key
+
+KANA = "あいうえおかきくけこさしすせそたちつてとなにぬねのはひふへほまみむめもやゆよらりるれろわん"
+LETTERS = "abcdefghijklmnopqrstuvwxyz"
+
+
+def build_deck(count: int, rng: random.Random) -> WordStore:
+    """Return a WordStore of count synthetic cards."""
+    vocabulary = [
+        "".join(rng.choice(LETTERS) for _ in range(rng.randint(3, 9)))
+        for _ in range(20_000)
+    ]
+    words = WordStore(("Japanese", "English"))
+    for _ in range(count):
+        word = "".join(rng.choice(KANA) for _ in range(rng.randint(2, 6)))
+        meaning = " ".join(rng.choice(vocabulary) for _ in range(rng.randint(1, 3)))
+        words.append(word, meaning)
+    return words
+
+
+def bench_scan(words: WordStore, prefixes, texts) -> float:
+    """Return seconds per query scanning every card."""
+    start = time.perf_counter()
+    for prefix, text in zip(prefixes, texts):
+        prefix, text = normalize_key(prefix), normalize_key(text)
+        found = []
+        for word, meaning in words:
+            if normalize_key(word).startswith(prefix):
+                found.append((word, meaning))
+                if len(found) == 20:
+                    break
+        found = []
+        for word, meaning in words:
+            if text in normalize_key(meaning):
+                found.append((word, meaning))
+                if len(found) == 20:
+                    break
+    return (time.perf_counter() - start) / (2 * len(prefixes))
+
+
+def bench_index(index: CardSearchIndex, prefixes, texts) -> float:
+    """Return seconds per query through the index."""
+    start = time.perf_counter()
+    for prefix, text in zip(prefixes, texts):
+        index.find_words(prefix)
+        index.find_meanings(text)
+    return (time.perf_counter() - start) / (2 * len(prefixes))
+
+
+def main():
+    count = int(sys.argv[1]) if len(sys.argv) > 1 else 1_000_000
+    queries = int(sys.argv[2]) if len(sys.argv) > 2 else 1000
+    rng = random.Random(42)
+
+    words = build_deck(count, rng)
+    picks = [words[rng.randrange(len(words))] for _ in range(queries)]
+    prefixes = [word[:2] for word, _ in picks]
+    texts = [rng.choice(meaning.split())[:5] for _, meaning in picks]
+
+    start = time.perf_counter()
+    index = CardSearchIndex()
+    index.reset(words)
+    print(f"build           {count:>9} cards  {time.perf_counter() - start:12.1f} s")
+
+    scan_queries = max(1, queries // 100)
+    seconds = bench_scan(words, prefixes[:scan_queries], texts[:scan_queries])
+    print(f"linear scan     {count:>9} cards  {seconds * 1e6:12.1f} us/query")
+    seconds = bench_index(index, prefixes, texts)
+    print(f"index           {count:>9} cards  {seconds * 1e6:12.1f} us/query")
+
+    start = time.perf_counter()
+    for _ in range(count // 10):
+        index.remove(words.row_id(len(words) - 1))
+        words.pop()
+    seconds = (time.perf_counter() - start) / (count // 10)
+    print(f"retire          {count:>9} cards  {seconds * 1e6:12.1f} us/card")
+    seconds = bench_index(index, prefixes, texts)
+    print(f"index, retired  {count:>9} cards  {seconds * 1e6:12.1f} us/query")
+
+
+if __name__ == "__main__":
+    main()
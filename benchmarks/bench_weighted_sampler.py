@@ -0,0 +1,52 @@
+"""
+Weighted draw + reweight: random.choices over a weight list vs. the Fenwick tree.
+
+Every iteration draws one card and doubles its weight, as a miss does, so
+random.choices has to rebuild its cumulative weights on each draw.
+
+Run with:  python -m benchmarks.bench_weighted_sampler [cards] [draws]
+"""
+
+import random
+import sys
+import time
+
+from lexicards.core.fenwick_tree import FenwickTree
+from lexicards.manager.card_sampler import DEFAULT_WEIGHT, MAX_WEIGHT
+
+
+def bench_choices(count: int, draws: int) -> float:
+    """Return seconds per draw + update with random.choices."""
+    rows = range(count)
+    weights = [DEFAULT_WEIGHT] * count
+    start = time.perf_counter()
+    for _ in range(draws):
+        row = random.choices(rows, weights)[0]
+        weights[row] = min(MAX_WEIGHT, weights[row] * 2)
+    return (time.perf_counter() - start) / draws
+
+
+def bench_fenwick(count: int, draws: int) -> float:
+    """Return seconds per draw + update with a FenwickTree."""
+    tree = FenwickTree([DEFAULT_WEIGHT] * count)
+    start = time.perf_counter()
+    for _ in range(draws):
+        row = tree.find(random.randrange(tree.total))
+        tree.set(row, min(MAX_WEIGHT, tree[row] * 2))
+    return (time.perf_counter() - start) / draws
+
+
+def main():
+    count = int(sys.argv[1]) if len(sys.argv) > 1 else 1_000_000
+    draws = int(sys.argv[2]) if len(sys.argv) > 2 else 20
+
+    for label, bench, runs in (
+        ("random.choices", bench_choices, draws),
+        ("FenwickTree", bench_fenwick, draws * 5000),
+    ):
+        seconds = bench(count, runs)
+        print(f"{label:<15} {count:>9} cards  {seconds * 1e6:12.1f} us/draw")
+
+
+if __name__ == "__main__":
+    main()
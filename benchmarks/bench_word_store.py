@@ -0,0 +1,44 @@
+"""
+Memory benchmark: List[List[str]] deck vs. the compact WordStore.
+
+Run with:  python -m benchmarks.bench_word_store [rows]
+"""
+
+import sys
+import time
+import tracemalloc
+
+from lexicards.manager.word_store import WordStore
+
+
+def make_rows(count: int):
+    """Yield a header row followed by synthetic word entries."""
+    yield ["Japanese", "English"]
+    for i in range(count):
+        yield [f"単語{i}", f"meaning number {i}"]
+
+
+def measure(label: str, build) -> None:
+    """Build a deck and report its retained memory and build time."""
+    tracemalloc.start()
+    start = time.perf_counter()
+    deck = build()
+    elapsed = time.perf_counter() - start
+    current, _ = tracemalloc.get_traced_memory()
+    tracemalloc.stop()
+
+    print(
+        f"{label:<16} {len(deck):>9} rows  {current / 2**20:8.1f} MiB"
+        f"  {current / len(deck):6.1f} B/row  {elapsed:6.2f} s"
+    )
+
+
+def main():
+    count = int(sys.argv[1]) if len(sys.argv) > 1 else 1_000_000
+
+    measure("List[List[str]]", lambda: list(make_rows(count)))
+    measure("WordStore", lambda: WordStore.from_rows(make_rows(count)))
+
+
+if __name__ == "__main__":
+    main()
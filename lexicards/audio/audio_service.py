@@ -11,6 +11,7 @@ class AudioService(IAudioService):
 
     Attributes:
         lock: Threading lock to ensure the TTS engine is used safely in multithreaded environment.
+        voices (dict): Voice id found for each language code, None if there is none.
     """
 
     def __init__(self):
@@ -18,6 +19,7 @@ class AudioService(IAudioService):
         Initialize the TTS engine, detect available voices, and store them in a dictionary.
         """
         self.lock = threading.Lock()
+        self.voices = {}
 
     # --------------------------
     # Real-time Speech
@@ -34,11 +36,11 @@ class AudioService(IAudioService):
             pyttsx3 engines cannot be safely reused,
             so a new engine is created per call to ensure speech always works.
         """
-        lang = lang.strip().lower().lstrip("\ufeff")[0:2]
+        lang = self._language_code(lang)
 
         with self.lock:
             engine = pyttsx3.init()
-            voice_id = self._select_voice(engine, lang)
+            voice_id = self._voice_for(engine, lang)
             if not voice_id:
                 return
 
@@ -50,9 +52,38 @@ class AudioService(IAudioService):
         """Run speak in a background thread."""
         threading.Thread(target=self.speak, args=(text, lang), daemon=True).start()
 
+    def warm(self, lang: str):
+        """
+        Look up and cache the voice for a language ahead of the first speak.
+
+        Voice enumeration is the slow part of speak; once cached, speak only
+        creates the engine.
+
+        Args:
+            lang (str): Language code ('en', 'ja', 'fr').
+        """
+        lang = self._language_code(lang)
+        if lang in self.voices:
+            return
+
+        with self.lock:
+            if lang not in self.voices:
+                self._voice_for(pyttsx3.init(), lang)
+
     # --------------------------
     # Voice Detection
     # --------------------------
+    @staticmethod
+    def _language_code(lang: str) -> str:
+        """Reduce a language label such as 'Japanese' to its two-letter code."""
+        return lang.strip().lower().lstrip("\ufeff")[0:2]
+
+    def _voice_for(self, engine, lang: str) -> str | None:
+        """Return the cached voice for a language, detecting it on first use."""
+        if lang not in self.voices:
+            self.voices[lang] = self._select_voice(engine, lang)
+        return self.voices[lang]
+
     @staticmethod
     def _select_voice(engine, lang: str) -> str | None:
         """
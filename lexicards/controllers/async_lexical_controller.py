@@ -0,0 +1,86 @@
+from concurrent.futures import Future
+
+from lexicards.controllers.lexical_controller import LexicalController
+from lexicards.core.loop_bridge import TkLoopBridge
+from lexicards.interfaces.audio.i_audio_servcie import IAudioService
+from lexicards.interfaces.manager.i_async_manager import IAsyncWordManager
+from lexicards.interfaces.ui.manager.i_ui_manager import IUiManager
+
+
+class AsyncLexicalController(LexicalController):
+    """
+    Controller driving an IAsyncWordManager through a Tk loop bridge.
+
+    Button handlers return immediately: the manager's coroutines run on the
+    bridge's event loop and UI updates happen back on the Tk thread when they
+    finish, so slow storage never freezes the window.
+
+    Attributes:
+        bridge (TkLoopBridge): Bridge running the manager's coroutines.
+    """
+
+    def __init__(
+        self,
+        ui: IUiManager,
+        manager: IAsyncWordManager,
+        audio: IAudioService,
+        bridge: TkLoopBridge,
+    ):
+        """
+        Initialize the AsyncLexicalController.
+
+        Args:
+            ui (IUiManager): UI manager instance for interface interactions.
+            manager (IAsyncWordManager): Async word manager, already loaded.
+            audio (IAudioService): Audio service instance for text-to-speech functionality.
+            bridge (TkLoopBridge): Bridge to the event loop owning the manager.
+        """
+        self.bridge = bridge
+        super().__init__(ui, manager, audio)
+
+    # ----------------------------------------------------------------------
+    # Public Button Handlers
+    # ----------------------------------------------------------------------
+
+    def handle_known_word(self) -> Future:
+        """
+        Handle the 'Known' button click.
+        Mark the current word as known and update storage in the background.
+
+        Returns:
+            Future: Completes once the word has been stored.
+        """
+        return self.bridge.submit(self.manager.mark_as_known())
+
+    def handle_unknown_word(self) -> Future:
+        """
+        Handle the 'Unknown' button click.
+        Mark the current word as unknown and update storage in the background.
+
+        Returns:
+            Future: Completes once the word has been stored.
+        """
+        return self.bridge.submit(self.manager.mark_as_unknown())
+
+    def handle_next_word(self) -> Future:
+        """
+        Display the next random word once the manager has picked it.
+
+        Returns:
+            Future: Completes with the picked (word, meaning).
+        """
+        return self.bridge.submit(
+            self.manager.get_random_word(),
+            on_result=lambda entry: self._show_word(*entry),
+            on_error=self._handle_error,
+        )
+
+    # ----------------------------------------------------------------------
+    # Private Utility Methods
+    # ----------------------------------------------------------------------
+
+    def _handle_error(self, error: BaseException) -> None:
+        """Show the empty-deck message, re-raising any other error."""
+        if not isinstance(error, ValueError):
+            raise error
+        self.ui.update_word_display("No data loaded.")
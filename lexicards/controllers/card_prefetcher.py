@@ -0,0 +1,125 @@
+import queue
+import threading
+import unicodedata
+from typing import NamedTuple
+
+from lexicards.interfaces.audio.i_audio_servcie import IAudioService
+from lexicards.interfaces.manager.i_manager import IWordManager
+
+
+class PreparedCard(NamedTuple):
+    """A card drawn ahead of time, ready to display."""
+
+    row_id: int | None
+    word: str
+    meaning: str
+    display_word: str
+    display_meaning: str
+
+
+def normalize_text(text: str) -> str:
+    """Strip a stray BOM and surrounding whitespace and NFC-normalize text."""
+    return unicodedata.normalize("NFC", text.lstrip("\ufeff").strip())
+
+
+class CardPrefetcher:
+    """
+    Background pipeline keeping the next cards ready for display.
+
+    A worker thread draws cards from the manager, normalizes their text and
+    warms the TTS voice, and keeps up to depth prepared cards in a bounded
+    queue, so showing the next card is a queue pop. When the queue is empty
+    the card is prepared inline and counted as a miss. Cards retired after
+    they were drawn (e.g. by a hot reload) are skipped.
+
+    Attributes:
+        manager (IWordManager): Manager the cards are drawn from.
+        audio (IAudioService): Audio service whose voice is warmed.
+        depth (int): Number of cards kept ready.
+        hits (int): Cards served straight from the queue.
+        misses (int): Cards prepared inline because the queue was empty.
+    """
+
+    def __init__(self, manager: IWordManager, audio: IAudioService, depth: int = 3):
+        """
+        Initialize the prefetcher; call start() to run the worker.
+
+        Args:
+            manager (IWordManager): Manager the cards are drawn from.
+            audio (IAudioService): Audio service whose voice is warmed.
+            depth (int): Number of cards kept ready.
+        """
+        self.manager = manager
+        self.audio = audio
+        self.depth = max(1, depth)
+        self.hits = 0
+        self.misses = 0
+
+        self._ready = queue.Queue(maxsize=self.depth)
+        self._wake = threading.Event()
+        self._stopped = threading.Event()
+        self._thread = threading.Thread(
+            target=self._run, name="CardPrefetcher", daemon=True
+        )
+
+    def start(self) -> "CardPrefetcher":
+        """Start the worker thread."""
+        self._thread.start()
+        return self
+
+    def stop(self) -> None:
+        """Stop the worker thread."""
+        self._stopped.set()
+        self._wake.set()
+        try:
+            self._ready.get_nowait()
+        except queue.Empty:
+            pass
+
+    def next_card(self) -> PreparedCard:
+        """
+        Pop the next prepared card and make it the manager's current word.
+
+        Returns:
+            PreparedCard: The card to display.
+
+        Raises:
+            ValueError: If no words are left to learn.
+        """
+        while True:
+            try:
+                card = self._ready.get_nowait()
+                self.hits += 1
+            except queue.Empty:
+                card = self._prepare()
+                self.misses += 1
+            finally:
+                self._wake.set()
+
+            if self.manager.show_card(card.row_id, card.word, card.meaning):
+                return card
+
+    # ==========================================================
+    # Private Utilities
+    # ==========================================================
+
+    def _prepare(self) -> PreparedCard:
+        """Draw a card, normalize its text and warm the voice."""
+        row_id, word, meaning = self.manager.draw_card()
+        self.audio.warm(self.manager.foreign_language)
+        return PreparedCard(
+            row_id, word, meaning, normalize_text(word), normalize_text(meaning)
+        )
+
+    def _run(self) -> None:
+        """Keep the queue full; sleep while it is full or the deck is empty."""
+        while not self._stopped.is_set():
+            try:
+                card = self._prepare()
+            except ValueError:
+                self._wake.clear()
+                self._wake.wait()
+                continue
+
+            # Blocks while the queue is full; stop() frees a slot to end it
+            self._ready.put(card)
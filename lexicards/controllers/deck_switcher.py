@@ -0,0 +1,91 @@
+from typing import Callable, Dict, List
+
+from lexicards.controllers.card_prefetcher import CardPrefetcher
+from lexicards.controllers.lexical_controller import LexicalController
+from lexicards.data.data_paths import resolve_data_path
+from lexicards.interfaces.manager.i_manager import IWordManager
+
+
+class DeckSwitcher:
+    """
+    Switches a controller between decks, with one word manager per deck.
+
+    A deck's manager is opened on first use and kept, so going back to a
+    deck carries on where it was left. When open_deck builds managers on a
+    DeckRegistry, the deck's cards are already loaded in the background and
+    switching needs no I/O.
+
+    Attributes:
+        controller (LexicalController): Controller showing the cards.
+        decks (Callable[[], List[str]]): Returns the decks next_deck() cycles through.
+        open_deck (Callable[[str], IWordManager]): Creates the manager of a deck.
+        prefetch (Callable[[IWordManager], CardPrefetcher] | None): Creates a
+            started prefetcher for a manager, or None.
+        current (str): Absolute path of the deck being shown.
+    """
+
+    def __init__(
+        self,
+        controller: LexicalController,
+        current: str,
+        decks: Callable[[], List[str]],
+        open_deck: Callable[[str], IWordManager],
+        prefetch: Callable[[IWordManager], CardPrefetcher] | None = None,
+    ):
+        """
+        Initialize the switcher on the deck the controller is showing.
+
+        Args:
+            controller (LexicalController): Controller showing the cards.
+            current (str): Deck file name or path of the controller's manager.
+            decks (Callable[[], List[str]]): Returns the deck paths to cycle through.
+            open_deck (Callable[[str], IWordManager]): Creates the manager of
+                a deck, given its absolute path.
+            prefetch (Callable[[IWordManager], CardPrefetcher] | None): Creates
+                a started prefetcher for a manager on every switch, or None.
+        """
+        self.controller = controller
+        self.decks = decks
+        self.open_deck = open_deck
+        self.prefetch = prefetch
+        self.current = resolve_data_path(current)
+        self._managers: Dict[str, IWordManager] = {self.current: controller.manager}
+
+    def switch_to(self, deck: str) -> IWordManager:
+        """
+        Show cards from another deck.
+
+        Args:
+            deck (str): Deck file name or path.
+
+        Returns:
+            IWordManager: Manager of the deck now shown.
+
+        Raises:
+            DataFileNotFoundError: If the deck file does not exist.
+            DataCorruptionError: If the deck cannot be read or is corrupted.
+        """
+        path = resolve_data_path(deck)
+        if path == self.current:
+            return self.controller.manager
+
+        manager = self._managers.get(path)
+        if manager is None:
+            manager = self._managers[path] = self.open_deck(path)
+        prefetcher = self.prefetch(manager) if self.prefetch is not None else None
+        self.controller.switch_manager(manager, prefetcher)
+        self.current = path
+        return manager
+
+    def next_deck(self) -> IWordManager:
+        """
+        Show cards from the deck after the current one, wrapping around.
+
+        Returns:
+            IWordManager: Manager of the deck now shown.
+        """
+        decks = self.decks()
+        if not decks:
+            return self.controller.manager
+        position = decks.index(self.current) + 1 if self.current in decks else 0
+        return self.switch_to(decks[position % len(decks)])
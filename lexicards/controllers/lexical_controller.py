@@ -1,3 +1,4 @@
+from lexicards.controllers.card_prefetcher import CardPrefetcher
 from lexicards.interfaces.audio.i_audio_servcie import IAudioService
 from lexicards.interfaces.controller.i_controller import IController
 from lexicards.interfaces.manager.i_manager import IWordManager
@@ -14,9 +15,19 @@ class LexicalController(IController):
         audio (IAudioService): The audio service instance for text-to-speech.
         current_word (str | None): The currently displayed word.
         current_meaning (str | None): The meaning of the current word.
+        prefetcher (CardPrefetcher | None): Pipeline keeping the next cards
+            ready, or None to draw each card on click.
+        reveal_delay_ms (int): Delay before the meaning is shown.
     """
 
-    def __init__(self, ui: IUiManager, manager: IWordManager, audio: IAudioService):
+    def __init__(
+        self,
+        ui: IUiManager,
+        manager: IWordManager,
+        audio: IAudioService,
+        prefetcher: CardPrefetcher | None = None,
+        reveal_delay_ms: int = 3000,
+    ):
         """
         Initialize the LexicalController with UI, word manager, and audio service.
 
@@ -24,10 +35,15 @@ class LexicalController(IController):
             ui (IUiManager): UI manager instance for interface interactions.
             manager (IWordManager): Word manager instance for managing vocabulary words.
             audio (IAudioService): Audio service instance for text-to-speech functionality.
+            prefetcher (CardPrefetcher | None): Started prefetcher drawing from
+                the same manager; "Next" then pops a prepared card.
+            reveal_delay_ms (int): Delay before the meaning is shown.
         """
         self.ui = ui
         self.manager = manager
         self.audio = audio
+        self.prefetcher = prefetcher
+        self.reveal_delay_ms = reveal_delay_ms
         self.current_word = None
         self.current_meaning = None
 
@@ -58,29 +74,64 @@ class LexicalController(IController):
         self.manager.mark_as_unknown()
 
     def handle_next_word(self) -> None:
-        """Display the next random word and show its meaning after three seconds."""
+        """Display the next random word and show its meaning after a delay."""
         try:
-            word, meaning = self.manager.get_random_word()
-            self.current_word = word
-            self.current_meaning = meaning
-
-            self.ui.update_canvas()
-            self.ui.update_title(self.manager.foreign_language)
-            self.ui.update_word_display(word)
-
-            self.ui.run_after(3000, self._display_meaning)
-
+            if self.prefetcher is None:
+                word, meaning = self.manager.get_random_word()
+            else:
+                card = self.prefetcher.next_card()
+                word, meaning = card.display_word, card.display_meaning
         except ValueError:
             self.ui.update_word_display("No data loaded.")
+            return
+
+        self._show_word(word, meaning)
 
     def handle_speak(self):
         """Generate text to speak."""
         self.audio.speak_async(self.current_word, self.manager.foreign_language)
 
+    def switch_manager(
+        self, manager: IWordManager, prefetcher: CardPrefetcher | None = None
+    ) -> None:
+        """
+        Show cards from another word manager, e.g. after switching decks.
+
+        The current prefetcher is stopped and the next card of the new
+        manager is shown straight away.
+
+        Args:
+            manager (IWordManager): Word manager to draw cards from.
+            prefetcher (CardPrefetcher | None): Started prefetcher drawing
+                from the new manager, or None.
+        """
+        if self.prefetcher is not None:
+            self.prefetcher.stop()
+        self.manager = manager
+        self.prefetcher = prefetcher
+        self.current_word = None
+        self.current_meaning = None
+
+        self.ui.initialize_ui(
+            self.manager.foreign_language, self.manager.native_language
+        )
+        self.handle_next_word()
+
     # ----------------------------------------------------------------------
     # Private Utility Methods
     # ----------------------------------------------------------------------
 
+    def _show_word(self, word: str, meaning: str) -> None:
+        """Display a new word and show its meaning after the reveal delay."""
+        self.current_word = word
+        self.current_meaning = meaning
+
+        self.ui.update_canvas()
+        self.ui.update_title(self.manager.foreign_language)
+        self.ui.update_word_display(word)
+
+        self.ui.run_after(self.reveal_delay_ms, self._display_meaning)
+
     def _display_meaning(self) -> None:
         """Display the meaning of the current word on the UI."""
         if self.current_word is None or self.current_meaning is None:
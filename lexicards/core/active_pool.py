@@ -0,0 +1,81 @@
+from array import array
+
+
+class ActivePool:
+    """
+    Set of active row ids with O(1) removal by position.
+
+    Rows are kept in a compact array('I'); removing a row moves the last
+    row into its slot (swap-with-last) instead of shifting the tail. A
+    parallel array('i') maps each row id to its current position (-1 once
+    removed), so a card keeps a stable row id however often positions move.
+    """
+
+    __slots__ = ("_rows", "_positions")
+
+    def __init__(self, size: int = 0):
+        """
+        Initialize a pool holding rows 0 .. size - 1.
+
+        Args:
+            size (int): Number of initially active rows.
+        """
+        self._rows = array("I", range(size))
+        self._positions = array("i", range(size))
+
+    def __len__(self) -> int:
+        return len(self._rows)
+
+    def row_at(self, index: int) -> int:
+        """Return the row id at a position."""
+        return self._rows[index]
+
+    def index_of(self, row: int) -> int | None:
+        """
+        Return the current position of a row.
+
+        Args:
+            row (int): Stable row id.
+
+        Returns:
+            int | None: Position of the row, or None if it is not active.
+        """
+        if 0 <= row < len(self._positions) and self._positions[row] >= 0:
+            return self._positions[row]
+        return None
+
+    def add(self, row: int) -> None:
+        """
+        Activate a row at the end of the pool.
+
+        Args:
+            row (int): Stable row id.
+        """
+        if row >= len(self._positions):
+            self._positions.extend([-1] * (row + 1 - len(self._positions)))
+        if self._positions[row] < 0:
+            self._positions[row] = len(self._rows)
+            self._rows.append(row)
+
+    def remove_at(self, index: int) -> int:
+        """
+        Remove the row at a position in O(1).
+
+        The last row takes over the freed position.
+
+        Args:
+            index (int): Position of the row to remove.
+
+        Returns:
+            int: The removed row id.
+        """
+        if index < 0:
+            index += len(self._rows)
+
+        row = self._rows[index]
+        last = self._rows.pop()
+        if last != row:
+            self._rows[index] = last
+            self._positions[last] = index
+        self._positions[row] = -1
+        return row
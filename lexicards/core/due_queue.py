@@ -0,0 +1,106 @@
+import heapq
+import itertools
+from typing import Dict, Hashable, Iterable, Tuple
+
+# Key slot of an entry whose key was rescheduled or removed
+_REMOVED = object()
+
+
+class DueQueue:
+    """
+    Priority queue of keys ordered by due time.
+
+    A binary heap of [due, sequence, key] entries with lazy deletion:
+    rescheduling or removing a key only marks its old entry as removed, so
+    schedule, remove and pop_due are O(log n) and never scan the heap.
+    Keys due at the same time come out in scheduling order.
+    """
+
+    __slots__ = ("_heap", "_entries", "_counter")
+
+    def __init__(self, items: Iterable[Tuple[Hashable, float]] = ()):
+        """
+        Initialize the queue, heapifying initial items in O(n).
+
+        Args:
+            items (Iterable[Tuple[Hashable, float]]): (key, due) pairs.
+        """
+        self._counter = itertools.count()
+        self._entries: Dict[Hashable, list] = {}
+        for key, due in items:
+            self._entries[key] = [due, next(self._counter), key]
+        self._heap = list(self._entries.values())
+        heapq.heapify(self._heap)
+
+    def __len__(self) -> int:
+        return len(self._entries)
+
+    def __contains__(self, key: Hashable) -> bool:
+        return key in self._entries
+
+    def due_of(self, key: Hashable) -> float | None:
+        """Return the due time of a key, or None if it is not queued."""
+        entry = self._entries.get(key)
+        return None if entry is None else entry[0]
+
+    def schedule(self, key: Hashable, due: float) -> None:
+        """
+        Queue a key, replacing its previous due time.
+
+        Args:
+            key (Hashable): Key to queue.
+            due (float): Time the key becomes due.
+        """
+        self.remove(key)
+        entry = [due, next(self._counter), key]
+        self._entries[key] = entry
+        heapq.heappush(self._heap, entry)
+        if len(self._heap) > 2 * len(self._entries) + 64:
+            self._compact()
+
+    def remove(self, key: Hashable) -> None:
+        """Drop a key from the queue; unknown keys are ignored."""
+        entry = self._entries.pop(key, None)
+        if entry is not None:
+            entry[2] = _REMOVED
+
+    def peek(self) -> Tuple[Hashable, float] | None:
+        """
+        Return the earliest (key, due) pair without removing it.
+
+        Returns:
+            Tuple[Hashable, float] | None: Earliest key and due time, or None
+            if the queue is empty.
+        """
+        heap = self._heap
+        while heap and heap[0][2] is _REMOVED:
+            heapq.heappop(heap)
+        if not heap:
+            return None
+        return heap[0][2], heap[0][0]
+
+    def pop_due(self, now: float) -> Hashable | None:
+        """
+        Remove and return the earliest key due at or before a time.
+
+        Args:
+            now (float): Current time.
+
+        Returns:
+            Hashable | None: Earliest due key, or None if nothing is due.
+        """
+        earliest = self.peek()
+        if earliest is None or earliest[1] > now:
+            return None
+        entry = heapq.heappop(self._heap)
+        del self._entries[entry[2]]
+        return entry[2]
+
+    def items(self) -> Iterable[Tuple[Hashable, float]]:
+        """Iterate over queued (key, due) pairs in no particular order."""
+        return ((key, entry[0]) for key, entry in self._entries.items())
+
+    def _compact(self) -> None:
+        """Drop removed entries and re-heapify in O(n)."""
+        self._heap = list(self._entries.values())
+        heapq.heapify(self._heap)
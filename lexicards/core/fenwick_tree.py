@@ -0,0 +1,114 @@
+from array import array
+from typing import Iterable
+
+
+class FenwickTree:
+    """
+    Binary indexed tree of non-negative integer weights.
+
+    Supports point updates, prefix sums and weighted search in O(log n),
+    and appending a slot in O(log n). Weights are integers (array('q')) so
+    repeated updates never accumulate rounding drift.
+    """
+
+    __slots__ = ("_tree", "_weights")
+
+    def __init__(self, weights: Iterable[int] = ()):
+        """
+        Build the tree from initial weights in O(n).
+
+        Args:
+            weights (Iterable[int]): Weight of each slot, in slot order.
+        """
+        self._weights = array("q", weights)
+        tree = array("q", [0])
+        tree.extend(self._weights)
+        size = len(self._weights)
+        for i in range(1, size + 1):
+            parent = i + (i & -i)
+            if parent <= size:
+                tree[parent] += tree[i]
+        self._tree = tree
+
+    def __len__(self) -> int:
+        return len(self._weights)
+
+    def __getitem__(self, index: int) -> int:
+        return self._weights[index]
+
+    @property
+    def total(self) -> int:
+        """Sum of all weights."""
+        return self.prefix_sum(len(self._weights))
+
+    def append(self, weight: int = 0) -> None:
+        """
+        Add a slot at the end.
+
+        Args:
+            weight (int): Weight of the new slot.
+        """
+        i = len(self._weights) + 1
+        # The new node covers slots (i - lowbit(i), i]
+        node = weight + self.prefix_sum(i - 1) - self.prefix_sum(i - (i & -i))
+        self._weights.append(weight)
+        self._tree.append(node)
+
+    def set(self, index: int, weight: int) -> None:
+        """
+        Change the weight of a slot.
+
+        Args:
+            index (int): Slot index.
+            weight (int): New non-negative weight.
+        """
+        delta = weight - self._weights[index]
+        if not delta:
+            return
+        self._weights[index] = weight
+        tree = self._tree
+        size = len(self._weights)
+        i = index + 1
+        while i <= size:
+            tree[i] += delta
+            i += i & -i
+
+    def prefix_sum(self, count: int) -> int:
+        """Return the sum of the weights of the first count slots."""
+        tree = self._tree
+        total = 0
+        while count > 0:
+            total += tree[count]
+            count -= count & -count
+        return total
+
+    def find(self, target: int) -> int:
+        """
+        Return the slot whose cumulative weight range contains a target.
+
+        Slot i covers [prefix_sum(i), prefix_sum(i + 1)), so a uniform
+        target in [0, total) picks slots in proportion to their weight.
+
+        Args:
+            target (int): Value in [0, total).
+
+        Returns:
+            int: Slot index.
+
+        Raises:
+            IndexError: If target is outside [0, total).
+        """
+        if not 0 <= target < self.total:
+            raise IndexError("target out of range")
+
+        tree = self._tree
+        size = len(self._weights)
+        position = 0
+        step = 1 << size.bit_length()
+        while step:
+            following = position + step
+            if following <= size and tree[following] <= target:
+                position = following
+                target -= tree[following]
+            step >>= 1
+        return position
@@ -0,0 +1,156 @@
+import struct
+from array import array
+from typing import Iterable, Iterator
+
+EMPTY = 0
+DELETED = 1
+KEY_LENGTH = struct.Struct("<I")
+MASK = (1 << 64) - 1
+
+
+class FingerprintSet:
+    """
+    Compact set of strings backed by 64-bit hash fingerprints.
+
+    Slots live in an open-addressing array('Q') of fingerprints with linear
+    probing, next to an array('I') pointing at each key's UTF-8 bytes in
+    one shared arena. A lookup only touches the arena when fingerprints
+    match, which makes membership exact even if two keys collide, at about a
+    third of the memory of a set of str objects.
+    """
+
+    __slots__ = ("_fingerprints", "_refs", "_arena", "_size", "_used")
+
+    def __init__(self, keys: Iterable[str] = ()):
+        """
+        Initialize the set.
+
+        Args:
+            keys (Iterable[str]): Initial members.
+        """
+        self._fingerprints = array("Q", bytes(8 * 8))
+        self._refs = array("I", bytes(4 * 8))
+        self._arena = bytearray()
+        self._size = 0
+        self._used = 0  # Live and deleted slots
+        for key in keys:
+            self.add(key)
+
+    def __len__(self) -> int:
+        return self._size
+
+    def __contains__(self, key: str) -> bool:
+        return self._find(key, self._fingerprint(key)) >= 0
+
+    def __iter__(self) -> Iterator[str]:
+        for slot, fingerprint in enumerate(self._fingerprints):
+            if fingerprint > DELETED:
+                yield self._key_at(self._refs[slot]).decode("utf-8")
+
+    def add(self, key: str) -> None:
+        """
+        Add a key to the set.
+
+        Args:
+            key (str): Key to add.
+        """
+        fingerprint = self._fingerprint(key)
+        if self._find(key, fingerprint) >= 0:
+            return
+
+        if (self._used + 1) * 3 > len(self._fingerprints) * 2:
+            self._resize()
+
+        slot = self._free_slot(fingerprint)
+        if self._fingerprints[slot] == EMPTY:
+            self._used += 1
+        self._fingerprints[slot] = fingerprint
+        self._refs[slot] = self._store(key.encode("utf-8"))
+        self._size += 1
+
+    def discard(self, key: str) -> None:
+        """
+        Remove a key if it is present.
+
+        The key's bytes stay in the arena until the next resize.
+
+        Args:
+            key (str): Key to remove.
+        """
+        slot = self._find(key, self._fingerprint(key))
+        if slot >= 0:
+            self._fingerprints[slot] = DELETED
+            self._size -= 1
+
+    # ==========================================================
+    # Private Utilities
+    # ==========================================================
+
+    @staticmethod
+    def _fingerprint(key: str) -> int:
+        """Return the 64-bit fingerprint of a key, never EMPTY or DELETED."""
+        fingerprint = hash(key) & MASK
+        return fingerprint if fingerprint > DELETED else fingerprint + 2
+
+    def _find(self, key: str, fingerprint: int) -> int:
+        """Return the slot holding a key, or -1 if it is absent."""
+        fingerprints = self._fingerprints
+        mask = len(fingerprints) - 1
+        slot = fingerprint & mask
+        encoded = None
+
+        while True:
+            current = fingerprints[slot]
+            if current == EMPTY:
+                return -1
+            if current == fingerprint:
+                # Exact fallback: fingerprints can collide, keys cannot
+                if encoded is None:
+                    encoded = key.encode("utf-8")
+                if self._key_at(self._refs[slot]) == encoded:
+                    return slot
+            slot = (slot + 1) & mask
+
+    def _free_slot(self, fingerprint: int) -> int:
+        """Return the first empty or deleted slot on a fingerprint's probe path."""
+        fingerprints = self._fingerprints
+        mask = len(fingerprints) - 1
+        slot = fingerprint & mask
+        while fingerprints[slot] > DELETED:
+            slot = (slot + 1) & mask
+        return slot
+
+    def _store(self, encoded: bytes | bytearray) -> int:
+        """Append a length-prefixed key to the arena and return its offset."""
+        offset = len(self._arena)
+        self._arena += KEY_LENGTH.pack(len(encoded))
+        self._arena += encoded
+        return offset
+
+    def _key_at(self, offset: int) -> bytearray:
+        """Return the encoded key stored at an arena offset."""
+        (length,) = KEY_LENGTH.unpack_from(self._arena, offset)
+        start = offset + KEY_LENGTH.size
+        return self._arena[start : start + length]
+
+    def _resize(self) -> None:
+        """Rebuild the table at twice the live size, dropping deleted keys."""
+        live = [
+            (fingerprint, self._key_at(self._refs[slot]))
+            for slot, fingerprint in enumerate(self._fingerprints)
+            if fingerprint > DELETED
+        ]
+
+        capacity = 8
+        while capacity < (len(live) + 1) * 2:
+            capacity *= 2
+
+        self._fingerprints = array("Q", bytes(8 * capacity))
+        self._refs = array("I", bytes(4 * capacity))
+        self._arena = bytearray()
+        self._used = len(live)
+
+        for fingerprint, encoded in live:
+            slot = self._free_slot(fingerprint)
+            self._fingerprints[slot] = fingerprint
+            self._refs[slot] = self._store(encoded)
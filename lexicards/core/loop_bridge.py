@@ -0,0 +1,126 @@
+import asyncio
+import queue
+import threading
+from concurrent.futures import Future
+from typing import Any, Callable, Coroutine
+
+
+class TkLoopBridge:
+    """
+    Bridge between the Tk event thread and an asyncio event loop.
+
+    The asyncio loop runs in a daemon thread. Coroutines are submitted from
+    the Tk thread, and their results are handed back to callbacks on the Tk
+    thread by polling through a scheduler such as Tk's after(), so Tk
+    widgets are only ever touched from the thread that owns them.
+
+    Attributes:
+        loop (asyncio.AbstractEventLoop): Event loop running the coroutines.
+        poll_ms (int): Delay between polls for finished coroutines.
+    """
+
+    def __init__(
+        self, schedule: Callable[[int, Callable[[], None]], Any], poll_ms: int = 15
+    ):
+        """
+        Start the event loop thread.
+
+        Args:
+            schedule (Callable[[int, Callable[[], None]], Any]): Schedules a
+                callback on the Tk thread after a delay in milliseconds,
+                e.g. root.after or IUiManager.run_after.
+            poll_ms (int): Delay between polls for finished coroutines.
+        """
+        self._schedule = schedule
+        self.poll_ms = poll_ms
+
+        self.loop = asyncio.new_event_loop()
+        self._done = queue.SimpleQueue()
+        self._in_flight = 0
+        self._polling = False
+
+        self._thread = threading.Thread(
+            target=self.loop.run_forever, name="lexicards-asyncio", daemon=True
+        )
+        self._thread.start()
+
+    def run(self, coroutine: Coroutine) -> Any:
+        """
+        Run a coroutine on the loop and block until it finishes.
+
+        Meant for start-up work before the Tk main loop is running.
+
+        Args:
+            coroutine (Coroutine): Coroutine to run.
+
+        Returns:
+            The coroutine's result.
+        """
+        return asyncio.run_coroutine_threadsafe(coroutine, self.loop).result()
+
+    def submit(
+        self,
+        coroutine: Coroutine,
+        on_result: Callable[[Any], None] | None = None,
+        on_error: Callable[[BaseException], None] | None = None,
+    ) -> Future:
+        """
+        Schedule a coroutine without blocking the Tk thread.
+
+        Args:
+            coroutine (Coroutine): Coroutine to run on the loop.
+            on_result (Callable[[Any], None] | None): Called on the Tk thread
+                with the result.
+            on_error (Callable[[BaseException], None] | None): Called on the
+                Tk thread with the exception if the coroutine fails. Without
+                it, the exception is raised on the Tk thread.
+
+        Returns:
+            Future: Future of the coroutine's result.
+        """
+        future = asyncio.run_coroutine_threadsafe(coroutine, self.loop)
+        self._in_flight += 1
+        future.add_done_callback(
+            lambda done: self._done.put((done, on_result, on_error))
+        )
+        if not self._polling:
+            self._polling = True
+            self._schedule(self.poll_ms, self._poll)
+        return future
+
+    def close(self) -> None:
+        """Stop the event loop and wait for its thread to exit."""
+        self.loop.call_soon_threadsafe(self.loop.stop)
+        self._thread.join()
+        self.loop.close()
+
+    # ==========================================================
+    # Private Utilities
+    # ==========================================================
+
+    def _poll(self) -> None:
+        """Deliver finished coroutines to their callbacks on the Tk thread."""
+        finished = []
+        while True:
+            try:
+                finished.append(self._done.get_nowait())
+            except queue.Empty:
+                break
+
+        # Only keep polling while work is outstanding
+        self._in_flight -= len(finished)
+        if self._in_flight:
+            self._schedule(self.poll_ms, self._poll)
+        else:
+            self._polling = False
+
+        for future, on_result, on_error in finished:
+            error = future.exception()
+            if error is None:
+                if on_result is not None:
+                    on_result(future.result())
+            elif on_error is not None:
+                on_error(error)
+            else:
+                # Surface it through Tk's callback error reporting
+                raise error
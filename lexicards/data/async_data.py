@@ -0,0 +1,302 @@
+import asyncio
+import functools
+from abc import ABC, abstractmethod
+from concurrent.futures import Executor
+from typing import AsyncIterator, List
+
+from lexicards.data.data_remover import DataRemoverFactory
+from lexicards.data.data_retriever import DataRetrieverFactory
+from lexicards.data.data_saver import DataSaverFactory
+from lexicards.interfaces.data.i_async_data_remove import IAsyncDataRemover
+from lexicards.interfaces.data.i_async_data_retriever import IAsyncDataRetriever
+from lexicards.interfaces.data.i_async_data_saver import IAsyncDataSaver
+from lexicards.interfaces.data.i_data_remove import IDataRemover
+from lexicards.interfaces.data.i_data_retriever import IDataRetriever
+from lexicards.interfaces.data.i_data_saver import IDataSaver
+
+
+async def run_blocking(executor: Executor | None, func, *args):
+    """
+    Run a blocking call in an executor and await its result.
+
+    Args:
+        executor (Executor | None): Executor to run the call in, or None for
+            the event loop's default executor.
+        func: Blocking callable.
+        *args: Positional arguments for the callable.
+
+    Returns:
+        The callable's return value.
+    """
+    loop = asyncio.get_running_loop()
+    return await loop.run_in_executor(executor, functools.partial(func, *args))
+
+
+# --------------------------
+# Concrete Async Adapters
+# --------------------------
+class ExecutorDataRetriever(IAsyncDataRetriever):
+    """
+    Asyncio adapter running any blocking IDataRetriever in an executor.
+
+    Works with every backend (CSV, compiled decks, SQLite), so the event loop
+    never waits on disk I/O.
+
+    Attributes:
+        retriever (IDataRetriever): Wrapped blocking retriever.
+        executor (Executor | None): Executor running the blocking calls.
+    """
+
+    def __init__(self, retriever: IDataRetriever, executor: Executor | None = None):
+        """
+        Initialize the adapter.
+
+        Args:
+            retriever (IDataRetriever): Blocking retriever to wrap.
+            executor (Executor | None): Executor for the blocking calls,
+                defaults to the event loop's default executor.
+        """
+        self.retriever = retriever
+        self.executor = executor
+
+    async def load_data(self) -> List[List[str]]:
+        """Load the whole deck in the executor."""
+        return await run_blocking(self.executor, self.retriever.load_data)
+
+    async def iter_rows(self, batch_size: int = 1000) -> AsyncIterator[List[List[str]]]:
+        """
+        Stream the deck in batches, reading each batch in the executor.
+
+        Args:
+            batch_size (int): Maximum number of rows per batch.
+
+        Yields:
+            List[List[str]]: Next batch of word entries, header row first.
+        """
+        batches = self.retriever.iter_rows(batch_size)
+        while True:
+            batch = await run_blocking(self.executor, next, batches, None)
+            if batch is None:
+                return
+            yield batch
+
+
+class ExecutorDataSaver(IAsyncDataSaver):
+    """
+    Asyncio adapter running any blocking IDataSaver in an executor.
+
+    Attributes:
+        saver (IDataSaver): Wrapped blocking saver.
+        executor (Executor | None): Executor running the blocking calls.
+    """
+
+    def __init__(self, saver: IDataSaver, executor: Executor | None = None):
+        """
+        Initialize the adapter.
+
+        Args:
+            saver (IDataSaver): Blocking saver to wrap.
+            executor (Executor | None): Executor for the blocking calls,
+                defaults to the event loop's default executor.
+        """
+        self.saver = saver
+        self.executor = executor
+
+    async def save_data(self, word: str, meaning: str) -> None:
+        """Save a word and its meaning in the executor."""
+        await run_blocking(self.executor, self.saver.save_data, word, meaning)
+
+    async def flush(self) -> None:
+        """Flush the wrapped saver in the executor."""
+        await run_blocking(self.executor, self.saver.flush)
+
+    async def close(self) -> None:
+        """Close the wrapped saver in the executor."""
+        await run_blocking(self.executor, self.saver.close)
+
+
+class ExecutorDataRemover(IAsyncDataRemover):
+    """
+    Asyncio adapter running any blocking IDataRemover in an executor.
+
+    Attributes:
+        remover (IDataRemover): Wrapped blocking remover.
+        executor (Executor | None): Executor running the blocking calls.
+    """
+
+    def __init__(self, remover: IDataRemover, executor: Executor | None = None):
+        """
+        Initialize the adapter.
+
+        Args:
+            remover (IDataRemover): Blocking remover to wrap.
+            executor (Executor | None): Executor for the blocking calls,
+                defaults to the event loop's default executor.
+        """
+        self.remover = remover
+        self.executor = executor
+
+    async def remove_word(self, word: str) -> None:
+        """Remove a word from storage in the executor."""
+        await run_blocking(self.executor, self.remover.remove_word, word)
+
+    async def mark_for_removal(self, word: str) -> None:
+        """Mark a word for removal in the executor."""
+        await run_blocking(self.executor, self.remover.mark_for_removal, word)
+
+    async def flush(self) -> None:
+        """Apply all marked removals in the executor."""
+        await run_blocking(self.executor, self.remover.flush)
+
+
+# --------------------------
+# Factory Interfaces
+# --------------------------
+class AsyncDataRetrieverFactory(ABC):
+    """
+    Abstract Factory interface for creating IAsyncDataRetriever instances.
+    """
+
+    @abstractmethod
+    def create_data_retriever(self, filename: str) -> IAsyncDataRetriever:
+        """
+        Create and return an IAsyncDataRetriever instance.
+
+        Args:
+            filename (str): Path to retrieve Data.
+
+        Returns:
+            IAsyncDataRetriever: Concrete implementation of async data retriever.
+        """
+        pass
+
+
+class AsyncDataSaverFactory(ABC):
+    """
+    Abstract Factory interface for creating IAsyncDataSaver instances.
+    """
+
+    @abstractmethod
+    def create_data_saver(self, filename: str) -> IAsyncDataSaver:
+        """
+        Create and return an IAsyncDataSaver instance.
+
+        Args:
+            filename (str): Path to save Data.
+
+        Returns:
+            IAsyncDataSaver: Concrete implementation of async data saver.
+        """
+        pass
+
+
+class AsyncDataRemoverFactory(ABC):
+    """
+    Abstract Factory interface for creating IAsyncDataRemover instances.
+    """
+
+    @abstractmethod
+    def create_data_remover(self, filename: str) -> IAsyncDataRemover:
+        """
+        Create and return an IAsyncDataRemover instance.
+
+        Args:
+            filename (str): Path to remove Data from.
+
+        Returns:
+            IAsyncDataRemover: Concrete implementation of async data remover.
+        """
+        pass
+
+
+# --------------------------
+# Concrete Factories
+# --------------------------
+class ExecutorDataRetrieverFactory(AsyncDataRetrieverFactory):
+    """
+    Factory wrapping the retrievers of a blocking factory in executor adapters.
+    """
+
+    def __init__(self, factory: DataRetrieverFactory, executor: Executor | None = None):
+        """
+        Initialize the factory.
+
+        Args:
+            factory (DataRetrieverFactory): Blocking factory to wrap.
+            executor (Executor | None): Executor for the blocking calls.
+        """
+        self.factory = factory
+        self.executor = executor
+
+    def create_data_retriever(self, filename: str) -> IAsyncDataRetriever:
+        """
+        Create an ExecutorDataRetriever around a blocking retriever.
+
+        Args:
+            filename (str): Path to retrieve Data.
+
+        Returns:
+            ExecutorDataRetriever: New async adapter.
+        """
+        retriever = self.factory.create_data_retriever(filename)
+        return ExecutorDataRetriever(retriever, self.executor)
+
+
+class ExecutorDataSaverFactory(AsyncDataSaverFactory):
+    """
+    Factory wrapping the savers of a blocking factory in executor adapters.
+    """
+
+    def __init__(self, factory: DataSaverFactory, executor: Executor | None = None):
+        """
+        Initialize the factory.
+
+        Args:
+            factory (DataSaverFactory): Blocking factory to wrap.
+            executor (Executor | None): Executor for the blocking calls.
+        """
+        self.factory = factory
+        self.executor = executor
+
+    def create_data_saver(self, filename: str) -> IAsyncDataSaver:
+        """
+        Create an ExecutorDataSaver around a blocking saver.
+
+        Args:
+            filename (str): Path to save Data.
+
+        Returns:
+            ExecutorDataSaver: New async adapter.
+        """
+        saver = self.factory.create_data_saver(filename)
+        return ExecutorDataSaver(saver, self.executor)
+
+
+class ExecutorDataRemoverFactory(AsyncDataRemoverFactory):
+    """
+    Factory wrapping the removers of a blocking factory in executor adapters.
+    """
+
+    def __init__(self, factory: DataRemoverFactory, executor: Executor | None = None):
+        """
+        Initialize the factory.
+
+        Args:
+            factory (DataRemoverFactory): Blocking factory to wrap.
+            executor (Executor | None): Executor for the blocking calls.
+        """
+        self.factory = factory
+        self.executor = executor
+
+    def create_data_remover(self, filename: str) -> IAsyncDataRemover:
+        """
+        Create an ExecutorDataRemover around a blocking remover.
+
+        Args:
+            filename (str): Path to remove Data from.
+
+        Returns:
+            ExecutorDataRemover: New async adapter.
+        """
+        remover = self.factory.create_data_remover(filename)
+        return ExecutorDataRemover(remover, self.executor)
@@ -0,0 +1,413 @@
+import csv
+import mmap
+import os
+import struct
+import sys
+from array import array
+from typing import Iterator, List, Set, Tuple
+
+from lexicards.core.active_pool import ActivePool
+from lexicards.data.compressed_files import open_text, strip_codec_suffix
+from lexicards.data.data_paths import (
+    get_data_dir,
+    list_deck_files,
+    resolve_data_path,
+)
+from lexicards.data.data_retriever import DataRetrieverFactory
+from lexicards.data.tombstone_journal import TombstoneJournal
+from lexicards.errors.error import DataCorruptionError, DataFileNotFoundError
+from lexicards.interfaces.data.i_data_retriever import IDataRetriever
+from lexicards.interfaces.manager.i_word_store import IWordStore
+
+# ==========================================================
+# Compiled deck layout (little-endian):
+#   header  : magic, version, columns, rows,
+#             source mtime (ns), source size     (struct HEADER)
+#   offsets : rows * columns + 1 uint32 entries  (field k = [off[k], off[k+1]))
+#   blob    : UTF-8 encoded fields, back to back
+# Row 0 holds the CSV header.
+# ==========================================================
+MAGIC = b"LXDK"
+VERSION = 2
+HEADER = struct.Struct("<4sHHIqq")
+COMPILED_SUFFIX = ".lxdeck"
+
+
+def compile_deck(source_path: str, target_path: str | None = None) -> str:
+    """
+    Compile a CSV deck into the binary deck format.
+
+    The source's mtime and size are stored in the header, so a rebuild is
+    only needed once the CSV itself changes. The file is written to a
+    temporary path and renamed, so readers never see a partial deck.
+
+    Args:
+        source_path (str): Path to the CSV deck.
+        target_path (str | None): Output path, defaults to the source path
+            with the '.lxdeck' suffix.
+
+    Returns:
+        str: Path to the compiled deck.
+
+    Raises:
+        DataFileNotFoundError: If the CSV file does not exist.
+        DataCorruptionError: If the CSV file cannot be parsed.
+    """
+    if not os.path.isfile(source_path):
+        raise DataFileNotFoundError(f"File not found: {source_path}")
+
+    target_path = target_path or compiled_path_for(source_path)
+    signature = source_signature(source_path)
+
+    blob = bytearray()
+    offsets = array("I", [0])
+    columns = 2
+    rows = 0
+
+    try:
+        with open_text(source_path, "r") as file:
+            for row in csv.reader(file):
+                if rows and not row:
+                    continue
+                if rows == 0:
+                    columns = max(len(row), 2)
+                fields = (row + [""] * columns)[:columns]
+                for field in fields:
+                    blob += field.encode("utf-8")
+                    offsets.append(len(blob))
+                rows += 1
+    except csv.Error as exc:
+        raise DataCorruptionError(f"CSV corrupted in {source_path}") from exc
+
+    if sys.byteorder != "little":
+        offsets.byteswap()
+
+    temp_path = target_path + ".tmp"
+    with open(temp_path, "wb") as file:
+        file.write(HEADER.pack(MAGIC, VERSION, columns, rows, *signature))
+        file.write(offsets.tobytes())
+        file.write(blob)
+    os.replace(temp_path, target_path)
+
+    return target_path
+
+
+def source_signature(source_path: str) -> Tuple[int, int]:
+    """
+    Return the (mtime, size) signature a compiled deck records for its source.
+
+    Args:
+        source_path (str): Path to the CSV deck.
+
+    Returns:
+        Tuple[int, int]: Modification time in nanoseconds and size in bytes.
+    """
+    stat = os.stat(source_path)
+    return stat.st_mtime_ns, stat.st_size
+
+
+def compiled_path_for(source_path: str) -> str:
+    """
+    Return the compiled deck path that belongs to a CSV deck.
+
+    Args:
+        source_path (str): Path to the CSV deck.
+
+    Returns:
+        str: Path with the '.csv' (and any compression) extension replaced
+            by '.lxdeck'.
+    """
+    return os.path.splitext(strip_codec_suffix(source_path))[0] + COMPILED_SUFFIX
+
+
+# --------------------------
+# Memory-mapped Deck
+# --------------------------
+class CompiledDeck(IWordStore):
+    """
+    Read-only, memory-mapped word store over a compiled deck.
+
+    Cards are decoded only when accessed, so random access to card *i* costs
+    O(1) and the deck is never materialised as Python objects. Removal is
+    an O(1) update of an ActivePool; card row ids are stored row numbers
+    minus one (row 0 is the header).
+
+    Attributes:
+        path (str): Path to the compiled deck file.
+        columns (int): Number of fields per row.
+    """
+
+    def __init__(self, path: str):
+        """
+        Map a compiled deck file into memory.
+
+        Args:
+            path (str): Path to the compiled deck.
+
+        Raises:
+            DataCorruptionError: If the file is not a valid compiled deck.
+        """
+        self.path = path
+
+        with open(path, "rb") as file:
+            self._mm = mmap.mmap(file.fileno(), 0, access=mmap.ACCESS_READ)
+
+        if len(self._mm) < HEADER.size:
+            raise DataCorruptionError(f"Compiled deck truncated: {path}")
+
+        magic, version, columns, rows, _, _ = HEADER.unpack_from(self._mm, 0)
+        if magic != MAGIC or version != VERSION:
+            raise DataCorruptionError(f"Not a compiled deck: {path}")
+
+        self.columns = columns
+        table_end = HEADER.size + (rows * columns + 1) * 4
+        if len(self._mm) < table_end:
+            raise DataCorruptionError(f"Compiled deck truncated: {path}")
+
+        if sys.byteorder == "little":
+            self._offsets = memoryview(self._mm)[HEADER.size : table_end].cast("I")
+        else:
+            self._offsets = array("I", self._mm[HEADER.size : table_end])
+            self._offsets.byteswap()
+
+        self._blob_start = table_end
+        if rows < 1:
+            raise DataCorruptionError(f"Compiled deck has no header: {path}")
+
+        self._header = (self._decode_field(0, 0), self._decode_field(0, 1))
+        self._rows = rows - 1
+        self._pool = ActivePool(self._rows)
+
+    @property
+    def header(self) -> Tuple[str, str]:
+        return self._header
+
+    def __len__(self) -> int:
+        return len(self._pool)
+
+    def __getitem__(self, index: int) -> Tuple[str, str]:
+        """
+        Decode a single active card.
+
+        Args:
+            index (int): Position of the card among the active cards.
+
+        Returns:
+            Tuple[str, str]: (word, meaning)
+        """
+        row = self._pool.row_at(index) + 1
+        return self._decode_field(row, 0), self._decode_field(row, 1)
+
+    def pop(self, index: int = -1) -> Tuple[str, str]:
+        """
+        Remove a card from the active cards in O(1) and return it.
+
+        Args:
+            index (int): Position of the card among the active cards.
+
+        Returns:
+            Tuple[str, str]: (word, meaning) of the removed card.
+        """
+        row = self._pool.remove_at(index) + 1
+        return self._decode_field(row, 0), self._decode_field(row, 1)
+
+    def row_id(self, index: int) -> int:
+        return self._pool.row_at(index)
+
+    def index_of(self, row_id: int) -> int | None:
+        return self._pool.index_of(row_id)
+
+    def card(self, row_id: int) -> Tuple[str, str]:
+        """
+        Decode a card by its row id, even after it was removed.
+
+        Raises:
+            IndexError: If the deck has no such row.
+        """
+        if not 0 <= row_id < self._rows:
+            raise IndexError("row id out of range")
+        return self._decode_field(row_id + 1, 0), self._decode_field(row_id + 1, 1)
+
+    def remove_words(self, words: Set[str]) -> None:
+        """
+        Retire every active card whose word is in a set, in one pass.
+
+        Words are compared as encoded bytes, so no card is decoded.
+
+        Args:
+            words (Set[str]): Words to retire.
+        """
+        keys = {word.encode("utf-8") for word in words}
+        start = self._blob_start
+        for row in range(self._rows):
+            k = (row + 1) * self.columns
+            if (
+                self._mm[start + self._offsets[k] : start + self._offsets[k + 1]]
+                in keys
+            ):
+                index = self._pool.index_of(row)
+                if index is not None:
+                    self._pool.remove_at(index)
+
+    def close(self) -> None:
+        """Unmap the deck file; the deck must not be used afterwards."""
+        if isinstance(self._offsets, memoryview):
+            self._offsets.release()
+        self._mm.close()
+
+    def _decode_field(self, row: int, column: int) -> str:
+        """Decode one field of a stored row."""
+        k = row * self.columns + column
+        start = self._blob_start
+        return self._mm[start + self._offsets[k] : start + self._offsets[k + 1]].decode(
+            "utf-8"
+        )
+
+
+# --------------------------
+# Concrete Data Retriever
+# --------------------------
+class CompiledDeckRetriever(IDataRetriever):
+    """
+    IDataRetriever that serves a CSV deck through its compiled binary form.
+
+    The compiled deck is rebuilt automatically whenever the source CSV's
+    mtime or size differs from the one it was compiled from. Words in the
+    deck's tombstone journal are retired from the mapped deck at load time,
+    so journaled removals never force a rebuild.
+
+    Attributes:
+        filename (str): Path to the source CSV file.
+        compiled_path (str): Path to the compiled deck file.
+    """
+
+    def __init__(self, filename: str = "japanese_words.csv"):
+        """
+        Initialize the retriever for a CSV deck.
+
+        Args:
+            filename (str): Path to the CSV file. Defaults to 'japanese_words.csv'.
+        """
+        self.base_path = get_data_dir()
+        self.filename = resolve_data_path(filename)
+        self.compiled_path = compiled_path_for(self.filename)
+        self._deck: CompiledDeck | None = None
+
+    def load_data(self) -> CompiledDeck:
+        """
+        Map the compiled deck, rebuilding it first if it is stale.
+
+        A deck this retriever mapped before is closed ahead of a rebuild, so
+        the compiled file can be replaced.
+
+        Returns:
+            CompiledDeck: Lazily decoded word store.
+
+        Raises:
+            DataFileNotFoundError: If neither the CSV nor a compiled deck exists.
+            DataCorruptionError: If the deck cannot be compiled or read.
+        """
+        if self._is_stale():
+            if self._deck is not None:
+                self._deck.close()
+                self._deck = None
+            compile_deck(self.filename, self.compiled_path)
+
+        deck = CompiledDeck(self.compiled_path)
+        removed = TombstoneJournal(self.filename).load()
+        if removed:
+            deck.remove_words(removed)
+        self._deck = deck
+        return deck
+
+    def iter_rows(self, batch_size: int = 1000) -> Iterator[List[List[str]]]:
+        """
+        Stream rows from the compiled deck in batches.
+
+        Args:
+            batch_size (int): Maximum number of rows per batch.
+
+        Yields:
+            List[List[str]]: Next batch of word entries, header row first.
+        """
+        deck = self.load_data()
+        batch = [list(deck.header)]
+        for word, meaning in deck:
+            if len(batch) >= batch_size:
+                yield batch
+                batch = []
+            batch.append([word, meaning])
+        yield batch
+
+    def _is_stale(self) -> bool:
+        """
+        Check whether the compiled deck must be rebuilt.
+
+        Returns:
+            bool: True if it is missing, unreadable, or compiled from another
+                version of the CSV.
+
+        Raises:
+            DataFileNotFoundError: If neither the CSV nor a compiled deck exists.
+        """
+        if not os.path.isfile(self.filename):
+            if not os.path.isfile(self.compiled_path):
+                raise DataFileNotFoundError(f"File not found: {self.filename}")
+            return False
+
+        try:
+            with open(self.compiled_path, "rb") as file:
+                magic, version, _, _, *signature = HEADER.unpack(file.read(HEADER.size))
+        except (OSError, struct.error):
+            return True
+        if magic != MAGIC or version != VERSION:
+            return True
+        return tuple(signature) != source_signature(self.filename)
+
+
+# --------------------------
+# Concrete Factory
+# --------------------------
+class CompiledDeckRetrieverFactory(DataRetrieverFactory):
+    """
+    Factory for creating CompiledDeckRetriever instances.
+    """
+
+    def create_data_retriever(self, filename: str) -> IDataRetriever:
+        """
+        Create and return a CompiledDeckRetriever instance.
+
+        Args:
+            filename (str): Path to the source CSV file.
+
+        Returns:
+            CompiledDeckRetriever: New instance of CompiledDeckRetriever.
+        """
+        return CompiledDeckRetriever(filename)
+
+
+# --------------------------
+# Converter
+# --------------------------
+def compile_data_dir(data_dir: str | None = None) -> List[str]:
+    """
+    Compile every deck CSV in the data directory.
+
+    Progress files such as known_words.csv and unknown_words.csv are skipped.
+
+    Args:
+        data_dir (str | None): Directory to scan, defaults to the data directory.
+
+    Returns:
+        List[str]: Paths of the compiled decks.
+    """
+    return [compile_deck(path) for path in list_deck_files(data_dir)]
+
+
+def main():
+    for path in compile_data_dir(*sys.argv[1:2]):
+        print(f"Compiled {path}")
+
+
+if __name__ == "__main__":
+    main()
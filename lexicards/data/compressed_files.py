@@ -0,0 +1,88 @@
+import gzip
+import lzma
+import os
+from typing import BinaryIO, TextIO
+
+# Compression codecs, chosen by file extension
+CODECS = {".gz": gzip, ".xz": lzma}
+DECK_SUFFIXES = (".csv", ".csv.gz", ".csv.xz")
+
+
+def codec_for(path: str):
+    """
+    Return the compression module for a path, or None for plain files.
+
+    Args:
+        path (str): File path.
+
+    Returns:
+        module | None: gzip, lzma, or None.
+    """
+    return CODECS.get(os.path.splitext(path)[1].lower())
+
+
+def strip_codec_suffix(path: str) -> str:
+    """
+    Return a path without its compression extension.
+
+    Args:
+        path (str): File path, e.g. 'known_words.csv.gz'.
+
+    Returns:
+        str: Path without the extension, e.g. 'known_words.csv'.
+    """
+    stem, suffix = os.path.splitext(path)
+    return stem if suffix.lower() in CODECS else path
+
+
+def is_deck_file(name: str) -> bool:
+    """Return whether a file name is a plain or compressed CSV deck."""
+    return name.lower().endswith(DECK_SUFFIXES)
+
+
+def open_text(
+    path: str,
+    mode: str = "r",
+    newline: str | None = "",
+    codec_path: str | None = None,
+) -> TextIO:
+    """
+    Open a UTF-8 text file, compressing or decompressing transparently.
+
+    Reads stream-decode. Appends to a compressed file add a new gzip member
+    or xz stream after the existing ones, so nothing is recompressed and
+    readers see one continuous file.
+
+    Args:
+        path (str): File to open.
+        mode (str): 'r', 'w' or 'a'.
+        newline (str | None): Newline handling, as for open().
+        codec_path (str | None): Path whose extension selects the codec,
+            defaults to path (useful for temporary files).
+
+    Returns:
+        TextIO: Text stream.
+    """
+    codec = codec_for(codec_path or path)
+    if codec is None:
+        return open(path, mode, encoding="utf-8", newline=newline)
+    return codec.open(path, mode + "t", encoding="utf-8", newline=newline)
+
+
+def decompressing_reader(raw: BinaryIO, path: str) -> BinaryIO:
+    """
+    Wrap a binary stream of a file so it yields the decompressed bytes.
+
+    Args:
+        raw (BinaryIO): Stream over the file's stored bytes.
+        path (str): Path whose extension selects the codec.
+
+    Returns:
+        BinaryIO: Stream of decompressed bytes, or raw for plain files.
+    """
+    codec = codec_for(path)
+    if codec is gzip:
+        return gzip.GzipFile(fileobj=raw, mode="rb")
+    if codec is lzma:
+        return lzma.LZMAFile(raw, mode="rb")
+    return raw
@@ -0,0 +1,86 @@
+import os
+import sys
+from typing import List
+
+from lexicards.data.compressed_files import is_deck_file, strip_codec_suffix
+
+# Progress files live next to the decks but are not decks themselves; each
+# deck keeps its own as '<deck>.known_words.csv' and '<deck>.unknown_words.csv'
+PROGRESS_FILES = {"known_words.csv", "unknown_words.csv"}
+
+
+def get_data_dir() -> str:
+    """
+    Return the absolute path of the data directory.
+
+    Resolves to 'assets/data' inside the PyInstaller temp folder when
+    running as a frozen executable, otherwise inside the source tree.
+
+    Returns:
+        str: Absolute path to the data directory.
+    """
+    if hasattr(sys, "_MEIPASS"):
+        base_path = os.path.join(sys._MEIPASS, "assets", "data")
+    else:
+        base_path = os.path.join(os.path.dirname(__file__), "..", "assets", "data")
+
+    return os.path.abspath(base_path)
+
+
+def resolve_data_path(filename: str) -> str:
+    """
+    Resolve a data file name against the data directory.
+
+    Args:
+        filename (str): File name relative to the data directory, or an
+            absolute path which is returned unchanged.
+
+    Returns:
+        str: Absolute path to the data file.
+    """
+    return os.path.abspath(os.path.join(get_data_dir(), filename))
+
+
+def list_deck_files(data_dir: str | None = None) -> List[str]:
+    """
+    List the deck CSV files in the data directory, plain or compressed.
+
+    Progress files such as known_words.csv and unknown_words.csv, per-deck
+    ones such as japanese_words.known_words.csv, and their compressed forms
+    are skipped.
+
+    Args:
+        data_dir (str | None): Directory to scan, defaults to the data directory.
+
+    Returns:
+        List[str]: Absolute paths of the deck files, sorted by name.
+    """
+    data_dir = data_dir or get_data_dir()
+    return [
+        os.path.abspath(os.path.join(data_dir, name))
+        for name in sorted(os.listdir(data_dir))
+        if is_deck_file(name) and not _is_progress_file(strip_codec_suffix(name))
+    ]
+
+
+def deck_state_path(deck: str, name: str) -> str:
+    """
+    Return the path of a state file kept for one deck.
+
+    Args:
+        deck (str): Deck file name or path.
+        name (str): State file name, e.g. 'session.log'.
+
+    Returns:
+        str: Absolute path in the data directory, e.g.
+            '.../japanese_words.session.log'.
+    """
+    stem = os.path.splitext(strip_codec_suffix(os.path.basename(deck)))[0]
+    return resolve_data_path(f"{stem}.{name}")
+
+
+def _is_progress_file(name: str) -> bool:
+    """Check whether a file name (without codec suffix) is a progress file."""
+    return name in PROGRESS_FILES or any(
+        name.endswith("." + progress) for progress in PROGRESS_FILES
+    )
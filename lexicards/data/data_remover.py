@@ -1,9 +1,12 @@
-import csv
+import atexit
 import os
-import sys
 import threading
 from abc import ABC, abstractmethod
+from concurrent.futures import Future
 
+from lexicards.data.data_paths import get_data_dir, resolve_data_path
+from lexicards.data.data_writer import BackgroundWriter, rewrite_csv_without
+from lexicards.data.tombstone_journal import TombstoneJournal
 from lexicards.interfaces.data.i_data_remove import IDataRemover
 
 
@@ -14,33 +17,52 @@ class CSVDataRemover(IDataRemover):
     """
     Concrete implementation of IDataSaver for CSV files.
 
+    All file I/O runs on the data directory's BackgroundWriter, so removal
+    batches for the same file are serialized (and coalesced) instead of
+    racing in separate threads. In journal mode removals are appended to a
+    TombstoneJournal sidecar instead of rewriting the CSV file, and the
+    journal is compacted back into the file once it grows past a size or
+    ratio threshold. Words still marked at exit are flushed then.
+
     Attributes:
         filename (str): CSV file name.
         to_remove (set): Set of words that need to be removed
+        writer (BackgroundWriter): Serialized writer for the data directory.
+        journal (TombstoneJournal | None): Removal journal in journal mode.
+        compact_bytes (int): Journal size in bytes that triggers compaction.
+        compact_ratio (float): Journal-to-CSV size ratio that triggers compaction.
     """
 
-    def __init__(self, filename: str):
+    def __init__(
+        self,
+        filename: str,
+        journal: bool = False,
+        compact_bytes: int = 64 * 1024,
+        compact_ratio: float = 0.05,
+    ):
         """
         Initialize the CSV data remover.
 
         Args:
             filename (str): CSV file name (stored under the data directory)
+            journal (bool): Record removals in a tombstone journal instead of
+                rewriting the CSV file on every flush.
+            compact_bytes (int): Journal size in bytes that triggers compaction.
+            compact_ratio (float): Journal-to-CSV size ratio that triggers
+                compaction.
         """
-        self.filename = filename
         self.to_remove = set()
         self._lock = threading.Lock()
 
-        # ==========================================================
-        # Resolve file path for PyInstaller or normal execution
-        # ==========================================================
+        self.base_path = get_data_dir()
+        self.filename = resolve_data_path(filename)
+        self.writer = BackgroundWriter.for_file(self.filename)
 
-        if hasattr(sys, "_MEIPASS"):
-            base_path = os.path.join(sys._MEIPASS, "assets", "data")
-        else:
-            base_path = os.path.join(os.path.dirname(__file__), "..", "assets", "data")
+        self.journal = TombstoneJournal(self.filename) if journal else None
+        self.compact_bytes = compact_bytes
+        self.compact_ratio = compact_ratio
 
-        self.base_path = os.path.abspath(base_path)
-        self.filename = os.path.join(self.base_path, filename)
+        atexit.register(self.flush)
 
     def remove_word(self, word: str) -> None:
         """
@@ -49,22 +71,7 @@ class CSVDataRemover(IDataRemover):
         Args:
             word (str): Word to remove.
         """
-        if not os.path.isfile(self.filename):
-            return
-
-        with open(self.filename, "r", encoding="utf-8", newline="") as file:
-            rows = list(csv.reader(file))
-
-        if not rows:
-            return
-
-        header = rows[0]
-        new_rows = [row for row in rows[1:] if row and row[0] != word]
-
-        with open(self.filename, "w", encoding="utf-8", newline="") as file:
-            writer = csv.writer(file)
-            writer.writerow(header)
-            writer.writerows(new_rows)
+        self._submit_removal({word}).result()
 
     def mark_for_removal(self, word: str) -> None:
         """
@@ -80,31 +87,91 @@ class CSVDataRemover(IDataRemover):
         """
         Apply all marked removals to the CSV file and clear the batch.
 
-        Rewrites the CSV file only once for efficiency.
+        Rewrites the CSV file only once for efficiency, or appends the batch
+        to the journal in journal mode.
+        """
+        future = self._take_batch()
+        if future is not None:
+            future.result()
+
+    def flush_async(self) -> None:
+        """Queue all marked removals on the directory's background writer."""
+        self._take_batch()
+
+    def compact(self) -> None:
+        """
+        Fold the tombstone journal back into the CSV file.
+
+        The CSV file is rewritten once without the journaled words, and the
+        journal is deleted afterwards.
+        """
+        if self.journal is not None:
+            self.writer.call(self._compact_now).result()
+
+    # ==========================================================
+    # Private Utilities
+    # ==========================================================
+
+    def _take_batch(self) -> Future | None:
+        """
+        Queue the marked words for removal and clear the batch.
+
+        Returns:
+            Future | None: Completion of the queued writes, or None if
+                nothing was marked.
         """
         with self._lock:
-            if not self.to_remove or not os.path.isfile(self.filename):
-                return
-            rows_to_remove = self.to_remove.copy()
+            if not self.to_remove:
+                return None
+            words = self.to_remove.copy()
             self.to_remove.clear()
 
-        with open(self.filename, "r", encoding="utf-8", newline="") as file:
-            rows = list(csv.reader(file))
+        return self._submit_removal(words)
 
-        if not rows:
-            return
+    def _submit_removal(self, words: set) -> Future:
+        """
+        Queue a batch of removals using the configured removal mode.
 
-        header = rows[0]
-        new_rows = [row for row in rows[1:] if row and row[0] not in rows_to_remove]
+        Args:
+            words (set): Words to remove.
 
-        with open(self.filename, "w", encoding="utf-8", newline="") as file:
-            writer = csv.writer(file)
-            writer.writerow(header)
-            writer.writerows(new_rows)
+        Returns:
+            Future: Completion of the queued write.
+        """
+        if self.journal is None:
+            return self.writer.remove_rows(self.filename, words)
 
-    def flush_async(self) -> None:
-        """Run flush in a background thread."""
-        threading.Thread(target=self.flush, daemon=True).start()
+        return self.writer.call(lambda: self._journal_now(words))
+
+    def _journal_now(self, words: set) -> None:
+        """Journal removed words, compacting past the threshold (writer thread)."""
+        self.journal.append(words)
+        if self._should_compact():
+            self._compact_now()
+
+    def _compact_now(self) -> None:
+        """Fold the journal into the CSV file (writer thread)."""
+        removed = self.journal.load()
+        if removed:
+            rewrite_csv_without(self.filename, removed)
+        self.journal.clear()
+
+    def _should_compact(self) -> bool:
+        """
+        Check whether the journal passed its compaction threshold.
+
+        Returns:
+            bool: True if the journal should be folded into the CSV file.
+        """
+        journal_size = self.journal.size()
+        if journal_size >= self.compact_bytes:
+            return True
+
+        try:
+            source_size = os.path.getsize(self.filename)
+        except OSError:
+            return False
+        return journal_size >= source_size * self.compact_ratio
 
 
 # --------------------------
@@ -137,6 +204,25 @@ class CSVDataRemoverFactory(DataRemoverFactory):
     Factory for creating CSVDataRemover instances.
     """
 
+    def __init__(
+        self,
+        journal: bool = False,
+        compact_bytes: int = 64 * 1024,
+        compact_ratio: float = 0.05,
+    ):
+        """
+        Initialize the factory with the removal mode.
+
+        Args:
+            journal (bool): Create removers that use a tombstone journal.
+            compact_bytes (int): Journal size in bytes that triggers compaction.
+            compact_ratio (float): Journal-to-CSV size ratio that triggers
+                compaction.
+        """
+        self.journal = journal
+        self.compact_bytes = compact_bytes
+        self.compact_ratio = compact_ratio
+
     def create_data_remover(self, filename: str) -> IDataRemover:
         """
         Create and return a CSVDataRemover instance.
@@ -147,4 +233,9 @@ class CSVDataRemoverFactory(DataRemoverFactory):
         Returns:
             CSVDataRemover: A new CSV data remover.
         """
-        return CSVDataRemover(filename)
+        return CSVDataRemover(
+            filename,
+            journal=self.journal,
+            compact_bytes=self.compact_bytes,
+            compact_ratio=self.compact_ratio,
+        )
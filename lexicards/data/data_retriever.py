@@ -1,13 +1,47 @@
 import csv
 import os
-import sys
 from abc import ABC, abstractmethod
-from typing import List
+from typing import Iterator, List, Tuple
 
+from lexicards.data.compressed_files import open_text
+from lexicards.data.data_paths import get_data_dir, resolve_data_path
+from lexicards.data.deck_cache import DeckCache
+from lexicards.data.tombstone_journal import TombstoneJournal
 from lexicards.errors.error import DataCorruptionError, DataFileNotFoundError
 from lexicards.interfaces.data.i_data_retriever import IDataRetriever
 
 
+def read_deck_header(filename: str) -> Tuple[str, str]:
+    """
+    Read the (foreign, native) language labels from a deck's header row.
+
+    Only the first line is parsed, so this is cheap even for large decks.
+
+    Args:
+        filename (str): Deck file name or path (stored under the data directory).
+
+    Returns:
+        Tuple[str, str]: Header labels, without a leading BOM.
+
+    Raises:
+        DataFileNotFoundError: If the deck file does not exist.
+        DataCorruptionError: If the header cannot be read or has fewer than
+            two columns.
+    """
+    path = resolve_data_path(filename)
+    if not os.path.isfile(path):
+        raise DataFileNotFoundError(f"File not found: {path}")
+
+    try:
+        with open_text(path, "r") as file:
+            header = next(csv.reader(file), [])
+    except (csv.Error, OSError) as exc:
+        raise DataCorruptionError(f"Cannot read header of {path}") from exc
+    if len(header) < 2:
+        raise DataCorruptionError(f"Deck has no two-column header: {path}")
+    return header[0].lstrip("\ufeff"), header[1]
+
+
 # --------------------------
 # Concrete Data Retrievers
 # --------------------------
@@ -15,24 +49,32 @@ class CSVDataRetriever(IDataRetriever):
     """
     Concrete implementation of IDataRetriever for CSV files.
 
+    Words recorded in the deck's tombstone journal are filtered out at load
+    time, so journaled removals are visible before they are compacted.
+
+    With a DeckCache, the parsed rows are served from the cache on a warm
+    start and the CSV parser only runs when the source has changed.
+
     Attributes:
         filename (str): Path to the CSV file to load data from.
+        cache (DeckCache | None): Optional parsed-deck cache.
     """
 
-    def __init__(self, filename: str = "japanese_words.csv"):
+    CACHE_BATCH_SIZE = 4096
+
+    def __init__(
+        self, filename: str = "japanese_words.csv", cache: DeckCache | None = None
+    ):
         """
         Initialize the CSVDataRetriever with a filename.
 
         Args:
             filename (str): Path to the CSV file. Defaults to 'data/japanese_words.csv'.
+            cache (DeckCache | None): Optional parsed-deck cache.
         """
-        if hasattr(sys, "_MEIPASS"):
-            base_path = os.path.join(sys._MEIPASS, "assets", "data")
-        else:
-            base_path = os.path.join(os.path.dirname(__file__), "..", "assets", "data")
-
-        self.base_path = os.path.abspath(base_path)
-        self.filename = os.path.join(self.base_path, filename)
+        self.base_path = get_data_dir()
+        self.filename = resolve_data_path(filename)
+        self.cache = cache
 
     def load_data(self) -> List[List[str]]:
         """
@@ -48,10 +90,108 @@ class CSVDataRetriever(IDataRetriever):
         if not os.path.isfile(self.filename):
             raise DataFileNotFoundError(f"File not found: {self.filename}")
 
+        removed = TombstoneJournal(self.filename).load()
+
+        rows = list(self._iter_source_rows())
+
+        if removed and rows:
+            rows[1:] = [row for row in rows[1:] if row and row[0] not in removed]
+        return rows
+
+    def iter_rows(self, batch_size: int = 1000) -> Iterator[List[List[str]]]:
+        """
+        Stream data from the CSV file in batches.
+
+        Only one batch is held in memory at a time, so peak memory during
+        the load does not grow with the size of the deck.
+
+        Args:
+            batch_size (int): Maximum number of rows per batch.
+
+        Yields:
+            List[List[str]]: Next batch of word entries, header row first.
+
+        Raises:
+            DataFileNotFoundError: If the CSV file does not exist.
+            DataCorruptionError: If the CSV file cannot be read or is corrupted.
+        """
+        if not os.path.isfile(self.filename):
+            raise DataFileNotFoundError(f"File not found: {self.filename}")
+
+        removed = TombstoneJournal(self.filename).load()
+
+        reader = self._iter_source_rows()
+        header = next(reader, None)
+        if header is None:
+            return
+
+        batch = [header]
+        for row in reader:
+            if removed and (not row or row[0] in removed):
+                continue
+            batch.append(row)
+            if len(batch) >= batch_size:
+                yield batch
+                batch = []
+
+        if batch:
+            yield batch
+
+    # ==========================================================
+    # Private Utilities
+    # ==========================================================
+
+    def _iter_source_rows(self) -> Iterator[List[str]]:
+        """
+        Yield the raw rows of the deck, from the cache when it is valid.
+
+        On a cache miss the CSV is parsed and recorded into the cache in the
+        same pass, so the next start can skip the parser.
+
+        Raises:
+            DataCorruptionError: If the CSV file cannot be read or is corrupted.
+        """
+        if self.cache is None:
+            yield from self._parse_csv()
+            return
+
+        cached = self.cache.load(self.filename)
+        if cached is not None:
+            for batch in cached:
+                yield from batch
+            return
+
+        try:
+            recorder = self.cache.record(self.filename)
+        except OSError:
+            # An unwritable cache must never stop the deck from loading
+            yield from self._parse_csv()
+            return
+
         try:
-            with open(self.filename, "r", encoding="utf-8") as file:
-                reader = csv.reader(file)
-                return list(reader)
+            with recorder.open_source() as file:
+                batch = []
+                for row in csv.reader(file):
+                    batch.append(row)
+                    if len(batch) >= self.CACHE_BATCH_SIZE:
+                        recorder.add(batch)
+                        yield from batch
+                        batch = []
+                recorder.add(batch)
+                yield from batch
+        except csv.Error:
+            recorder.abort()
+            raise DataCorruptionError(f"CSV corrupted in {self.filename}")
+        except BaseException:
+            recorder.abort()
+            raise
+        recorder.commit()
+
+    def _parse_csv(self) -> Iterator[List[str]]:
+        """Parse the CSV file directly, bypassing the cache."""
+        try:
+            with open_text(self.filename, newline=None) as file:
+                yield from csv.reader(file)
         except csv.Error:
             raise DataCorruptionError(f"CSV corrupted in {self.filename}")
 
@@ -86,6 +226,16 @@ class CSVDataRetrieverFactory(DataRetrieverFactory):
     Factory for creating CSVDataRetriever instances.
     """
 
+    def __init__(self, cache: DeckCache | None = None):
+        """
+        Initialize the factory.
+
+        Args:
+            cache (DeckCache | None): Parsed-deck cache shared by the created
+                retrievers.
+        """
+        self.cache = cache
+
     def create_data_retriever(self, filename: str) -> IDataRetriever:
         """
         Create and return a CSVDataRetriever instance using the configured filename.
@@ -96,4 +246,4 @@ class CSVDataRetrieverFactory(DataRetrieverFactory):
         Returns:
             CSVDataRetriever: New instance of CSVDataRetriever.
         """
-        return CSVDataRetriever(filename)
+        return CSVDataRetriever(filename, cache=self.cache)
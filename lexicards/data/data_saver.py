@@ -1,8 +1,14 @@
+import atexit
 import csv
 import os
-import sys
+import threading
 from abc import ABC, abstractmethod
+from concurrent.futures import Future
 
+from lexicards.core.fingerprint_set import FingerprintSet
+from lexicards.data.compressed_files import open_text
+from lexicards.data.data_paths import get_data_dir, resolve_data_path
+from lexicards.data.data_writer import BackgroundWriter
 from lexicards.errors.error import DataCorruptionError
 from lexicards.interfaces.data.i_data_saver import IDataSaver
 
@@ -14,79 +20,259 @@ class CSVDataSaver(IDataSaver):
     """
     Concrete implementation of IDataSaver for CSV files.
 
+    The saver is meant to be long-lived: the duplicate index is loaded once,
+    kept up to date on every append, and only reloaded when the file is
+    changed outside the application (detected through its mtime and size).
+    Appends are queued on the data directory's BackgroundWriter, either one
+    by one or, in buffered mode, as group commits of many rows.
+
     Attributes:
         filename (str): CSV file name.
         header (tuple[str, str]): Column headers.
-        existing_words (set): Set of words already saved to avoid duplicates.
+        existing_words (set | FingerprintSet): Words already saved, to avoid
+            duplicates.
+        compact_index (bool): Whether existing_words is a FingerprintSet.
+        writer (BackgroundWriter): Serialized writer for the data directory.
     """
 
-    def __init__(self, filename: str, header: tuple[str, str]):
+    def __init__(
+        self,
+        filename: str,
+        header: tuple[str, str],
+        buffer_rows: int | None = None,
+        buffer_bytes: int | None = None,
+        buffer_interval: float | None = None,
+        compact_index: bool = False,
+    ):
         """
         Initialize the CSV data saver.
 
+        Setting any buffer threshold enables write-behind buffering: rows
+        are collected in memory and committed as one append once the row
+        count, byte size or time interval threshold is reached.
+
         Args:
             filename (str): CSV file name (stored under the data directory)
             header (tuple[str, str]): Column headers (e.g. ("Japanese", "English"))
+            buffer_rows (int | None): Commit after this many buffered rows.
+            buffer_bytes (int | None): Commit after this many buffered bytes.
+            buffer_interval (float | None): Commit this many seconds after
+                the first buffered row.
+            compact_index (bool): Keep the duplicate index in a FingerprintSet,
+                about a third of the memory of a set of str for large files.
         """
         self.header = header
-        self.filename = filename
-        self.existing_words = set()
+        self.compact_index = compact_index
+        self.existing_words = self._new_index()
+        self._signature = None
+        self._pending = 0
+        self._lock = threading.Lock()
 
-        # ==========================================================
-        # Resolve file path for PyInstaller or normal execution
-        # ==========================================================
+        self.buffer_rows = buffer_rows
+        self.buffer_bytes = buffer_bytes
+        self.buffer_interval = buffer_interval
+        self._buffer = []
+        self._buffered_bytes = 0
+        self._timer = None
+        self._error = None
 
-        if hasattr(sys, "_MEIPASS"):
-            base_path = os.path.join(sys._MEIPASS, "assets", "data")
-        else:
-            base_path = os.path.join(os.path.dirname(__file__), "..", "assets", "data")
-
-        self.base_path = os.path.abspath(base_path)
-        self.filename = os.path.join(self.base_path, filename)
+        self.base_path = get_data_dir()
+        self.filename = resolve_data_path(filename)
+        self.writer = BackgroundWriter.for_file(self.filename)
 
         # ==========================================================
         # Load existing words to prevent duplicates
         # ==========================================================
 
-        if os.path.isfile(self.filename):
-            try:
-                with open(self.filename, "r", encoding="utf-8", newline="") as file:
-                    reader = csv.reader(file)
-                    next(reader, None)  # Skip header
+        self._load_existing_words()
 
-                    for row in reader:
-                        if row:
-                            self.existing_words.add(row[0])
-            except (csv.Error, OSError) as exc:
-                raise DataCorruptionError(
-                    f"Cannot read existing CSV: {self.filename}"
-                ) from exc
+        if self.buffered:
+            atexit.register(self.close)
+
+    @property
+    def buffered(self) -> bool:
+        """Return True if write-behind buffering is enabled."""
+        return any(
+            threshold is not None
+            for threshold in (self.buffer_rows, self.buffer_bytes, self.buffer_interval)
+        )
 
     def save_data(self, word: str, meaning: str) -> None:
         """
-        Save data to the CSV file.
+        Save a row to the CSV file unless the word is already saved.
+
+        The duplicate index is updated immediately, so duplicate checks
+        stay exact while rows are buffered or queued. Unbuffered saves
+        wait for their append; buffered ones report failures from flush().
 
         Args:
             word (str): Foreign-language word
             meaning (str): Translated meaning
 
         Raises:
-            DataCorruptionError: If the CSV file cannot be written or is corrupted.
+            DataCorruptionError: If an unbuffered append failed.
         """
-        if word in self.existing_words:
-            return
+        with self._lock:
+            self._reload_if_changed()
+
+            if word in self.existing_words:
+                return
+
+            self.existing_words.add(word)
+            self._pending += 1
+            self._buffer.append([word, meaning])
+            self._buffered_bytes += len(word.encode("utf-8"))
+            self._buffered_bytes += len(meaning.encode("utf-8")) + 2
+
+            rows = self._take_buffer() if self._commit_due() else None
+            if rows is None and self.buffer_interval and self._timer is None:
+                self._timer = threading.Timer(self.buffer_interval, self._on_timer)
+                self._timer.daemon = True
+                self._timer.start()
+
+        if rows:
+            future = self._commit(rows)
+            if not self.buffered and future.exception() is not None:
+                # The done callback may not have run yet, so a retry would
+                # still be taken for a duplicate
+                with self._lock:
+                    self.existing_words.discard(word)
+                raise DataCorruptionError(
+                    f"Cannot write to CSV: {self.filename}"
+                ) from future.exception()
+
+    def flush(self) -> None:
+        """
+        Commit buffered rows and wait until every queued row is on disk.
+
+        Raises:
+            DataCorruptionError: If a queued append failed.
+        """
+        with self._lock:
+            rows = self._take_buffer()
+        if rows:
+            self._commit(rows)
+
+        self.writer.drain()
+
+        with self._lock:
+            error, self._error = self._error, None
+        if error is not None:
+            raise DataCorruptionError(
+                f"Cannot write to CSV: {self.filename}"
+            ) from error
+
+    def close(self) -> None:
+        """Flush the buffer; the saver stays usable afterwards."""
+        self.flush()
+
+    # ==========================================================
+    # Private Utilities
+    # ==========================================================
+
+    def _new_index(self) -> set | FingerprintSet:
+        """Return an empty duplicate index of the configured kind."""
+        return FingerprintSet() if self.compact_index else set()
+
+    def _commit_due(self) -> bool:
+        """Check whether the buffer reached its row or byte threshold."""
+        if not self.buffered:
+            return True
+        if self.buffer_rows is not None and len(self._buffer) >= self.buffer_rows:
+            return True
+        return self.buffer_bytes is not None and (
+            self._buffered_bytes >= self.buffer_bytes
+        )
 
+    def _take_buffer(self) -> list:
+        """Detach the buffered rows and cancel the interval timer (locked)."""
+        rows, self._buffer = self._buffer, []
+        self._buffered_bytes = 0
+        if self._timer is not None:
+            self._timer.cancel()
+            self._timer = None
+        return rows
+
+    def _on_timer(self) -> None:
+        """Commit the buffer once the time interval has elapsed."""
+        with self._lock:
+            self._timer = None
+            rows = self._take_buffer()
+        if rows:
+            self._commit(rows)
+
+    def _commit(self, rows: list) -> Future:
+        """Queue buffered rows on the writer as a single append."""
+        future = self.writer.append_rows(self.filename, rows, header=self.header)
+        future.add_done_callback(lambda done: self._on_written(done, rows))
+        return future
+
+    def _stat_signature(self) -> tuple[int, int] | None:
+        """
+        Return the (mtime, size) signature of the CSV file.
+
+        Returns:
+            tuple[int, int] | None: Signature, or None if the file is missing.
+        """
         try:
-            file_exists = os.path.isfile(self.filename)
-            with open(self.filename, "a", encoding="utf-8", newline="") as file:
-                writer = csv.writer(file)
+            stat = os.stat(self.filename)
+        except OSError:
+            return None
+        return stat.st_mtime_ns, stat.st_size
+
+    def _reload_if_changed(self) -> None:
+        """Reload the duplicate index if the file was changed externally."""
+        if self._pending == 0 and self._stat_signature() != self._signature:
+            self._load_existing_words()
+
+    def _on_written(self, future: Future, rows: list) -> None:
+        """
+        Record the outcome of a queued append (writer thread).
+
+        Once no writes are pending, the file signature is refreshed so our
+        own appends are not mistaken for external changes. Rows of a failed
+        append are dropped from the index so they can be saved again.
+
+        Args:
+            future (Future): Completed append.
+            rows (list): Rows that were appended.
+        """
+        with self._lock:
+            self._pending -= len(rows)
+            if future.exception() is not None:
+                if self.buffered:
+                    # Unbuffered saves raise from save_data() instead
+                    self._error = future.exception()
+                for word, _ in rows:
+                    self.existing_words.discard(word)
+            if self._pending == 0:
+                self._signature = self._stat_signature()
+
+    def _load_existing_words(self) -> None:
+        """
+        Rebuild the duplicate index from the CSV file.
+
+        Raises:
+            DataCorruptionError: If the CSV file cannot be read.
+        """
+        self.existing_words = self._new_index()
+        self._signature = self._stat_signature()
+
+        if not os.path.isfile(self.filename):
+            return
 
-                if not file_exists:
-                    writer.writerow(self.header)
+        try:
+            with open_text(self.filename, "r") as file:
+                reader = csv.reader(file)
+                next(reader, None)  # Skip header
 
-                writer.writerow([word, meaning])
-        except csv.Error:
-            raise DataCorruptionError(f"Cannot write to CSV: {self.filename}")
+                for row in reader:
+                    if row:
+                        self.existing_words.add(row[0])
+        except (csv.Error, OSError) as exc:
+            raise DataCorruptionError(
+                f"Cannot read existing CSV: {self.filename}"
+            ) from exc
 
 
 # --------------------------
@@ -117,26 +303,61 @@ class DataSaverFactory(ABC):
 class CSVDataSaverFactory(DataSaverFactory):
     """
     Factory for creating CSVDataSaver instances.
+
+    Hands out a single pooled saver per resolved file path, so the
+    duplicate index is built once instead of on every call.
     """
 
-    def __init__(self, foreign_language: str, native_language: str):
+    def __init__(
+        self,
+        foreign_language: str,
+        native_language: str,
+        buffer_rows: int | None = None,
+        buffer_bytes: int | None = None,
+        buffer_interval: float | None = None,
+        compact_index: bool = False,
+    ):
         """
         Initialize the factory with language metadata.
 
         Args:
             foreign_language (str): Source language
             native_language (str): Target language
+            buffer_rows (int | None): Group-commit row threshold for savers.
+            buffer_bytes (int | None): Group-commit byte threshold for savers.
+            buffer_interval (float | None): Group-commit interval in seconds.
+            compact_index (bool): Give savers a FingerprintSet duplicate index.
         """
         self.header = (foreign_language, native_language)
+        self.buffer_rows = buffer_rows
+        self.buffer_bytes = buffer_bytes
+        self.buffer_interval = buffer_interval
+        self.compact_index = compact_index
+        self._savers: dict[str, CSVDataSaver] = {}
+        self._lock = threading.Lock()
 
     def create_data_saver(self, filename: str) -> IDataSaver:
         """
-        Create and return a CSVDataSaver instance.
+        Return the pooled CSVDataSaver for the given file, creating it once.
 
         Args:
             filename (str): Path to the CSV file.
 
         Returns:
-            CSVDataSaver: A new CSV data saver.
+            CSVDataSaver: The CSV data saver bound to this file.
         """
-        return CSVDataSaver(filename, self.header)
+        path = resolve_data_path(filename)
+
+        with self._lock:
+            saver = self._savers.get(path)
+            if saver is None:
+                saver = CSVDataSaver(
+                    path,
+                    self.header,
+                    buffer_rows=self.buffer_rows,
+                    buffer_bytes=self.buffer_bytes,
+                    buffer_interval=self.buffer_interval,
+                    compact_index=self.compact_index,
+                )
+                self._savers[path] = saver
+            return saver
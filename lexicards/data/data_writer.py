@@ -0,0 +1,258 @@
+import atexit
+import csv
+import os
+import queue
+import threading
+from concurrent.futures import Future
+from typing import Callable, Iterable, List, Sequence
+
+from lexicards.data.compressed_files import open_text
+
+APPEND = "append"
+REMOVE = "remove"
+CALL = "call"
+
+
+def rewrite_csv_without(path: str, words: Iterable[str]) -> None:
+    """
+    Rewrite a CSV file without the rows whose first column is in words.
+
+    Rows are streamed into a temporary file that atomically replaces the
+    original, so readers never observe a half-written file.
+
+    Args:
+        path (str): Path to the CSV file.
+        words (Iterable[str]): Words to drop.
+    """
+    if not os.path.isfile(path):
+        return
+
+    words = set(words)
+    temp_path = path + ".tmp"
+    with open_text(path, "r") as source:
+        with open_text(temp_path, "w", codec_path=path) as target:
+            reader = csv.reader(source)
+            writer = csv.writer(target)
+
+            header = next(reader, None)
+            if header is not None:
+                writer.writerow(header)
+                writer.writerows(row for row in reader if row and row[0] not in words)
+
+    if header is None:
+        os.remove(temp_path)
+    else:
+        os.replace(temp_path, path)
+
+
+class _WriteOp:
+    """A queued write request and the future that reports its outcome."""
+
+    __slots__ = ("kind", "path", "payload", "header", "future")
+
+    def __init__(self, kind: str, path: str, payload, header=None):
+        self.kind = kind
+        self.path = path
+        self.payload = payload
+        self.header = header
+        self.future = Future()
+
+
+class BackgroundWriter:
+    """
+    Single serialized writer thread for one data directory.
+
+    Every append, removal and maintenance task for files in the directory
+    goes through one bounded queue and one thread, so two writes to the
+    same file can never interleave. Consecutive appends to the same file
+    are written in one open/write pass, and consecutive removals from the
+    same file are merged into one atomic rewrite. The queue is drained on
+    interpreter exit so pending writes are not lost with the daemon thread.
+
+    Attributes:
+        directory (str): Absolute path of the directory served.
+    """
+
+    _writers: dict = {}
+    _registry_lock = threading.Lock()
+
+    def __init__(self, directory: str, max_pending: int = 1024):
+        """
+        Start the writer thread.
+
+        Args:
+            directory (str): Directory whose files this writer owns.
+            max_pending (int): Queue bound; submitters block when it is full.
+        """
+        self.directory = os.path.abspath(directory)
+        self._queue = queue.Queue(maxsize=max_pending)
+        self._closed = False
+        self._close_lock = threading.Lock()
+        self._thread = threading.Thread(
+            target=self._run, name=f"BackgroundWriter({self.directory})", daemon=True
+        )
+        self._thread.start()
+        atexit.register(self.close)
+
+    @classmethod
+    def for_directory(cls, directory: str) -> "BackgroundWriter":
+        """
+        Return the shared writer for a directory, starting it if needed.
+
+        Args:
+            directory (str): Directory holding the files to write.
+
+        Returns:
+            BackgroundWriter: The directory's writer.
+        """
+        directory = os.path.abspath(directory)
+        with cls._registry_lock:
+            writer = cls._writers.get(directory)
+            if writer is None or writer._closed:
+                writer = cls(directory)
+                cls._writers[directory] = writer
+            return writer
+
+    @classmethod
+    def for_file(cls, path: str) -> "BackgroundWriter":
+        """Return the shared writer for the directory containing a file."""
+        return cls.for_directory(os.path.dirname(os.path.abspath(path)))
+
+    # ==========================================================
+    # Public API
+    # ==========================================================
+
+    def append_rows(
+        self, path: str, rows: List[Sequence[str]], header: Sequence[str] = None
+    ) -> Future:
+        """
+        Queue rows to append to a CSV file.
+
+        Args:
+            path (str): Path to the CSV file.
+            rows (List[Sequence[str]]): Rows to append.
+            header (Sequence[str]): Header written first if the file is new.
+
+        Returns:
+            Future: Resolved once the rows are on disk.
+        """
+        return self._submit(_WriteOp(APPEND, path, rows, header))
+
+    def remove_rows(self, path: str, words: Iterable[str]) -> Future:
+        """
+        Queue removal of rows whose first column is one of the words.
+
+        Args:
+            path (str): Path to the CSV file.
+            words (Iterable[str]): Words to remove.
+
+        Returns:
+            Future: Resolved once the file has been rewritten.
+        """
+        return self._submit(_WriteOp(REMOVE, path, set(words)))
+
+    def call(self, task: Callable[[], None]) -> Future:
+        """
+        Queue a task that must run serialized with the other writes.
+
+        Args:
+            task (Callable[[], None]): Function doing its own file I/O.
+
+        Returns:
+            Future: Resolved with the task's return value.
+        """
+        return self._submit(_WriteOp(CALL, "", task))
+
+    def drain(self) -> None:
+        """Block until every queued write has been applied."""
+        self._queue.join()
+
+    def close(self) -> None:
+        """Apply every queued write and stop the writer thread."""
+        with self._close_lock:
+            if self._closed:
+                return
+            self._closed = True
+
+        if threading.current_thread() is self._thread:
+            return
+        self._queue.put(None)
+        self._thread.join()
+
+    # ==========================================================
+    # Private Utilities
+    # ==========================================================
+
+    def _submit(self, op: _WriteOp) -> Future:
+        """Queue an operation, or run it inline once the writer is closed."""
+        if self._closed:
+            self._apply([op])
+        else:
+            self._queue.put(op)
+        return op.future
+
+    def _run(self) -> None:
+        """Writer loop: take everything queued and apply it in one pass."""
+        while True:
+            batch = [self._queue.get()]
+            while True:
+                try:
+                    batch.append(self._queue.get_nowait())
+                except queue.Empty:
+                    break
+
+            ops = [op for op in batch if op is not None]
+            self._apply(ops)
+            for _ in batch:
+                self._queue.task_done()
+
+            if len(ops) != len(batch):
+                return
+
+    def _apply(self, ops: List[_WriteOp]) -> None:
+        """Apply operations in order, coalescing runs on the same file."""
+        start = 0
+        while start < len(ops):
+            end = start + 1
+            while (
+                end < len(ops)
+                and ops[start].kind != CALL
+                and ops[end].kind == ops[start].kind
+                and ops[end].path == ops[start].path
+            ):
+                end += 1
+
+            group = ops[start:end]
+            try:
+                result = self._apply_group(group)
+            except Exception as exc:
+                for op in group:
+                    op.future.set_exception(exc)
+            else:
+                for op in group:
+                    op.future.set_result(result)
+            start = end
+
+    @staticmethod
+    def _apply_group(group: List[_WriteOp]):
+        """Perform the file I/O for a run of operations of one kind."""
+        first = group[0]
+
+        if first.kind == CALL:
+            return first.payload()
+
+        if first.kind == REMOVE:
+            words = set()
+            for op in group:
+                words |= op.payload
+            rewrite_csv_without(first.path, words)
+            return None
+
+        file_exists = os.path.isfile(first.path)
+        with open_text(first.path, "a") as file:
+            writer = csv.writer(file)
+            if not file_exists and first.header:
+                writer.writerow(first.header)
+            for op in group:
+                writer.writerows(op.payload)
+        return None
@@ -0,0 +1,315 @@
+import hashlib
+import io
+import marshal
+import os
+import struct
+import sys
+from typing import Iterator, List, TextIO
+
+from lexicards.data.compressed_files import decompressing_reader
+from lexicards.errors.error import DataCorruptionError
+
+CACHE_VERSION = 1
+CHUNK_SIZE = 1 << 20
+FRAME_HEADER = struct.Struct("<I")
+
+
+def default_cache_dir() -> str:
+    """
+    Return the per-user cache directory for LexiCards.
+
+    Honours LEXICARDS_CACHE_DIR, then the platform convention
+    (%LOCALAPPDATA% on Windows, ~/Library/Caches on macOS, XDG elsewhere).
+
+    Returns:
+        str: Absolute path to the cache directory.
+    """
+    override = os.environ.get("LEXICARDS_CACHE_DIR")
+    if override:
+        return os.path.abspath(override)
+
+    if sys.platform == "win32":
+        base = os.environ.get("LOCALAPPDATA", os.path.expanduser("~"))
+        return os.path.join(base, "LexiCards", "Cache")
+    if sys.platform == "darwin":
+        return os.path.expanduser("~/Library/Caches/LexiCards")
+
+    base = os.environ.get("XDG_CACHE_HOME", os.path.expanduser("~/.cache"))
+    return os.path.join(base, "lexicards")
+
+
+def _new_hasher():
+    """Return the content hash used to fingerprint source files."""
+    return hashlib.blake2b(digest_size=16)
+
+
+def file_digest(path: str) -> str:
+    """
+    Hash the content of a file.
+
+    Args:
+        path (str): File to hash.
+
+    Returns:
+        str: Hex digest of the content.
+    """
+    hasher = _new_hasher()
+    with open(path, "rb") as file:
+        for chunk in iter(lambda: file.read(CHUNK_SIZE), b""):
+            hasher.update(chunk)
+    return hasher.hexdigest()
+
+
+class _HashingReader(io.RawIOBase):
+    """Raw reader that hashes every byte it hands out."""
+
+    def __init__(self, raw, hasher):
+        self._raw = raw
+        self._hasher = hasher
+
+    def readable(self) -> bool:
+        return True
+
+    def readinto(self, buffer) -> int:
+        count = self._raw.readinto(buffer)
+        if count:
+            self._hasher.update(memoryview(buffer)[:count])
+        return count
+
+    def close(self) -> None:
+        self._raw.close()
+        super().close()
+
+
+class CacheRecorder:
+    """
+    Records a deck into the cache while it is being parsed.
+
+    The source is read through a hashing reader, so the stored content hash
+    always matches the bytes that were actually parsed. The entry is only
+    installed if the source did not change while it was read.
+    """
+
+    def __init__(self, cache: "DeckCache", path: str):
+        """
+        Start recording a deck.
+
+        Args:
+            cache (DeckCache): Cache that will receive the entry.
+            path (str): Absolute path to the source deck.
+        """
+        self._cache = cache
+        self._path = path
+        self._stat = os.stat(path)
+        self._hasher = _new_hasher()
+        self._rows_path = cache.entry_path(path, ".rows")
+        self._temp_path = f"{self._rows_path}.{os.getpid()}.tmp"
+
+        os.makedirs(cache.cache_dir, exist_ok=True)
+        self._temp = open(self._temp_path, "wb")
+        self._source = None
+
+    def open_source(self) -> TextIO:
+        """Open the source deck as text, hashing its stored bytes as they are read."""
+        self._source = open(self._path, "rb")
+        buffered = io.BufferedReader(_HashingReader(self._source, self._hasher))
+        decoded = decompressing_reader(buffered, self._path)
+        return io.TextIOWrapper(decoded, encoding="utf-8")
+
+    def add(self, batch: List[List[str]]) -> None:
+        """Append a batch of parsed rows to the entry."""
+        frame = marshal.dumps(batch)
+        self._temp.write(FRAME_HEADER.pack(len(frame)))
+        self._temp.write(frame)
+
+    def commit(self) -> None:
+        """Install the entry if the source is unchanged since recording began."""
+        self._close_files()
+        stat = os.stat(self._path)
+        if (stat.st_mtime_ns, stat.st_size) != (
+            self._stat.st_mtime_ns,
+            self._stat.st_size,
+        ):
+            self.abort()
+            return
+
+        meta = {
+            "version": CACHE_VERSION,
+            "path": self._path,
+            "mtime_ns": stat.st_mtime_ns,
+            "size": stat.st_size,
+            "digest": self._hasher.hexdigest(),
+            "rows_size": os.path.getsize(self._temp_path),
+        }
+        try:
+            self._cache.install(self._path, meta, self._temp_path)
+        except OSError:
+            self.abort()
+
+    def abort(self) -> None:
+        """Discard the partially recorded entry."""
+        self._close_files()
+        try:
+            os.remove(self._temp_path)
+        except FileNotFoundError:
+            pass
+
+    def _close_files(self) -> None:
+        """Close the entry being written and the source being read."""
+        self._temp.close()
+        if self._source is not None:
+            self._source.close()
+
+
+class DeckCache:
+    """
+    Cache of parsed decks in a fast binary form, keyed by source fingerprint.
+
+    Each entry stores the parsed rows as a sequence of length-prefixed,
+    marshal-encoded batches next to a small metadata record holding the source path, mtime,
+    size and content hash. An entry is only served if the size and content
+    hash still match, so edits to the source are never masked. Entries are
+    evicted least-recently-used once the cache exceeds max_bytes.
+
+    Attributes:
+        cache_dir (str): Directory holding the cache entries.
+        max_bytes (int): Size bound for all entries together.
+    """
+
+    def __init__(self, cache_dir: str | None = None, max_bytes: int = 256 << 20):
+        """
+        Initialize the deck cache.
+
+        Args:
+            cache_dir (str | None): Cache directory, defaults to the per-user
+                cache directory.
+            max_bytes (int): Size bound for all entries together.
+        """
+        self.cache_dir = cache_dir or default_cache_dir()
+        self.max_bytes = max_bytes
+
+    def entry_path(self, path: str, suffix: str) -> str:
+        """Return the path of a cache entry file for a source deck."""
+        key = hashlib.blake2b(os.path.abspath(path).encode("utf-8"), digest_size=16)
+        return os.path.join(self.cache_dir, key.hexdigest() + suffix)
+
+    def load(self, path: str) -> Iterator[List[List[str]]] | None:
+        """
+        Return the cached batches of a deck if the entry is still valid.
+
+        Args:
+            path (str): Absolute path to the source deck.
+
+        Returns:
+            Iterator[List[List[str]]] | None: Cached row batches, or None on
+                a cache miss.
+        """
+        meta = self._read_meta(path)
+        rows_path = self.entry_path(path, ".rows")
+
+        try:
+            stat = os.stat(path)
+            valid = (
+                meta is not None
+                and meta.get("version") == CACHE_VERSION
+                and meta.get("path") == path
+                and meta.get("size") == stat.st_size
+                and meta.get("rows_size") == os.path.getsize(rows_path)
+                and meta.get("digest") == file_digest(path)
+            )
+            if valid:
+                os.utime(rows_path)  # Mark as recently used for eviction
+        except OSError:
+            valid = False
+
+        if not valid:
+            return None
+        return self._iter_batches(rows_path)
+
+    def record(self, path: str) -> CacheRecorder:
+        """
+        Start recording a freshly parsed deck.
+
+        Args:
+            path (str): Absolute path to the source deck.
+
+        Returns:
+            CacheRecorder: Recorder to feed the parsed batches to.
+        """
+        return CacheRecorder(self, path)
+
+    def install(self, path: str, meta: dict, temp_rows_path: str) -> None:
+        """
+        Atomically install a recorded entry and enforce the size bound.
+
+        The metadata is removed first and written last, so a crash never
+        leaves metadata pointing at the wrong rows.
+
+        Args:
+            path (str): Absolute path to the source deck.
+            meta (dict): Fingerprint of the recorded source.
+            temp_rows_path (str): Temporary file holding the recorded rows.
+        """
+        meta_path = self.entry_path(path, ".meta")
+        try:
+            os.remove(meta_path)
+        except FileNotFoundError:
+            pass
+
+        os.replace(temp_rows_path, self.entry_path(path, ".rows"))
+        with open(meta_path + ".tmp", "wb") as file:
+            marshal.dump(meta, file)
+        os.replace(meta_path + ".tmp", meta_path)
+
+        self._evict()
+
+    # ==========================================================
+    # Private Utilities
+    # ==========================================================
+
+    def _read_meta(self, path: str) -> dict | None:
+        """Read an entry's metadata, or None if missing or unreadable."""
+        try:
+            with open(self.entry_path(path, ".meta"), "rb") as file:
+                meta = marshal.load(file)
+        except (OSError, EOFError, ValueError, TypeError):
+            return None
+        return meta if isinstance(meta, dict) else None
+
+    @staticmethod
+    def _iter_batches(rows_path: str) -> Iterator[List[List[str]]]:
+        """Lazily decode the batches stored in an entry."""
+        try:
+            with open(rows_path, "rb") as file:
+                while True:
+                    header = file.read(FRAME_HEADER.size)
+                    if not header:
+                        return
+                    (length,) = FRAME_HEADER.unpack(header)
+                    yield marshal.loads(file.read(length))
+        except (OSError, ValueError, TypeError, EOFError, struct.error) as exc:
+            raise DataCorruptionError(f"Deck cache corrupted: {rows_path}") from exc
+
+    def _evict(self) -> None:
+        """Delete least-recently-used entries until the cache fits max_bytes."""
+        entries = []
+        for name in os.listdir(self.cache_dir):
+            if not name.endswith(".rows"):
+                continue
+            rows_path = os.path.join(self.cache_dir, name)
+            try:
+                stat = os.stat(rows_path)
+            except OSError:
+                continue
+            entries.append((stat.st_mtime, stat.st_size, rows_path))
+
+        total = sum(size for _, size, _ in entries)
+        for _, size, rows_path in sorted(entries):
+            if total <= self.max_bytes:
+                break
+            for entry in (rows_path, rows_path[: -len(".rows")] + ".meta"):
+                try:
+                    os.remove(entry)
+                except FileNotFoundError:
+                    pass
+            total -= size
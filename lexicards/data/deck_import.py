@@ -0,0 +1,310 @@
+import argparse
+import codecs
+import csv
+import os
+import sys
+import time
+import unicodedata
+from concurrent.futures import ProcessPoolExecutor
+from typing import List, NamedTuple, Sequence, Tuple
+
+from lexicards.core.fingerprint_set import FingerprintSet
+from lexicards.data.compressed_files import codec_for, open_text, strip_codec_suffix
+from lexicards.data.data_paths import resolve_data_path
+from lexicards.errors.error import DataCorruptionError, DataFileNotFoundError
+
+CHUNK_BYTES = 8 << 20
+
+
+class ImportResult(NamedTuple):
+    """Outcome of a bulk import."""
+
+    path: str
+    rows_read: int
+    rows_written: int
+    duplicates: int
+    skipped: int
+    seconds: float
+
+    @property
+    def rows_per_second(self) -> float:
+        return self.rows_read / self.seconds if self.seconds else 0.0
+
+
+def normalize(text: str) -> str:
+    """
+    Normalize a field: NFC Unicode form, trimmed, single inner spaces.
+
+    Args:
+        text (str): Raw field.
+
+    Returns:
+        str: Normalized field.
+    """
+    if not unicodedata.is_normalized("NFC", text):
+        text = unicodedata.normalize("NFC", text)
+    return " ".join(text.split())
+
+
+def delimiter_for(path: str) -> str:
+    """Return the field delimiter implied by an input file's extension."""
+    return "\t" if strip_codec_suffix(path).lower().endswith(".tsv") else ","
+
+
+def split_ranges(path: str, chunk_bytes: int = CHUNK_BYTES) -> List[Tuple[int, int]]:
+    """
+    Split a file into byte ranges of about chunk_bytes each.
+
+    Ranges are cut at arbitrary bytes; parse_range() realigns them on line
+    boundaries, so every line is parsed by exactly one range. Compressed
+    files cannot be split and form a single (0, -1) range.
+
+    Args:
+        path (str): Input file.
+        chunk_bytes (int): Target range size.
+
+    Returns:
+        List[Tuple[int, int]]: (start, end) byte offsets.
+    """
+    if codec_for(path) is not None:
+        return [(0, -1)]
+
+    size = os.path.getsize(path)
+    return [
+        (start, min(start + chunk_bytes, size))
+        for start in range(0, max(size, 1), chunk_bytes)
+    ]
+
+
+def parse_range(
+    path: str, start: int, end: int, delimiter: str, has_header: bool
+) -> Tuple[List[Tuple[str, str]], int]:
+    """
+    Parse and normalize the lines that start inside a byte range.
+
+    Runs in a worker process. A line belongs to the range holding its first
+    byte: a range starting mid-line skips ahead to the next line, and the
+    last line is read past end to its newline. Records must not span lines.
+
+    Args:
+        path (str): Input file.
+        start (int): First byte of the range.
+        end (int): End of the range (exclusive), or -1 for the whole file.
+        delimiter (str): Field delimiter.
+        has_header (bool): Whether the file starts with a header line.
+
+    Returns:
+        Tuple[List[Tuple[str, str]], int]: Normalized (word, meaning) pairs
+            in file order, and the number of skipped records.
+    """
+    if end < 0:
+        with open_text(path, "r") as file:
+            lines = file.read().splitlines()
+        if has_header:
+            lines = lines[1:]
+    else:
+        lines = _read_lines(path, start, end, has_header)
+
+    entries = []
+    skipped = 0
+    for row in csv.reader(lines, delimiter=delimiter):
+        if len(row) < 2:
+            skipped += bool(row)
+            continue
+        word, meaning = normalize(row[0]), normalize(row[1])
+        if word and meaning:
+            entries.append((word, meaning))
+        else:
+            skipped += 1
+    return entries, skipped
+
+
+def _read_lines(path: str, start: int, end: int, has_header: bool) -> List[str]:
+    """Read the lines that start inside a byte range of a plain file."""
+    with open(path, "rb") as file:
+        if start > 0:
+            file.seek(start - 1)
+            file.readline()  # Finish the line owned by the previous range
+        else:
+            if file.read(len(codecs.BOM_UTF8)) != codecs.BOM_UTF8:
+                file.seek(0)
+            if has_header:
+                file.readline()
+
+        lines = []
+        while file.tell() < end:
+            line = file.readline()
+            if not line:
+                break
+            lines.append(line.decode("utf-8"))
+    return lines
+
+
+def read_header(path: str, delimiter: str) -> List[str]:
+    """Read and normalize the header line of an input file."""
+    with open_text(path, "r") as file:
+        header = next(csv.reader(file, delimiter=delimiter), [])
+    header = [normalize(field.lstrip("\ufeff")) for field in header[:2]]
+    if len(header) < 2:
+        raise DataCorruptionError(f"Input has no two-column header: {path}")
+    return header
+
+
+def import_deck(
+    inputs: Sequence[str],
+    output: str,
+    header: Sequence[str] | None = None,
+    has_header: bool = True,
+    workers: int | None = None,
+    chunk_bytes: int = CHUNK_BYTES,
+    compact_index: bool = False,
+) -> ImportResult:
+    """
+    Build a deck file from large CSV/TSV dumps using a process pool.
+
+    Each input is split into byte ranges that are parsed and normalized in
+    parallel. Entries are deduplicated on the word (first occurrence wins)
+    and written as a CSV deck the CSVDataRetriever family reads; '.gz' and
+    '.xz' outputs are compressed.
+
+    Args:
+        inputs (Sequence[str]): Input files; '.tsv' files are tab-separated.
+        output (str): Deck file to write (stored under the data directory).
+        header (Sequence[str] | None): Deck header, defaults to the first
+            input's header line.
+        has_header (bool): Whether the inputs start with a header line.
+        workers (int | None): Worker processes, defaults to the CPU count.
+        chunk_bytes (int): Byte range size per parse task.
+        compact_index (bool): Deduplicate with a FingerprintSet, about a
+            third of the memory of a set of str but slower per row.
+
+    Returns:
+        ImportResult: Row counts and elapsed time.
+
+    Raises:
+        ValueError: If no header is given for headerless inputs.
+        DataFileNotFoundError: If an input file does not exist.
+        DataCorruptionError: If an input file cannot be parsed.
+    """
+    started = time.perf_counter()
+    for path in inputs:
+        if not os.path.isfile(path):
+            raise DataFileNotFoundError(f"File not found: {path}")
+
+    if header is None:
+        if not has_header or not inputs:
+            raise ValueError("A header is required for headerless inputs.")
+        header = read_header(inputs[0], delimiter_for(inputs[0]))
+
+    tasks = [
+        (path, start, end, delimiter_for(path), has_header)
+        for path in inputs
+        for start, end in split_ranges(path, chunk_bytes)
+    ]
+
+    output = resolve_data_path(output)
+    temp_path = output + ".tmp"
+    seen = FingerprintSet() if compact_index else set()
+    rows_read = rows_written = skipped = 0
+
+    try:
+        with ProcessPoolExecutor(max_workers=workers) as pool:
+            with open_text(temp_path, "w", codec_path=output) as target:
+                writer = csv.writer(target)
+                writer.writerow(list(header)[:2])
+
+                # map() keeps input order, so the first occurrence wins
+                for entries, bad in pool.map(_parse_task, tasks):
+                    skipped += bad
+                    rows_read += len(entries) + bad
+                    for word, meaning in entries:
+                        if word in seen:
+                            continue
+                        seen.add(word)
+                        writer.writerow([word, meaning])
+                        rows_written += 1
+    except (csv.Error, UnicodeDecodeError) as exc:
+        _discard(temp_path)
+        raise DataCorruptionError(f"Cannot parse import input: {exc}") from exc
+    except BaseException:
+        _discard(temp_path)
+        raise
+
+    os.replace(temp_path, output)
+    return ImportResult(
+        path=output,
+        rows_read=rows_read,
+        rows_written=rows_written,
+        duplicates=rows_read - rows_written - skipped,
+        skipped=skipped,
+        seconds=time.perf_counter() - started,
+    )
+
+
+def _parse_task(task: tuple) -> Tuple[List[Tuple[str, str]], int]:
+    """Unpack a parse task for ProcessPoolExecutor.map()."""
+    return parse_range(*task)
+
+
+def _discard(path: str) -> None:
+    """Delete a temporary file if it exists."""
+    try:
+        os.remove(path)
+    except FileNotFoundError:
+        pass
+
+
+def _parse_args(argv: Sequence[str] | None) -> argparse.Namespace:
+    """Parse the command line of the import command."""
+    parser = argparse.ArgumentParser(
+        prog="taskon-import",
+        description="Build a LexiCards deck from large CSV/TSV dumps.",
+    )
+    parser.add_argument("inputs", nargs="+", help="CSV or TSV files to import")
+    parser.add_argument(
+        "-o", "--output", required=True, help="deck file, e.g. spanish_words.csv"
+    )
+    parser.add_argument(
+        "--header", nargs=2, metavar=("FOREIGN", "NATIVE"), help="deck header"
+    )
+    parser.add_argument(
+        "--no-header", action="store_true", help="inputs have no header line"
+    )
+    parser.add_argument("-j", "--workers", type=int, help="worker processes")
+    parser.add_argument(
+        "--compact-index",
+        action="store_true",
+        help="deduplicate in less memory, more slowly",
+    )
+    parser.add_argument(
+        "--chunk-mb", type=float, default=CHUNK_BYTES / 2**20, help="range size"
+    )
+    return parser.parse_args(argv)
+
+
+def main(argv: Sequence[str] | None = None):
+    args = _parse_args(argv)
+    try:
+        result = import_deck(
+            args.inputs,
+            args.output,
+            header=args.header,
+            has_header=not args.no_header,
+            workers=args.workers,
+            chunk_bytes=max(1, int(args.chunk_mb * 2**20)),
+            compact_index=args.compact_index,
+        )
+    except (ValueError, DataFileNotFoundError, DataCorruptionError) as exc:
+        print(f"Import failed: {exc}", file=sys.stderr)
+        sys.exit(1)
+
+    print(
+        f"Imported {result.rows_written} cards into {result.path}"
+        f" ({result.duplicates} duplicates, {result.skipped} skipped)"
+        f" from {result.rows_read} rows in {result.seconds:.2f} s"
+        f" ({result.rows_per_second:,.0f} rows/s)"
+    )
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,95 @@
+import os
+import threading
+from typing import Callable, Tuple
+
+
+def file_signature(path: str) -> Tuple[int, int, int] | None:
+    """
+    Return the (inode, mtime_ns, size) signature of a file.
+
+    Atomic replacements (temp file + rename) change the inode even when the
+    mtime resolution hides the edit, so all three are compared.
+
+    Args:
+        path (str): File to inspect.
+
+    Returns:
+        Tuple[int, int, int] | None: Signature, or None if the file is missing.
+    """
+    try:
+        stat = os.stat(path)
+    except OSError:
+        return None
+    return stat.st_ino, stat.st_mtime_ns, stat.st_size
+
+
+class FileWatcher:
+    """
+    Polls a file's inode, mtime and size and reports changes.
+
+    Uses plain os.stat polling on a daemon thread, so it needs no platform
+    notification service.
+
+    Attributes:
+        path (str): Watched file.
+        interval (float): Seconds between polls.
+        last_error (Exception | None): Last exception raised by the callback.
+    """
+
+    def __init__(self, path: str, on_change: Callable[[], None], interval: float = 1.0):
+        """
+        Initialize the watcher with the file's current signature.
+
+        Args:
+            path (str): File to watch.
+            on_change (Callable[[], None]): Called on the watcher thread after
+                each detected change.
+            interval (float): Seconds between polls.
+        """
+        self.path = path
+        self.interval = interval
+        self.last_error = None
+        self._on_change = on_change
+        self._signature = file_signature(path)
+        self._stopped = threading.Event()
+        self._thread = None
+
+    def start(self) -> "FileWatcher":
+        """Start polling on a daemon thread."""
+        self._thread = threading.Thread(
+            target=self._run, name="lexicards-watcher", daemon=True
+        )
+        self._thread.start()
+        return self
+
+    def stop(self) -> None:
+        """Stop polling and wait for the thread to exit."""
+        self._stopped.set()
+        if self._thread is not None:
+            self._thread.join()
+
+    def check(self) -> bool:
+        """
+        Poll once and run the callback if the file changed.
+
+        A missing file is not reported; the change is picked up once the
+        file reappears.
+
+        Returns:
+            bool: True if a change was reported.
+        """
+        signature = file_signature(self.path)
+        if signature is None or signature == self._signature:
+            return False
+
+        self._signature = signature
+        try:
+            self._on_change()
+        except Exception as exc:
+            self.last_error = exc
+        return True
+
+    def _run(self) -> None:
+        """Poll until stopped."""
+        while not self._stopped.wait(self.interval):
+            self.check()
@@ -0,0 +1,319 @@
+import argparse
+import csv
+import heapq
+import os
+import sys
+import tempfile
+from typing import Iterator, List, NamedTuple, Sequence, Tuple
+
+from lexicards.core.fingerprint_set import FingerprintSet
+from lexicards.data.compressed_files import open_text
+from lexicards.data.data_paths import deck_state_path, resolve_data_path
+from lexicards.data.data_writer import rewrite_csv_without
+from lexicards.errors.error import DataCorruptionError, DataFileNotFoundError
+
+MAX_ROWS = 100_000
+FAN_IN = 64
+
+
+class ConsolidationResult(NamedTuple):
+    """Outcome of a history consolidation."""
+
+    known_rows: int
+    unknown_rows: int
+    overlap: int
+    removed_from_deck: int
+
+
+# ==========================================================
+# External merge sort
+# ==========================================================
+
+
+def external_sort(
+    path: str,
+    output: str,
+    max_rows: int = MAX_ROWS,
+    fan_in: int = FAN_IN,
+    temp_dir: str | None = None,
+) -> int:
+    """
+    Sort a CSV file by word and drop duplicate words, in bounded memory.
+
+    At most max_rows rows are held in memory: the input is cut into sorted
+    runs on disk, which are then merged fan_in at a time. Sorting and
+    merging are stable, so the first occurrence of a word is kept. The
+    header row stays first. Output replaces its target atomically, so output
+    may be the input file itself.
+
+    Args:
+        path (str): CSV file to sort.
+        output (str): Sorted, deduplicated CSV file to write.
+        max_rows (int): Rows per in-memory run.
+        fan_in (int): Runs merged per pass.
+        temp_dir (str | None): Directory for run files, defaults to the
+            output's directory.
+
+    Returns:
+        int: Number of rows written, header excluded.
+
+    Raises:
+        DataFileNotFoundError: If the file does not exist.
+        DataCorruptionError: If the file cannot be read.
+    """
+    if not os.path.isfile(path):
+        raise DataFileNotFoundError(f"File not found: {path}")
+
+    temp_dir = temp_dir or os.path.dirname(os.path.abspath(output))
+    with tempfile.TemporaryDirectory(dir=temp_dir, prefix=".merge-") as work_dir:
+        header, runs = _write_runs(path, work_dir, max(1, max_rows))
+        while len(runs) > fan_in:
+            runs = [
+                _merge_to_run(runs[start : start + fan_in], work_dir)
+                for start in range(0, len(runs), fan_in)
+            ]
+
+        temp_path = output + ".tmp"
+        written = 0
+        with open_text(temp_path, "w", codec_path=output) as target:
+            writer = csv.writer(target)
+            if header is not None:
+                writer.writerow(header)
+            with _open_runs(runs) as readers:
+                for row in _unique(heapq.merge(*readers, key=_word)):
+                    writer.writerow(row)
+                    written += 1
+        os.replace(temp_path, output)
+    return written
+
+
+def _word(row: List[str]) -> str:
+    """Sort key of a row: its word."""
+    return row[0]
+
+
+def _unique(rows: Iterator[List[str]]) -> Iterator[List[str]]:
+    """Keep the first of each run of rows sharing a word."""
+    previous = None
+    for row in rows:
+        if row[0] != previous:
+            previous = row[0]
+            yield row
+
+
+def _write_runs(
+    path: str, work_dir: str, max_rows: int
+) -> Tuple[List[str] | None, List[str]]:
+    """
+    Cut a CSV file into sorted, deduplicated run files.
+
+    Returns:
+        Tuple[List[str] | None, List[str]]: Header row and run file paths.
+
+    Raises:
+        DataCorruptionError: If the file cannot be read.
+    """
+    runs = []
+    try:
+        with open_text(path, "r") as source:
+            reader = csv.reader(source)
+            header = next(reader, None)
+            chunk = []
+            for row in reader:
+                if len(row) < 2:
+                    continue
+                chunk.append(row)
+                if len(chunk) >= max_rows:
+                    runs.append(_write_run(chunk, work_dir))
+                    chunk = []
+            if chunk or not runs:
+                runs.append(_write_run(chunk, work_dir))
+    except (OSError, csv.Error) as exc:
+        raise DataCorruptionError(f"Cannot read history file: {path}") from exc
+    return header, runs
+
+
+def _write_run(rows: List[List[str]], work_dir: str) -> str:
+    """Sort rows in memory and write them as one run file."""
+    rows.sort(key=_word)
+    return _write_rows(_unique(iter(rows)), work_dir)
+
+
+def _merge_to_run(runs: List[str], work_dir: str) -> str:
+    """Merge run files into one run file and delete them."""
+    with _open_runs(runs) as readers:
+        merged = _write_rows(_unique(heapq.merge(*readers, key=_word)), work_dir)
+    for run in runs:
+        os.remove(run)
+    return merged
+
+
+def _write_rows(rows: Iterator[List[str]], work_dir: str) -> str:
+    """Write rows to a new run file and return its path."""
+    handle, run_path = tempfile.mkstemp(dir=work_dir, suffix=".run")
+    with open(handle, "w", encoding="utf-8", newline="") as file:
+        csv.writer(file).writerows(rows)
+    return run_path
+
+
+class _open_runs:
+    """Context manager opening run files as CSV readers."""
+
+    def __init__(self, runs: List[str]):
+        self._files = [open(run, "r", encoding="utf-8", newline="") for run in runs]
+
+    def __enter__(self) -> List[Iterator[List[str]]]:
+        return [csv.reader(file) for file in self._files]
+
+    def __exit__(self, *exc_info) -> None:
+        for file in self._files:
+            file.close()
+
+
+# ==========================================================
+# Consolidation
+# ==========================================================
+
+
+def consolidate_history(
+    known_file: str = "known_words.csv",
+    unknown_file: str = "unknown_words.csv",
+    deck_file: str | None = "japanese_words.csv",
+    report_file: str | None = None,
+    max_rows: int = MAX_ROWS,
+) -> ConsolidationResult:
+    """
+    Merge, deduplicate and sort the known/unknown histories in place.
+
+    Both files are external-merge sorted by word. Known words still present
+    in the source deck (removals lost before they were flushed) are removed
+    from the deck, and words found in both histories are listed in a report.
+    Run it while the application is closed.
+
+    Args:
+        known_file (str): Known-words history (stored under the data directory).
+        unknown_file (str): Unknown-words history.
+        deck_file (str | None): Source deck to reconcile, or None to skip.
+        report_file (str | None): CSV report of words in both histories,
+            defaults to 'known_and_unknown_report.csv' in the working directory.
+        max_rows (int): Rows held in memory per sorted run.
+
+    Returns:
+        ConsolidationResult: Row counts of the consolidated files.
+
+    Raises:
+        DataCorruptionError: If a file cannot be read.
+    """
+    known_path = resolve_data_path(known_file)
+    unknown_path = resolve_data_path(unknown_file)
+    report_path = os.path.abspath(report_file or "known_and_unknown_report.csv")
+
+    known_rows = _sort_if_present(known_path, max_rows)
+    unknown_rows = _sort_if_present(unknown_path, max_rows)
+
+    overlap = 0
+    with open(report_path, "w", encoding="utf-8", newline="") as report:
+        writer = csv.writer(report)
+        writer.writerow(["word", "known meaning", "unknown meaning"])
+        for known, unknown in _join(known_path, unknown_path):
+            writer.writerow([known[0], known[1], unknown[1]])
+            overlap += 1
+
+    removed = 0
+    if deck_file is not None:
+        removed = _reconcile_deck(resolve_data_path(deck_file), known_path, max_rows)
+
+    return ConsolidationResult(known_rows, unknown_rows, overlap, removed)
+
+
+def _sort_if_present(path: str, max_rows: int) -> int:
+    """External-sort a history file in place if it exists."""
+    if not os.path.isfile(path):
+        return 0
+    return external_sort(path, path, max_rows)
+
+
+def _sorted_rows(path: str) -> Iterator[List[str]]:
+    """Stream the rows of a sorted CSV file, header skipped."""
+    if not os.path.isfile(path):
+        return
+    with open_text(path, "r") as file:
+        reader = csv.reader(file)
+        next(reader, None)
+        yield from reader
+
+
+def _join(left: str, right: str) -> Iterator[Tuple[List[str], List[str]]]:
+    """Merge-join two word-sorted, deduplicated CSV files on the word."""
+    right_rows = _sorted_rows(right)
+    other = next(right_rows, None)
+    for row in _sorted_rows(left):
+        while other is not None and other[0] < row[0]:
+            other = next(right_rows, None)
+        if other is None:
+            return
+        if other[0] == row[0]:
+            yield row, other
+
+
+def _reconcile_deck(deck_path: str, known_path: str, max_rows: int) -> int:
+    """Remove known words that are still in the deck; return how many."""
+    if not os.path.isfile(deck_path):
+        return 0
+
+    with tempfile.TemporaryDirectory(dir=os.path.dirname(deck_path)) as work_dir:
+        sorted_deck = os.path.join(work_dir, "deck.csv")
+        external_sort(deck_path, sorted_deck, max_rows, temp_dir=work_dir)
+        stale = FingerprintSet(row[0] for row, _ in _join(sorted_deck, known_path))
+
+    if stale:
+        rewrite_csv_without(deck_path, stale)
+    return len(stale)
+
+
+def _parse_args(argv: Sequence[str] | None) -> argparse.Namespace:
+    """Parse the command line of the consolidation command."""
+    parser = argparse.ArgumentParser(
+        prog="taskon-consolidate",
+        description="Merge, deduplicate and sort the known/unknown histories.",
+    )
+    parser.add_argument("--known", help="known words (default: <deck>.known_words.csv)")
+    parser.add_argument(
+        "--unknown", help="unknown words (default: <deck>.unknown_words.csv)"
+    )
+    parser.add_argument(
+        "--deck", default="japanese_words.csv", help="source deck to reconcile"
+    )
+    parser.add_argument(
+        "--no-deck", action="store_true", help="do not touch the source deck"
+    )
+    parser.add_argument("--report", help="report of words in both histories")
+    parser.add_argument(
+        "--max-rows", type=int, default=MAX_ROWS, help="rows per in-memory run"
+    )
+    return parser.parse_args(argv)
+
+
+def main(argv: Sequence[str] | None = None):
+    args = _parse_args(argv)
+    try:
+        result = consolidate_history(
+            args.known or deck_state_path(args.deck, "known_words.csv"),
+            args.unknown or deck_state_path(args.deck, "unknown_words.csv"),
+            None if args.no_deck else args.deck,
+            args.report,
+            args.max_rows,
+        )
+    except (DataFileNotFoundError, DataCorruptionError) as exc:
+        print(f"Consolidation failed: {exc}", file=sys.stderr)
+        sys.exit(1)
+
+    print(
+        f"Known: {result.known_rows} words, unknown: {result.unknown_rows} words,"
+        f" in both: {result.overlap},"
+        f" removed from deck: {result.removed_from_deck}"
+    )
+
+
+if __name__ == "__main__":
+    main()
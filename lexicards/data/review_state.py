@@ -0,0 +1,87 @@
+import marshal
+import os
+from array import array
+from typing import Dict, NamedTuple
+
+from lexicards.errors.error import DataCorruptionError
+
+# Leading bytes of a review state file; bump the digit when the layout changes
+MAGIC = b"LXSRS1\n"
+
+
+class ReviewState(NamedTuple):
+    """Spaced-repetition state of one card."""
+
+    due: float
+    interval: float
+    ease: float
+    reps: int
+
+
+def save_review_state(path: str, states: Dict[str, ReviewState]) -> None:
+    """
+    Write review states to a compact binary file, atomically.
+
+    The states are stored column-wise: one marshal-encoded list of words
+    plus the raw bytes of typed arrays for due times, intervals, ease
+    factors and repetition counts, so loading is a single marshal.loads
+    and four array copies instead of per-card parsing.
+
+    Args:
+        path (str): Path of the state file.
+        states (Dict[str, ReviewState]): Review state of each card by word.
+    """
+    words = list(states)
+    columns = (
+        array("d", (states[word].due for word in words)),
+        array("d", (states[word].interval for word in words)),
+        array("f", (states[word].ease for word in words)),
+        array("H", (min(states[word].reps, 0xFFFF) for word in words)),
+    )
+    payload = marshal.dumps((words, *(column.tobytes() for column in columns)))
+
+    temp_path = path + ".tmp"
+    with open(temp_path, "wb") as file:
+        file.write(MAGIC)
+        file.write(payload)
+    os.replace(temp_path, path)
+
+
+def load_review_state(path: str) -> Dict[str, ReviewState]:
+    """
+    Read review states written by save_review_state.
+
+    Args:
+        path (str): Path of the state file.
+
+    Returns:
+        Dict[str, ReviewState]: Review state of each card by word, empty if
+        the file does not exist yet.
+
+    Raises:
+        DataCorruptionError: If the file is not a valid review state file.
+    """
+    try:
+        with open(path, "rb") as file:
+            data = file.read()
+    except FileNotFoundError:
+        return {}
+
+    if not data.startswith(MAGIC):
+        raise DataCorruptionError(f"Not a review state file: {path}")
+    try:
+        words, *raw_columns = marshal.loads(data[len(MAGIC) :])
+        columns = []
+        for typecode, raw in zip("ddfH", raw_columns):
+            column = array(typecode)
+            column.frombytes(raw)
+            columns.append(column)
+    except (EOFError, ValueError, TypeError) as exc:
+        raise DataCorruptionError(f"Corrupted review state file: {path}") from exc
+
+    if len(columns) != 4 or any(len(column) != len(words) for column in columns):
+        raise DataCorruptionError(f"Corrupted review state file: {path}")
+    return {
+        word: ReviewState(due, interval, ease, reps)
+        for word, due, interval, ease, reps in zip(words, *columns)
+    }
@@ -0,0 +1,264 @@
+import marshal
+import os
+import struct
+import threading
+import time
+from typing import Dict, Iterator, Set, Tuple
+
+from lexicards.errors.error import DataCorruptionError
+
+KNOWN = 1
+UNKNOWN = 2
+
+# Log file header: magic and generation; each event: kind, time, text lengths
+LOG_MAGIC = b"LXLOG1\n"
+LOG_HEADER = struct.Struct("<Q")
+LOG_HEADER_SIZE = len(LOG_MAGIC) + LOG_HEADER.size
+EVENT_HEADER = struct.Struct("<BdHH")
+SNAPSHOT_MAGIC = b"LXSNP1\n"
+
+
+def _field_bytes(text: str) -> bytes:
+    """Encode a record field, cut to 0xFFFF bytes on a character boundary."""
+    data = text.encode("utf-8")
+    if len(data) > 0xFFFF:
+        data = data[:0xFFFF].decode("utf-8", "ignore").encode("utf-8")
+    return data
+
+
+class SessionState:
+    """
+    Learning progress rebuilt from the session log.
+
+    Attributes:
+        known (Set[str]): Words marked as known.
+        missed (Dict[str, int]): Number of times each word was marked unknown.
+        events (int): Number of events folded into the state.
+    """
+
+    __slots__ = ("known", "missed", "events")
+
+    def __init__(self):
+        self.known: Set[str] = set()
+        self.missed: Dict[str, int] = {}
+        self.events = 0
+
+    def apply(self, kind: int, word: str) -> None:
+        """
+        Fold one event into the state.
+
+        Args:
+            kind (int): KNOWN or UNKNOWN.
+            word (str): Word the event is about.
+        """
+        if kind == KNOWN:
+            self.known.add(word)
+        elif kind == UNKNOWN:
+            self.missed[word] = self.missed.get(word, 0) + 1
+        self.events += 1
+
+
+class SessionLog:
+    """
+    Append-only log of session events with periodic snapshots.
+
+    Every mark as known/unknown appends one small binary record. Every
+    snapshot_every events the folded SessionState is written to a snapshot
+    file and the log restarts empty under the next generation number, so
+    restore() reads one snapshot and replays only the events since then.
+    A crash between writing the snapshot and restarting the log is detected
+    by the generation numbers; a torn last record is dropped.
+
+    Attributes:
+        path (str): Path of the log file; the snapshot sits next to it.
+        snapshot_every (int): Events between snapshots.
+        state (SessionState): Current state, once restored.
+    """
+
+    def __init__(self, path: str, snapshot_every: int = 500):
+        """
+        Initialize the log; call restore() before appending.
+
+        Args:
+            path (str): Path of the log file.
+            snapshot_every (int): Events between snapshots.
+        """
+        self.path = path
+        self.snapshot_path = path + ".snapshot"
+        self.snapshot_every = snapshot_every
+        self.state = SessionState()
+        self._generation = 0
+        self._since_snapshot = 0
+        self._file = None
+        self._lock = threading.Lock()
+
+    def restore(self) -> SessionState:
+        """
+        Load the latest snapshot and replay the log written after it.
+
+        Returns:
+            SessionState: Restored state.
+
+        Raises:
+            DataCorruptionError: If the snapshot or log header is corrupted.
+        """
+        with self._lock:
+            self.state, self._generation = self._read_snapshot()
+            if self._read_log_generation() != self._generation:
+                # No log yet, or one already folded into the snapshot
+                self._start_log()
+                return self.state
+
+            end = LOG_HEADER_SIZE
+            for kind, word, end in self._iter_events():
+                self.state.apply(kind, word)
+                self._since_snapshot += 1
+
+            # Drop a torn record left by a crash
+            self._file = open(self.path, "r+b")
+            self._file.truncate(end)
+            self._file.seek(end)
+            return self.state
+
+    def append(self, kind: int, word: str, meaning: str) -> None:
+        """
+        Record an event and fold it into the state.
+
+        Args:
+            kind (int): KNOWN or UNKNOWN.
+            word (str): Word of the card.
+            meaning (str): Meaning of the card.
+        """
+        word_bytes = _field_bytes(word)
+        meaning_bytes = _field_bytes(meaning)
+        record = (
+            EVENT_HEADER.pack(kind, time.time(), len(word_bytes), len(meaning_bytes))
+            + word_bytes
+            + meaning_bytes
+        )
+        with self._lock:
+            if self._file is None:
+                raise RuntimeError("SessionLog.restore() must be called first.")
+            self._file.write(record)
+            self._file.flush()
+            self.state.apply(kind, word)
+            self._since_snapshot += 1
+            if self._since_snapshot >= self.snapshot_every:
+                self._snapshot()
+
+    def forget_known(self, words: Set[str]) -> None:
+        """
+        Drop known words whose removal reached the deck, and snapshot.
+
+        Args:
+            words (Set[str]): Known words no longer in the deck.
+        """
+        with self._lock:
+            self.state.known -= words
+            self._snapshot()
+
+    def snapshot(self) -> None:
+        """Write a snapshot now and restart the log."""
+        with self._lock:
+            self._snapshot()
+
+    def close(self) -> None:
+        """Close the log file."""
+        with self._lock:
+            if self._file is not None:
+                self._file.close()
+                self._file = None
+
+    # ==========================================================
+    # Private Utilities
+    # ==========================================================
+
+    def _snapshot(self) -> None:
+        """Persist the state under the next generation and empty the log."""
+        payload = marshal.dumps(
+            (
+                self._generation + 1,
+                list(self.state.known),
+                self.state.missed,
+                self.state.events,
+            )
+        )
+        temp_path = self.snapshot_path + ".tmp"
+        with open(temp_path, "wb") as file:
+            file.write(SNAPSHOT_MAGIC)
+            file.write(payload)
+        os.replace(temp_path, self.snapshot_path)
+
+        self._generation += 1
+        self._start_log()
+
+    def _start_log(self) -> None:
+        """Replace the log with an empty one of the current generation."""
+        if self._file is not None:
+            self._file.close()
+        self._file = open(self.path, "wb")
+        self._file.write(LOG_MAGIC + LOG_HEADER.pack(self._generation))
+        self._file.flush()
+        self._since_snapshot = 0
+
+    def _read_snapshot(self) -> Tuple[SessionState, int]:
+        """Return the snapshot's state and generation, or an empty state."""
+        state = SessionState()
+        try:
+            with open(self.snapshot_path, "rb") as file:
+                data = file.read()
+        except FileNotFoundError:
+            return state, 0
+
+        if not data.startswith(SNAPSHOT_MAGIC):
+            raise DataCorruptionError(f"Not a session snapshot: {self.snapshot_path}")
+        try:
+            generation, known, missed, events = marshal.loads(
+                data[len(SNAPSHOT_MAGIC) :]
+            )
+        except (EOFError, ValueError, TypeError) as exc:
+            raise DataCorruptionError(
+                f"Corrupted session snapshot: {self.snapshot_path}"
+            ) from exc
+        state.known = set(known)
+        state.missed = missed
+        state.events = events
+        return state, generation
+
+    def _read_log_generation(self) -> int | None:
+        """Return the generation of the log file, or None if there is none."""
+        try:
+            with open(self.path, "rb") as file:
+                header = file.read(LOG_HEADER_SIZE)
+        except FileNotFoundError:
+            return None
+        if len(header) < LOG_HEADER_SIZE:
+            return None
+        if not header.startswith(LOG_MAGIC):
+            raise DataCorruptionError(f"Not a session log: {self.path}")
+        return LOG_HEADER.unpack_from(header, len(LOG_MAGIC))[0]
+
+    def _iter_events(self) -> Iterator[Tuple[int, str, int]]:
+        """
+        Yield (kind, word, end offset) for every complete log record.
+
+        Raises:
+            DataCorruptionError: If a word is not valid UTF-8.
+        """
+        with open(self.path, "rb") as file:
+            data = file.read()
+        offset = LOG_HEADER_SIZE
+        while offset + EVENT_HEADER.size <= len(data):
+            kind, _, word_size, meaning_size = EVENT_HEADER.unpack_from(data, offset)
+            end = offset + EVENT_HEADER.size + word_size + meaning_size
+            if end > len(data):
+                break
+            start = offset + EVENT_HEADER.size
+            try:
+                word = data[start : start + word_size].decode("utf-8")
+            except UnicodeDecodeError as exc:
+                raise DataCorruptionError(
+                    f"Corrupted session log record at byte {offset}: {self.path}"
+                ) from exc
+            yield kind, word, end
+            offset = end
@@ -0,0 +1,570 @@
+import atexit
+import bisect
+import csv
+import hashlib
+import json
+import os
+import sys
+import threading
+import zlib
+from concurrent.futures import Future
+from typing import Callable, Dict, Iterator, List, Tuple
+
+from lexicards.core.active_pool import ActivePool
+from lexicards.data.compressed_files import open_text, strip_codec_suffix
+from lexicards.data.data_paths import get_data_dir, resolve_data_path
+from lexicards.data.data_remover import DataRemoverFactory
+from lexicards.data.data_retriever import DataRetrieverFactory
+from lexicards.data.data_writer import BackgroundWriter
+from lexicards.errors.error import DataCorruptionError, DataFileNotFoundError
+from lexicards.interfaces.data.i_data_remove import IDataRemover
+from lexicards.interfaces.data.i_data_retriever import IDataRetriever
+from lexicards.interfaces.manager.i_word_store import IWordStore
+from lexicards.manager.word_store import WordStore
+
+# ==========================================================
+# Sharded deck layout:
+#   <deck>.shards/manifest.json   header, hash, shard file names, row counts
+#   <deck>.shards/shard-NNN.csv   header row + the rows hashed to shard NNN
+# A row goes to shard SHARD_HASHES[hash](word) % shard count.
+# ==========================================================
+MANIFEST = "manifest.json"
+MANIFEST_VERSION = 1
+SHARDS_SUFFIX = ".shards"
+
+SHARD_HASHES: Dict[str, Callable[[str], int]] = {
+    "crc32": lambda word: zlib.crc32(word.encode("utf-8")),
+    "blake2b": lambda word: int.from_bytes(
+        hashlib.blake2b(word.encode("utf-8"), digest_size=8).digest(), "little"
+    ),
+}
+
+
+def shards_dir_for(source_path: str) -> str:
+    """
+    Return the shard directory that belongs to a CSV deck.
+
+    Args:
+        source_path (str): Path to the CSV deck.
+
+    Returns:
+        str: Path with the '.csv' (and any compression) extension replaced
+            by '.shards'.
+    """
+    return os.path.splitext(strip_codec_suffix(source_path))[0] + SHARDS_SUFFIX
+
+
+def shard_deck(
+    source_path: str,
+    shards_dir: str | None = None,
+    shards: int = 16,
+    hash_name: str = "crc32",
+) -> str:
+    """
+    Split a CSV deck into shard files plus a manifest.
+
+    The manifest is written last, so an interrupted split never leaves a
+    manifest pointing at incomplete shards.
+
+    Args:
+        source_path (str): Path to the CSV deck.
+        shards_dir (str | None): Output directory, defaults to the deck path
+            with a '.shards' extension.
+        shards (int): Number of shard files.
+        hash_name (str): Row-to-shard hash, a key of SHARD_HASHES.
+
+    Returns:
+        str: Path to the shard directory.
+
+    Raises:
+        ValueError: If the shard count or hash name is invalid.
+        DataFileNotFoundError: If the CSV file does not exist.
+        DataCorruptionError: If the CSV file cannot be read.
+    """
+    if shards < 1:
+        raise ValueError("A sharded deck needs at least one shard.")
+    if hash_name not in SHARD_HASHES:
+        raise ValueError(f"Unknown shard hash: {hash_name}")
+    if not os.path.isfile(source_path):
+        raise DataFileNotFoundError(f"File not found: {source_path}")
+
+    shards_dir = shards_dir or shards_dir_for(source_path)
+    os.makedirs(shards_dir, exist_ok=True)
+    _remove_manifest(shards_dir)
+
+    shard_hash = SHARD_HASHES[hash_name]
+    files = [f"shard-{index:03d}.csv" for index in range(shards)]
+    counts = [0] * shards
+
+    try:
+        with open_text(source_path, "r") as source:
+            reader = csv.reader(source)
+            header = next(reader, None)
+            if not header or len(header) < 2:
+                raise DataCorruptionError(f"CSV has no header: {source_path}")
+
+            targets = [
+                open(os.path.join(shards_dir, name), "w", encoding="utf-8", newline="")
+                for name in files
+            ]
+            try:
+                writers = [csv.writer(target) for target in targets]
+                for writer in writers:
+                    writer.writerow(header)
+                for row in reader:
+                    if len(row) < 2:
+                        continue
+                    index = shard_hash(row[0]) % shards
+                    writers[index].writerow(row)
+                    counts[index] += 1
+            finally:
+                for target in targets:
+                    target.close()
+    except csv.Error as exc:
+        raise DataCorruptionError(f"CSV corrupted in {source_path}") from exc
+
+    _write_manifest(
+        shards_dir,
+        {
+            "version": MANIFEST_VERSION,
+            "header": header[:2],
+            "hash": hash_name,
+            "files": files,
+            "counts": counts,
+        },
+    )
+    return shards_dir
+
+
+def read_manifest(shards_dir: str) -> dict:
+    """
+    Read and validate a shard directory's manifest.
+
+    Args:
+        shards_dir (str): Path to the shard directory.
+
+    Returns:
+        dict: Manifest with header, hash, files and counts.
+
+    Raises:
+        DataFileNotFoundError: If the manifest does not exist.
+        DataCorruptionError: If the manifest is invalid.
+    """
+    path = os.path.join(shards_dir, MANIFEST)
+    try:
+        with open(path, "r", encoding="utf-8") as file:
+            manifest = json.load(file)
+    except FileNotFoundError as exc:
+        raise DataFileNotFoundError(f"File not found: {path}") from exc
+    except (OSError, ValueError) as exc:
+        raise DataCorruptionError(f"Shard manifest corrupted: {path}") from exc
+
+    if (
+        not isinstance(manifest, dict)
+        or manifest.get("version") != MANIFEST_VERSION
+        or manifest.get("hash") not in SHARD_HASHES
+        or len(manifest.get("files", ())) != len(manifest.get("counts", ()))
+        or not manifest.get("files")
+    ):
+        raise DataCorruptionError(f"Shard manifest corrupted: {path}")
+    return manifest
+
+
+def _write_manifest(shards_dir: str, manifest: dict) -> None:
+    """Atomically replace a shard directory's manifest."""
+    path = os.path.join(shards_dir, MANIFEST)
+    with open(path + ".tmp", "w", encoding="utf-8") as file:
+        json.dump(manifest, file, ensure_ascii=False)
+    os.replace(path + ".tmp", path)
+
+
+def _remove_manifest(shards_dir: str) -> None:
+    """Delete a shard directory's manifest if it exists."""
+    try:
+        os.remove(os.path.join(shards_dir, MANIFEST))
+    except FileNotFoundError:
+        pass
+
+
+def _read_shard(path: str) -> List[List[str]]:
+    """
+    Parse one shard file, header row first.
+
+    Raises:
+        DataCorruptionError: If the shard cannot be read.
+    """
+    try:
+        with open(path, "r", encoding="utf-8", newline="") as file:
+            return [row for row in csv.reader(file) if len(row) >= 2]
+    except (OSError, csv.Error) as exc:
+        raise DataCorruptionError(f"Shard corrupted: {path}") from exc
+
+
+# --------------------------
+# Lazily Loaded Deck
+# --------------------------
+class ShardedDeck(IWordStore):
+    """
+    Word store over a sharded deck that parses shards on first access.
+
+    Row ids are global: shard k owns the ids [base[k], base[k + 1]), taken
+    from the manifest's row counts, so the ActivePool covers the whole deck
+    up front while only the shards that sampling actually reaches are read.
+
+    Attributes:
+        shards_dir (str): Path to the shard directory.
+    """
+
+    def __init__(self, shards_dir: str):
+        """
+        Open a sharded deck without loading any shard.
+
+        Args:
+            shards_dir (str): Path to the shard directory.
+
+        Raises:
+            DataFileNotFoundError: If the manifest does not exist.
+            DataCorruptionError: If the manifest is invalid.
+        """
+        self.shards_dir = shards_dir
+        manifest = read_manifest(shards_dir)
+
+        self._header = tuple(manifest["header"][:2])
+        self._files = manifest["files"]
+        self._counts = manifest["counts"]
+
+        self._bases = [0]
+        for count in self._counts:
+            self._bases.append(self._bases[-1] + count)
+
+        self._shards: Dict[int, WordStore] = {}
+        self._lock = threading.Lock()
+        self._pool = ActivePool(self._bases[-1])
+
+    @property
+    def header(self) -> Tuple[str, str]:
+        return self._header
+
+    @property
+    def loaded_shards(self) -> int:
+        """Number of shards parsed so far."""
+        return len(self._shards)
+
+    def __len__(self) -> int:
+        return len(self._pool)
+
+    def __getitem__(self, index: int) -> Tuple[str, str]:
+        """
+        Decode an active card, loading its shard on first access.
+
+        Args:
+            index (int): Position of the card among the active cards.
+
+        Returns:
+            Tuple[str, str]: (word, meaning)
+        """
+        return self.card(self._pool.row_at(index))
+
+    def pop(self, index: int = -1) -> Tuple[str, str]:
+        """
+        Remove a card from the active cards in O(1) and return it.
+
+        Args:
+            index (int): Position of the card among the active cards.
+
+        Returns:
+            Tuple[str, str]: (word, meaning) of the removed card.
+        """
+        row = self._pool.row_at(index)
+        card = self.card(row)
+        self._pool.remove_at(index)
+        return card
+
+    def row_id(self, index: int) -> int:
+        return self._pool.row_at(index)
+
+    def index_of(self, row_id: int) -> int | None:
+        return self._pool.index_of(row_id)
+
+    def card(self, row_id: int) -> Tuple[str, str]:
+        """
+        Decode a card by global row id, loading its shard on first access.
+
+        Raises:
+            IndexError: If the deck has no such row.
+        """
+        if not 0 <= row_id < self._bases[-1]:
+            raise IndexError("row id out of range")
+        shard = bisect.bisect_right(self._bases, row_id) - 1
+        return self._shard(shard).card(row_id - self._bases[shard])
+
+    def _shard(self, shard: int) -> WordStore:
+        """
+        Return a shard's cards, parsing the shard file on first use.
+
+        Raises:
+            DataCorruptionError: If the shard no longer matches the manifest.
+        """
+        store = self._shards.get(shard)
+        if store is not None:
+            return store
+
+        with self._lock:
+            store = self._shards.get(shard)
+            if store is None:
+                path = os.path.join(self.shards_dir, self._files[shard])
+                store = WordStore.from_rows(_read_shard(path))
+                if store.row_count != self._counts[shard]:
+                    raise DataCorruptionError(
+                        f"Shard out of sync with manifest: {path}"
+                    )
+                self._shards[shard] = store
+        return store
+
+
+# --------------------------
+# Concrete Data Retriever
+# --------------------------
+class ShardedDeckRetriever(IDataRetriever):
+    """
+    IDataRetriever serving a deck from its sharded layout.
+
+    The shard directory is created from the CSV deck on first use; from then
+    on the shards are the deck's storage.
+
+    Attributes:
+        filename (str): Path to the source CSV file.
+        shards_dir (str): Path to the shard directory.
+        shards (int): Shard count used when the deck is first split.
+        hash_name (str): Row-to-shard hash used when the deck is first split.
+    """
+
+    def __init__(
+        self,
+        filename: str = "japanese_words.csv",
+        shards: int = 16,
+        hash_name: str = "crc32",
+    ):
+        """
+        Initialize the retriever for a deck.
+
+        Args:
+            filename (str): Path to the CSV file. Defaults to 'japanese_words.csv'.
+            shards (int): Shard count used when the deck is first split.
+            hash_name (str): Row-to-shard hash, a key of SHARD_HASHES.
+        """
+        self.base_path = get_data_dir()
+        self.filename = resolve_data_path(filename)
+        self.shards_dir = shards_dir_for(self.filename)
+        self.shards = shards
+        self.hash_name = hash_name
+
+    def load_data(self) -> ShardedDeck:
+        """
+        Open the sharded deck, splitting the CSV first if needed.
+
+        Returns:
+            ShardedDeck: Word store that loads shards on demand.
+
+        Raises:
+            DataFileNotFoundError: If neither the CSV nor the shards exist.
+            DataCorruptionError: If the deck cannot be split or read.
+        """
+        self._ensure_shards()
+        return ShardedDeck(self.shards_dir)
+
+    def iter_rows(self, batch_size: int = 1000) -> Iterator[List[List[str]]]:
+        """
+        Stream rows shard by shard, holding one shard in memory at a time.
+
+        Args:
+            batch_size (int): Maximum number of rows per batch.
+
+        Yields:
+            List[List[str]]: Next batch of word entries, header row first.
+        """
+        self._ensure_shards()
+        manifest = read_manifest(self.shards_dir)
+        batch = [list(manifest["header"])]
+        for name in manifest["files"]:
+            for row in _read_shard(os.path.join(self.shards_dir, name))[1:]:
+                if len(batch) >= batch_size:
+                    yield batch
+                    batch = []
+                batch.append(row)
+        yield batch
+
+    def _ensure_shards(self) -> None:
+        """Split the CSV deck into shards unless that was already done."""
+        if not os.path.isfile(os.path.join(self.shards_dir, MANIFEST)):
+            shard_deck(self.filename, self.shards_dir, self.shards, self.hash_name)
+
+
+# --------------------------
+# Concrete Data Remover
+# --------------------------
+class ShardedDataRemover(IDataRemover):
+    """
+    IDataRemover for sharded decks that rewrites only the affected shards.
+
+    Each removed word is hashed to its shard; a flush rewrites those shards
+    and updates their row counts in the manifest, all on the shard
+    directory's BackgroundWriter.
+
+    Attributes:
+        filename (str): Path to the source CSV file.
+        shards_dir (str): Path to the shard directory.
+        to_remove (set): Words marked for removal.
+        writer (BackgroundWriter): Serialized writer for the shard directory.
+    """
+
+    def __init__(self, filename: str):
+        """
+        Initialize the remover for a deck.
+
+        Args:
+            filename (str): CSV file name (stored under the data directory)
+        """
+        self.filename = resolve_data_path(filename)
+        self.shards_dir = shards_dir_for(self.filename)
+        self.to_remove = set()
+        self._lock = threading.Lock()
+        self.writer = BackgroundWriter.for_directory(self.shards_dir)
+        atexit.register(self.flush)
+
+    def remove_word(self, word: str) -> None:
+        """
+        Immediately remove a word from its shard.
+
+        Args:
+            word (str): Word to remove.
+        """
+        self._submit_removal({word}).result()
+
+    def mark_for_removal(self, word: str) -> None:
+        """
+        Mark a word for later removal (batch deletion).
+
+        Args:
+            word (str): Word to mark for removal.
+        """
+        with self._lock:
+            self.to_remove.add(word)
+
+    def flush(self) -> None:
+        """Rewrite the shards holding the marked words and clear the batch."""
+        future = self._take_batch()
+        if future is not None:
+            future.result()
+
+    def flush_async(self) -> None:
+        """Queue the marked removals on the shard directory's writer."""
+        self._take_batch()
+
+    # ==========================================================
+    # Private Utilities
+    # ==========================================================
+
+    def _take_batch(self) -> Future | None:
+        """Detach the marked words and queue their removal."""
+        with self._lock:
+            if not self.to_remove:
+                return None
+            words, self.to_remove = self.to_remove, set()
+        return self._submit_removal(words)
+
+    def _submit_removal(self, words: set) -> Future:
+        """Queue the removal of words on the writer."""
+        return self.writer.call(lambda: self._remove_now(words))
+
+    def _remove_now(self, words: set) -> None:
+        """Rewrite the affected shards and their manifest counts (writer thread)."""
+        manifest = read_manifest(self.shards_dir)
+        shard_hash = SHARD_HASHES[manifest["hash"]]
+        files = manifest["files"]
+
+        by_shard: Dict[int, set] = {}
+        for word in words:
+            by_shard.setdefault(shard_hash(word) % len(files), set()).add(word)
+
+        for index, shard_words in by_shard.items():
+            path = os.path.join(self.shards_dir, files[index])
+            rows = _read_shard(path)
+            kept = [rows[0]] + [row for row in rows[1:] if row[0] not in shard_words]
+            if len(kept) == len(rows):
+                continue
+
+            with open(path + ".tmp", "w", encoding="utf-8", newline="") as file:
+                csv.writer(file).writerows(kept)
+            os.replace(path + ".tmp", path)
+            manifest["counts"][index] = len(kept) - 1
+
+        _write_manifest(self.shards_dir, manifest)
+
+
+# --------------------------
+# Concrete Factories
+# --------------------------
+class ShardedDeckRetrieverFactory(DataRetrieverFactory):
+    """
+    Factory for creating ShardedDeckRetriever instances.
+    """
+
+    def __init__(self, shards: int = 16, hash_name: str = "crc32"):
+        """
+        Initialize the factory.
+
+        Args:
+            shards (int): Shard count used when a deck is first split.
+            hash_name (str): Row-to-shard hash, a key of SHARD_HASHES.
+        """
+        self.shards = shards
+        self.hash_name = hash_name
+
+    def create_data_retriever(self, filename: str) -> IDataRetriever:
+        """
+        Create and return a ShardedDeckRetriever instance.
+
+        Args:
+            filename (str): Path to the source CSV file.
+
+        Returns:
+            ShardedDeckRetriever: New instance of ShardedDeckRetriever.
+        """
+        return ShardedDeckRetriever(filename, self.shards, self.hash_name)
+
+
+class ShardedDataRemoverFactory(DataRemoverFactory):
+    """
+    Factory for creating ShardedDataRemover instances.
+    """
+
+    def create_data_remover(self, filename: str) -> IDataRemover:
+        """
+        Create and return a ShardedDataRemover instance.
+
+        Args:
+            filename (str): Path to the source CSV file.
+
+        Returns:
+            ShardedDataRemover: New instance of ShardedDataRemover.
+        """
+        return ShardedDataRemover(filename)
+
+
+# --------------------------
+# Converter
+# --------------------------
+def main():
+    if len(sys.argv) < 2:
+        print("Usage: python -m lexicards.data.sharded_deck DECK [SHARDS] [HASH]")
+        sys.exit(2)
+
+    source = resolve_data_path(sys.argv[1])
+    shards = int(sys.argv[2]) if len(sys.argv) > 2 else 16
+    hash_name = sys.argv[3] if len(sys.argv) > 3 else "crc32"
+    print(f"Sharded into {shard_deck(source, shards=shards, hash_name=hash_name)}")
+
+
+if __name__ == "__main__":
+    main()
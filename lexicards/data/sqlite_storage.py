@@ -0,0 +1,438 @@
+import atexit
+import os
+import sqlite3
+import threading
+from contextlib import contextmanager
+from typing import Iterator, List
+
+from lexicards.data.data_paths import resolve_data_path
+from lexicards.data.data_remover import DataRemoverFactory
+from lexicards.data.data_retriever import CSVDataRetriever, DataRetrieverFactory
+from lexicards.data.data_saver import DataSaverFactory
+from lexicards.data.data_writer import BackgroundWriter
+from lexicards.errors.error import DataCorruptionError
+from lexicards.interfaces.data.i_data_remove import IDataRemover
+from lexicards.interfaces.data.i_data_retriever import IDataRetriever
+from lexicards.interfaces.data.i_data_saver import IDataSaver
+
+SCHEMA = """
+CREATE TABLE IF NOT EXISTS decks (
+    name TEXT PRIMARY KEY,
+    foreign_label TEXT NOT NULL,
+    native_label TEXT NOT NULL
+);
+CREATE TABLE IF NOT EXISTS cards (
+    id INTEGER PRIMARY KEY,
+    deck TEXT NOT NULL,
+    word TEXT NOT NULL,
+    meaning TEXT NOT NULL,
+    UNIQUE (deck, word)
+);
+CREATE TABLE IF NOT EXISTS progress (
+    list TEXT NOT NULL,
+    word TEXT NOT NULL,
+    meaning TEXT NOT NULL,
+    PRIMARY KEY (list, word)
+) WITHOUT ROWID;
+"""
+
+
+# --------------------------
+# Shared Database
+# --------------------------
+class SQLiteDatabase:
+    """
+    Single WAL-mode SQLite database shared by the SQLite backend.
+
+    Decks live in the 'cards' table and known/unknown tracking lives in the
+    'progress' table, both keyed by indexed word columns. One connection is
+    shared between threads and serialized with a lock.
+
+    Attributes:
+        path (str): Absolute path to the database file.
+        connection (sqlite3.Connection): Shared database connection.
+    """
+
+    def __init__(self, path: str = "lexicards.db"):
+        """
+        Open (or create) the database and its schema.
+
+        Args:
+            path (str): Database file name (stored under the data directory).
+
+        Raises:
+            DataCorruptionError: If the database cannot be opened.
+        """
+        self.path = resolve_data_path(path)
+        self._lock = threading.RLock()
+
+        try:
+            self.connection = sqlite3.connect(
+                self.path, check_same_thread=False, isolation_level=None
+            )
+            self.connection.execute("PRAGMA journal_mode=WAL")
+            self.connection.execute("PRAGMA synchronous=NORMAL")
+            self.connection.executescript(SCHEMA)
+        except sqlite3.Error as exc:
+            raise DataCorruptionError(f"Cannot open database: {self.path}") from exc
+
+    @contextmanager
+    def transaction(self) -> Iterator[sqlite3.Connection]:
+        """
+        Run a block of statements in a single transaction.
+
+        Yields:
+            sqlite3.Connection: The shared connection.
+
+        Raises:
+            DataCorruptionError: If a statement fails; the transaction is
+                rolled back.
+        """
+        with self._lock:
+            try:
+                self.connection.execute("BEGIN")
+                yield self.connection
+                self.connection.execute("COMMIT")
+            except sqlite3.Error as exc:
+                self._rollback()
+                raise DataCorruptionError(f"Database error in {self.path}") from exc
+            except BaseException:
+                self._rollback()
+                raise
+
+    def _rollback(self) -> None:
+        """Roll back the open transaction, if any."""
+        if self.connection.in_transaction:
+            self.connection.execute("ROLLBACK")
+
+    def close(self) -> None:
+        """Close the shared connection."""
+        with self._lock:
+            self.connection.close()
+
+
+def _list_name(filename: str) -> str:
+    """Map a progress file name such as 'known_words.csv' to a list name."""
+    return os.path.splitext(os.path.basename(filename))[0]
+
+
+def _deck_name(filename: str) -> str:
+    """
+    Map a deck file name or path to its key in the database.
+
+    'japanese_words.csv' and its absolute path in the data directory (as
+    handed out by DeckRegistry) must name the same deck, so the key is the
+    file name alone.
+    """
+    return os.path.basename(resolve_data_path(filename))
+
+
+# --------------------------
+# Concrete Data Retriever
+# --------------------------
+class SQLiteDataRetriever(IDataRetriever):
+    """
+    IDataRetriever reading a deck from the SQLite database.
+
+    A deck is imported from its CSV file in one transaction the first time
+    it is requested.
+
+    Attributes:
+        database (SQLiteDatabase): Shared database.
+        filename (str): Source CSV file name or path.
+        deck (str): Deck key in the database (the source CSV file name).
+    """
+
+    def __init__(self, database: SQLiteDatabase, deck: str):
+        """
+        Initialize the retriever for a deck.
+
+        Args:
+            database (SQLiteDatabase): Shared database.
+            deck (str): Source CSV file name or path.
+        """
+        self.database = database
+        self.filename = deck
+        self.deck = _deck_name(deck)
+
+    def load_data(self) -> List[List[str]]:
+        """
+        Load the whole deck.
+
+        Returns:
+            List[List[str]]: List of word entries, header row first.
+        """
+        rows = []
+        for batch in self.iter_rows(batch_size=10000):
+            rows.extend(batch)
+        return rows
+
+    def iter_rows(self, batch_size: int = 1000) -> Iterator[List[List[str]]]:
+        """
+        Stream the deck in batches using keyset pagination.
+
+        Args:
+            batch_size (int): Maximum number of rows per batch.
+
+        Yields:
+            List[List[str]]: Next batch of word entries, header row first.
+        """
+        batch = [self._ensure_imported()]
+        last_id = 0
+
+        while True:
+            if len(batch) >= batch_size:
+                yield batch
+                batch = []
+
+            with self.database.transaction() as connection:
+                rows = connection.execute(
+                    "SELECT id, word, meaning FROM cards"
+                    " WHERE deck = ? AND id > ? ORDER BY id LIMIT ?",
+                    (self.deck, last_id, batch_size - len(batch)),
+                ).fetchall()
+
+            if not rows:
+                if batch:
+                    yield batch
+                return
+
+            batch.extend([word, meaning] for _, word, meaning in rows)
+            last_id = rows[-1][0]
+
+    def _ensure_imported(self) -> List[str]:
+        """
+        Import the deck from its CSV file if it is not in the database yet.
+
+        Returns:
+            List[str]: The deck's header row.
+        """
+        with self.database.transaction() as connection:
+            header = connection.execute(
+                "SELECT foreign_label, native_label FROM decks WHERE name = ?",
+                (self.deck,),
+            ).fetchone()
+        if header:
+            return list(header)
+
+        batches = CSVDataRetriever(self.filename).iter_rows(batch_size=10000)
+        first = next(batches, [])
+        if not first or len(first[0]) < 2:
+            raise DataCorruptionError(f"Deck has no header: {self.deck}")
+
+        header = first[0][:2]
+        with self.database.transaction() as connection:
+            connection.execute(
+                "INSERT OR IGNORE INTO decks (name, foreign_label, native_label)"
+                " VALUES (?, ?, ?)",
+                (self.deck, *header),
+            )
+            for batch in [first[1:]] + list(batches):
+                connection.executemany(
+                    "INSERT OR IGNORE INTO cards (deck, word, meaning)"
+                    " VALUES (?, ?, ?)",
+                    ((self.deck, row[0], row[1]) for row in batch if len(row) >= 2),
+                )
+        return header
+
+
+# --------------------------
+# Concrete Data Saver
+# --------------------------
+class SQLiteDataSaver(IDataSaver):
+    """
+    IDataSaver recording words in a progress list of the SQLite database.
+
+    Duplicates are rejected by the (list, word) primary key, so no scan of
+    the existing entries is needed.
+
+    Attributes:
+        database (SQLiteDatabase): Shared database.
+        list_name (str): Progress list name, e.g. 'known_words'.
+    """
+
+    def __init__(self, database: SQLiteDatabase, filename: str):
+        """
+        Initialize the saver for a progress list.
+
+        Args:
+            database (SQLiteDatabase): Shared database.
+            filename (str): Progress file name, e.g. 'known_words.csv'.
+        """
+        self.database = database
+        self.list_name = _list_name(filename)
+
+    def save_data(self, word: str, meaning: str) -> None:
+        """
+        Save a word to the progress list, ignoring duplicates.
+
+        Args:
+            word (str): Foreign-language word
+            meaning (str): Translated meaning
+        """
+        with self.database.transaction() as connection:
+            connection.execute(
+                "INSERT OR IGNORE INTO progress (list, word, meaning) VALUES (?, ?, ?)",
+                (self.list_name, word, meaning),
+            )
+
+    def flush(self) -> None:
+        """Nothing to do: every save is committed in its own transaction."""
+        pass
+
+    def close(self) -> None:
+        """Nothing to do: the shared database is closed by its owner."""
+        pass
+
+
+# --------------------------
+# Concrete Data Remover
+# --------------------------
+class SQLiteDataRemover(IDataRemover):
+    """
+    IDataRemover deleting words from a deck in the SQLite database.
+
+    Attributes:
+        database (SQLiteDatabase): Shared database.
+        deck (str): Deck key in the database (the source CSV file name).
+        to_remove (set): Set of words that need to be removed
+    """
+
+    def __init__(self, database: SQLiteDatabase, deck: str):
+        """
+        Initialize the remover for a deck.
+
+        Args:
+            database (SQLiteDatabase): Shared database.
+            deck (str): Source CSV file name or path.
+        """
+        self.database = database
+        self.deck = _deck_name(deck)
+        self.to_remove = set()
+        self._lock = threading.Lock()
+        atexit.register(self.flush)
+
+    def remove_word(self, word: str) -> None:
+        """
+        Immediately remove a word from the deck.
+
+        Args:
+            word (str): Word to remove.
+        """
+        self._delete({word})
+
+    def mark_for_removal(self, word: str) -> None:
+        """
+        Mark a word for later removal (batch deletion).
+
+        Args:
+            word (str): Word to mark for removal.
+        """
+        with self._lock:
+            self.to_remove.add(word)
+
+    def flush(self) -> None:
+        """Delete all marked words in a single transaction."""
+        with self._lock:
+            if not self.to_remove:
+                return
+            words = self.to_remove.copy()
+            self.to_remove.clear()
+
+        self._delete(words)
+
+    def flush_async(self) -> None:
+        """Queue flush on the database directory's background writer."""
+        BackgroundWriter.for_file(self.database.path).call(self.flush)
+
+    def _delete(self, words: set) -> None:
+        """Delete a batch of words from the deck in one transaction."""
+        with self.database.transaction() as connection:
+            connection.executemany(
+                "DELETE FROM cards WHERE deck = ? AND word = ?",
+                ((self.deck, word) for word in words),
+            )
+
+
+# --------------------------
+# Concrete Factories
+# --------------------------
+class SQLiteDataRetrieverFactory(DataRetrieverFactory):
+    """
+    Factory for creating SQLiteDataRetriever instances.
+    """
+
+    def __init__(self, database: SQLiteDatabase):
+        """
+        Initialize the factory with the shared database.
+
+        Args:
+            database (SQLiteDatabase): Shared database.
+        """
+        self.database = database
+
+    def create_data_retriever(self, filename: str) -> IDataRetriever:
+        """
+        Create and return a SQLiteDataRetriever instance.
+
+        Args:
+            filename (str): Deck name (the source CSV file name).
+
+        Returns:
+            SQLiteDataRetriever: New instance of SQLiteDataRetriever.
+        """
+        return SQLiteDataRetriever(self.database, filename)
+
+
+class SQLiteDataSaverFactory(DataSaverFactory):
+    """
+    Factory for creating SQLiteDataSaver instances.
+    """
+
+    def __init__(self, database: SQLiteDatabase):
+        """
+        Initialize the factory with the shared database.
+
+        Args:
+            database (SQLiteDatabase): Shared database.
+        """
+        self.database = database
+
+    def create_data_saver(self, filename: str) -> IDataSaver:
+        """
+        Create and return a SQLiteDataSaver instance.
+
+        Args:
+            filename (str): Progress file name, e.g. 'known_words.csv'.
+
+        Returns:
+            SQLiteDataSaver: A new SQLite data saver.
+        """
+        return SQLiteDataSaver(self.database, filename)
+
+
+class SQLiteDataRemoverFactory(DataRemoverFactory):
+    """
+    Factory for creating SQLiteDataRemover instances.
+    """
+
+    def __init__(self, database: SQLiteDatabase):
+        """
+        Initialize the factory with the shared database.
+
+        Args:
+            database (SQLiteDatabase): Shared database.
+        """
+        self.database = database
+
+    def create_data_remover(self, filename: str) -> IDataRemover:
+        """
+        Create and return a SQLiteDataRemover instance.
+
+        Args:
+            filename (str): Deck name (the source CSV file name).
+
+        Returns:
+            SQLiteDataRemover: A new SQLite data remover.
+        """
+        return SQLiteDataRemover(self.database, filename)
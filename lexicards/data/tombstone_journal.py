@@ -0,0 +1,73 @@
+import csv
+import os
+from typing import Iterable, Set
+
+from lexicards.errors.error import DataCorruptionError
+
+
+class TombstoneJournal:
+    """
+    Append-only sidecar journal of words removed from a CSV deck.
+
+    Removing a word costs a single append to the journal instead of a full
+    rewrite of the deck. Readers apply the journal as a filter at load time
+    until the remover compacts it back into the deck.
+
+    Attributes:
+        path (str): Path to the journal file next to the deck.
+    """
+
+    SUFFIX = ".removed"
+
+    def __init__(self, source_path: str):
+        """
+        Initialize the journal for a deck.
+
+        Args:
+            source_path (str): Absolute path to the CSV deck.
+        """
+        self.path = source_path + self.SUFFIX
+
+    def append(self, words: Iterable[str]) -> None:
+        """
+        Append removed words to the journal.
+
+        Args:
+            words (Iterable[str]): Words to record as removed.
+        """
+        with open(self.path, "a", encoding="utf-8", newline="") as file:
+            writer = csv.writer(file)
+            writer.writerows([word] for word in words)
+
+    def load(self) -> Set[str]:
+        """
+        Read every removed word recorded in the journal.
+
+        Returns:
+            Set[str]: Removed words, empty if there is no journal.
+
+        Raises:
+            DataCorruptionError: If the journal cannot be read.
+        """
+        if not os.path.isfile(self.path):
+            return set()
+
+        try:
+            with open(self.path, "r", encoding="utf-8", newline="") as file:
+                return {row[0] for row in csv.reader(file) if row}
+        except (csv.Error, OSError) as exc:
+            raise DataCorruptionError(f"Cannot read journal: {self.path}") from exc
+
+    def size(self) -> int:
+        """Return the journal size in bytes (0 if it does not exist)."""
+        try:
+            return os.path.getsize(self.path)
+        except OSError:
+            return 0
+
+    def clear(self) -> None:
+        """Delete the journal once its entries are folded into the deck."""
+        try:
+            os.remove(self.path)
+        except FileNotFoundError:
+            pass
@@ -28,3 +28,13 @@ class IAudioService(ABC):
                         'fr' for French.
         """
         pass
+
+    @abstractmethod
+    def warm(self, lang: str):
+        """
+        Prepare the voice for a language so the next speak call starts at once.
+
+        Args:
+            lang (str): Language code, e.g., 'en', 'ja', 'fr'.
+        """
+        pass
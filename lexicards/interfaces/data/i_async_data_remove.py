@@ -0,0 +1,20 @@
+from abc import ABC, abstractmethod
+
+
+class IAsyncDataRemover(ABC):
+    """Asyncio interface for removing words from storage."""
+
+    @abstractmethod
+    async def remove_word(self, word: str) -> None:
+        """Immediately remove the given word from storage."""
+        pass
+
+    @abstractmethod
+    async def mark_for_removal(self, word: str) -> None:
+        """Mark a word for later removal (batch removal)."""
+        pass
+
+    @abstractmethod
+    async def flush(self) -> None:
+        """Apply all marked removals to the storage."""
+        pass
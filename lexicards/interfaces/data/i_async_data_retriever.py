@@ -0,0 +1,25 @@
+from abc import ABC, abstractmethod
+from typing import AsyncIterator, List
+
+
+class IAsyncDataRetriever(ABC):
+    """Asyncio interface for any data retriever (CSV, DB, API)."""
+
+    @abstractmethod
+    async def load_data(self) -> List[List[str]]:
+        """
+        Return list of word entries, header row first.
+
+        Retrievers backed by a random-access format may instead return an
+        IWordStore holding the header separately.
+        """
+        pass
+
+    @abstractmethod
+    def iter_rows(self, batch_size: int = 1000) -> AsyncIterator[List[List[str]]]:
+        """
+        Lazily yield word entries in batches of at most batch_size rows.
+
+        The first batch starts with the header row, like load_data().
+        """
+        pass
@@ -0,0 +1,26 @@
+from abc import ABC, abstractmethod
+
+
+class IAsyncDataSaver(ABC):
+    """Asyncio interface for saving vocabulary data (CSV, DB, API)."""
+
+    @abstractmethod
+    async def save_data(self, word: str, meaning: str) -> None:
+        """
+        Save a single word and its meaning.
+
+        Args:
+            word (str): The foreign word.
+            meaning (str): The translated meaning.
+        """
+        pass
+
+    @abstractmethod
+    async def flush(self) -> None:
+        """Commit buffered or queued data to storage and wait for it."""
+        pass
+
+    @abstractmethod
+    async def close(self) -> None:
+        """Flush pending data and release resources held by the saver."""
+        pass
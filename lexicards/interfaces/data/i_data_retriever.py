@@ -1,5 +1,5 @@
 from abc import ABC, abstractmethod
-from typing import List
+from typing import Iterator, List
 
 
 class IDataRetriever(ABC):
@@ -7,5 +7,19 @@ class IDataRetriever(ABC):
 
     @abstractmethod
     def load_data(self) -> List[List[str]]:
-        """Return list of word entries."""
+        """
+        Return list of word entries, header row first.
+
+        Retrievers backed by a random-access format may instead return an
+        IWordStore holding the header separately.
+        """
+        pass
+
+    @abstractmethod
+    def iter_rows(self, batch_size: int = 1000) -> Iterator[List[List[str]]]:
+        """
+        Lazily yield word entries in batches of at most batch_size rows.
+
+        The first batch starts with the header row, like load_data().
+        """
         pass
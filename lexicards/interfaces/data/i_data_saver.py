@@ -14,3 +14,13 @@ class IDataSaver(ABC):
             meaning (str): The translated meaning.
         """
         pass
+
+    @abstractmethod
+    def flush(self) -> None:
+        """Commit buffered or queued data to storage and wait for it."""
+        pass
+
+    @abstractmethod
+    def close(self) -> None:
+        """Flush pending data and release resources held by the saver."""
+        pass
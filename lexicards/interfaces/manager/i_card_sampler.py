@@ -0,0 +1,37 @@
+from abc import ABC, abstractmethod
+
+from lexicards.interfaces.manager.i_word_store import IWordStore
+
+
+class ICardSampler(ABC):
+    """
+    Interface for the strategy a word manager uses to pick the next card.
+
+    Samplers track cards by stable row id, so they are unaffected by the
+    position changes of the word store.
+    """
+
+    @abstractmethod
+    def reset(self, words: IWordStore) -> None:
+        """Track exactly the active cards of a word store."""
+        pass
+
+    @abstractmethod
+    def add(self, row_id: int) -> None:
+        """Start tracking a card added to the pool."""
+        pass
+
+    @abstractmethod
+    def remove(self, row_id: int) -> None:
+        """Stop tracking a card retired from the pool."""
+        pass
+
+    @abstractmethod
+    def draw(self) -> int:
+        """Return the row id of the next card to show."""
+        pass
+
+    @abstractmethod
+    def record(self, row_id: int, known: bool) -> None:
+        """Feed back whether the learner knew a card."""
+        pass
@@ -10,6 +10,16 @@ class IWordManager(ABC):
         """Return a random word and its meaning."""
         pass
 
+    @abstractmethod
+    def draw_card(self) -> Tuple[int | None, str, str]:
+        """Pick the next card as (row id, word, meaning) without making it current."""
+        pass
+
+    @abstractmethod
+    def show_card(self, row_id: int | None, word: str, meaning: str) -> bool:
+        """Make a drawn card current; return False if it was retired meanwhile."""
+        pass
+
     @abstractmethod
     def mark_as_known(self) -> None:
         """Mark the current word as known and update storage."""
@@ -0,0 +1,52 @@
+from abc import abstractmethod
+from collections.abc import Sequence
+from typing import Tuple
+
+
+class IWordStore(Sequence):
+    """
+    Interface for the pool of active cards used by a word manager.
+
+    Indexing returns (word, meaning) pairs; the deck header is kept apart
+    from the cards so it can never be drawn as one. Positions are not
+    stable (removal moves the last card into the freed slot), so every card
+    also has a stable row id.
+    """
+
+    __slots__ = ()
+
+    @property
+    @abstractmethod
+    def header(self) -> Tuple[str, str]:
+        """Return the (foreign language, native language) header labels."""
+        pass
+
+    @abstractmethod
+    def __len__(self) -> int:
+        """Return the number of active cards."""
+        pass
+
+    @abstractmethod
+    def __getitem__(self, index: int) -> Tuple[str, str]:
+        """Return the (word, meaning) pair at the given position."""
+        pass
+
+    @abstractmethod
+    def pop(self, index: int = -1) -> Tuple[str, str]:
+        """Remove the card at the given position in O(1) and return it."""
+        pass
+
+    @abstractmethod
+    def row_id(self, index: int) -> int:
+        """Return the stable row id of the card at the given position."""
+        pass
+
+    @abstractmethod
+    def index_of(self, row_id: int) -> int | None:
+        """Return the current position of a row id, or None if retired."""
+        pass
+
+    @abstractmethod
+    def card(self, row_id: int) -> Tuple[str, str]:
+        """Return the (word, meaning) pair of a row id, even after it was retired."""
+        pass
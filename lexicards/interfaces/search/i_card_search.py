@@ -0,0 +1,43 @@
+from abc import ABC, abstractmethod
+from typing import Iterable, List, Tuple
+
+from lexicards.interfaces.manager.i_word_store import IWordStore
+
+
+class ICardSearchIndex(ABC):
+    """
+    Interface for looking up the active cards of a word store.
+
+    Indexes track cards by stable row id and are updated incrementally as
+    cards are added and retired.
+    """
+
+    @abstractmethod
+    def reset(self, words: IWordStore) -> None:
+        """Index exactly the active cards of a word store."""
+        pass
+
+    @abstractmethod
+    def add(self, row_id: int) -> None:
+        """Index a card added to the store."""
+        pass
+
+    @abstractmethod
+    def extend(self, row_ids: Iterable[int]) -> None:
+        """Index a batch of cards added to the store."""
+        pass
+
+    @abstractmethod
+    def remove(self, row_id: int) -> None:
+        """Drop a card retired from the store."""
+        pass
+
+    @abstractmethod
+    def find_words(self, prefix: str, limit: int = 20) -> List[Tuple[str, str]]:
+        """Return (word, meaning) pairs whose word starts with a prefix."""
+        pass
+
+    @abstractmethod
+    def find_meanings(self, text: str, limit: int = 20) -> List[Tuple[str, str]]:
+        """Return (word, meaning) pairs whose meaning contains a text."""
+        pass
@@ -1,12 +1,41 @@
+import os
 import platform
+from concurrent.futures import ThreadPoolExecutor
 from tkinter import Tk
 
 from lexicards.audio.audio_service import AudioService
+from lexicards.controllers.async_lexical_controller import AsyncLexicalController
+from lexicards.controllers.card_prefetcher import CardPrefetcher
+from lexicards.controllers.deck_switcher import DeckSwitcher
 from lexicards.controllers.lexical_controller import LexicalController
+from lexicards.core.loop_bridge import TkLoopBridge
+from lexicards.data.async_data import (
+    ExecutorDataRemoverFactory,
+    ExecutorDataRetrieverFactory,
+    ExecutorDataSaverFactory,
+)
+from lexicards.data.compiled_deck import CompiledDeckRetrieverFactory
 from lexicards.data.data_loader import ResourceLoader
+from lexicards.data.data_paths import deck_state_path, resolve_data_path
 from lexicards.data.data_remover import CSVDataRemoverFactory
-from lexicards.data.data_retriever import CSVDataRetrieverFactory
+from lexicards.data.data_retriever import CSVDataRetrieverFactory, read_deck_header
 from lexicards.data.data_saver import CSVDataSaverFactory
+from lexicards.data.deck_cache import DeckCache
+from lexicards.data.session_log import SessionLog
+from lexicards.data.sharded_deck import (
+    ShardedDataRemoverFactory,
+    ShardedDeckRetrieverFactory,
+)
+from lexicards.data.sqlite_storage import (
+    SQLiteDatabase,
+    SQLiteDataRemoverFactory,
+    SQLiteDataRetrieverFactory,
+    SQLiteDataSaverFactory,
+)
+from lexicards.manager.async_word_manager import AsyncWordManager
+from lexicards.manager.card_sampler import ShuffleBagSampler, WeightedCardSampler
+from lexicards.manager.deck_registry import DeckRegistry, RegistryDataRetrieverFactory
+from lexicards.manager.srs_word_manager import SpacedRepetitionWordManager
 from lexicards.manager.word_manager import WordManager
 from lexicards.ui.builders.desktop_ui_builder import DesktopLexiUiBuilder
 from lexicards.ui.builders.mac_ui_builder import MacLexiUiBuilder
@@ -16,6 +45,77 @@ from lexicards.ui.manager.ui_manager import UiManager
 from lexicards.ui.orchestrator.ui_mac_orchestrator import MacUiOrchestrator
 from lexicards.ui.orchestrator.ui_orchestrator import UiOrchestrator
 
+# Storage backend: "csv" (default), "compiled", "sharded" or "sqlite".
+STORAGE_BACKEND = os.environ.get("LEXICARDS_STORAGE", "csv")
+
+# Deck shown first; every other deck in the data directory loads in the background
+# and Ctrl+D switches between them.
+FIRST_DECK = os.environ.get("LEXICARDS_DECK", "japanese_words.csv")
+
+# Card selection: "random" (default), "shuffle" (each card once per pass),
+# "weighted" (missed cards come up more often) or "srs" (spaced-repetition schedule).
+SCHEDULER = os.environ.get("LEXICARDS_SCHEDULER", "random")
+
+# Cards kept ready by the background prefetcher when I/O runs inline (0 disables).
+PREFETCH_DEPTH = int(os.environ.get("LEXICARDS_PREFETCH", "3"))
+
+# Record progress in an event log and resume from it ("1") or not ("0", default).
+# Used when I/O runs inline.
+SESSION_LOG = os.environ.get("LEXICARDS_SESSION_LOG", "0") != "0"
+
+# Run storage I/O off the Tk thread through asyncio ("1", default) or inline ("0").
+# The spaced-repetition scheduler only has an inline manager.
+ASYNC_IO = os.environ.get("LEXICARDS_ASYNC_IO", "1") != "0" and SCHEDULER != "srs"
+
+
+def create_data_factories(backend: str):
+    """
+    Create the retriever, saver and remover factories for a storage backend.
+
+    Savers are created per deck: CSV progress files take the header of the
+    deck they belong to.
+
+    Args:
+        backend (str): "csv", "compiled" (compiled decks, CSV progress files),
+            "sharded" (sharded decks, CSV progress files) or "sqlite".
+
+    Returns:
+        tuple: (retriever factory, function returning the saver factory of a
+            deck path, remover factory)
+
+    Raises:
+        ValueError: If the backend is unknown.
+    """
+    if backend == "sqlite":
+        database = SQLiteDatabase()
+        saver_factory = SQLiteDataSaverFactory(database)
+        return (
+            SQLiteDataRetrieverFactory(database),
+            lambda path: saver_factory,
+            SQLiteDataRemoverFactory(database),
+        )
+
+    remover_factory = CSVDataRemoverFactory(journal=True)
+    if backend == "csv":
+        retriever = CSVDataRetrieverFactory(cache=DeckCache())
+    elif backend == "compiled":
+        retriever = CompiledDeckRetrieverFactory()
+    elif backend == "sharded":
+        retriever = ShardedDeckRetrieverFactory()
+        remover_factory = ShardedDataRemoverFactory()
+    else:
+        raise ValueError(f"Unknown storage backend: {backend}")
+
+    def saver_factory_for(path):
+        foreign_language, native_language = read_deck_header(path)
+        return CSVDataSaverFactory(
+            foreign_language=foreign_language,
+            native_language=native_language,
+            compact_index=True,
+        )
+
+    return retriever, saver_factory_for, remover_factory
+
 
 def main():
     current_os = platform.system()
@@ -56,20 +156,8 @@ def main():
     # Controller & Wiring
     # -----------------------------
 
-    retriever = CSVDataRetrieverFactory()
-    saver_factory = CSVDataSaverFactory(
-        foreign_language="Japanese", native_language="English"
-    )
-    remover_factory = CSVDataRemoverFactory()
-
-    # -----------------------------
-    # WordManager
-    # -----------------------------
-    manager = WordManager(
-        loader_factory=retriever,
-        saver_factory=saver_factory,
-        data_remover=remover_factory,
-        source_file="japanese_words.csv",
+    retriever, saver_factory_for, remover_factory = create_data_factories(
+        STORAGE_BACKEND
     )
 
     # -----------------------------
@@ -78,9 +166,99 @@ def main():
     audio = AudioService()
 
     # -----------------------------
-    # Controller
+    # WordManager & Controller
     # -----------------------------
-    controller = LexicalController(ui_manager, manager, audio)
+    # The first deck streams from its source so the first card shows after
+    # one batch; the other decks load in the background for instant switching.
+    first_path = resolve_data_path(FIRST_DECK)
+    registry = DeckRegistry(retriever)
+    for path in registry.decks:
+        if path != first_path:
+            registry.prefetch(path)
+    deck_loader = RegistryDataRetrieverFactory(registry)
+
+    # Compiled decks are memory-mapped and sharded decks load shard by shard
+    # on access; streaming would read them whole into a WordStore instead.
+    first_batch_size = None if STORAGE_BACKEND in ("compiled", "sharded") else 1000
+    # CSV decks are edited in place, so they are hot-reloaded on change.
+    hot_reload = STORAGE_BACKEND == "csv"
+    samplers = {"shuffle": ShuffleBagSampler, "weighted": WeightedCardSampler}
+
+    def progress_files(path):
+        # Each deck keeps its own history, e.g. japanese_words.known_words.csv
+        return {
+            "known_file": deck_state_path(path, "known_words.csv"),
+            "unknown_file": deck_state_path(path, "unknown_words.csv"),
+        }
+
+    if ASYNC_IO:
+        bridge = TkLoopBridge(root.after)
+        executor = ThreadPoolExecutor(max_workers=1, thread_name_prefix="lexicards-io")
+
+        def open_deck(path):
+            manager = bridge.run(
+                AsyncWordManager.create(
+                    loader_factory=ExecutorDataRetrieverFactory(deck_loader, executor),
+                    saver_factory=ExecutorDataSaverFactory(
+                        saver_factory_for(path), executor
+                    ),
+                    data_remover=ExecutorDataRemoverFactory(remover_factory, executor),
+                    source_file=path,
+                    **progress_files(path),
+                    load_batch_size=first_batch_size if path == first_path else None,
+                    sampler=samplers[SCHEDULER]() if SCHEDULER in samplers else None,
+                )
+            )
+            if hot_reload:
+                bridge.run(manager.watch())
+            return manager
+
+        controller = AsyncLexicalController(
+            ui_manager, open_deck(first_path), audio, bridge
+        )
+        prefetch = None
+    else:
+        manager_class = (
+            SpacedRepetitionWordManager if SCHEDULER == "srs" else WordManager
+        )
+
+        def open_deck(path):
+            options = progress_files(path)
+            if SCHEDULER == "srs":
+                options["state_file"] = deck_state_path(path, "review_state.bin")
+            manager = manager_class(
+                loader_factory=deck_loader,
+                saver_factory=saver_factory_for(path),
+                data_remover=remover_factory,
+                source_file=path,
+                load_batch_size=first_batch_size if path == first_path else None,
+                sampler=samplers[SCHEDULER]() if SCHEDULER in samplers else None,
+                session_log=(
+                    SessionLog(deck_state_path(path, "session.log"))
+                    if SESSION_LOG
+                    else None
+                ),
+                **options,
+            )
+            if hot_reload:
+                manager.watch()
+            return manager
+
+        prefetch = None
+        if PREFETCH_DEPTH > 0:
+            prefetch = lambda manager: CardPrefetcher(  # noqa: E731
+                manager, audio, PREFETCH_DEPTH
+            ).start()
+        manager = open_deck(first_path)
+        controller = LexicalController(
+            ui_manager, manager, audio, prefetch(manager) if prefetch else None
+        )
+
+    # Ctrl+D moves on to the next deck in the data directory.
+    switcher = DeckSwitcher(
+        controller, first_path, lambda: registry.decks, open_deck, prefetch
+    )
+    root.bind("<Control-d>", lambda event: switcher.next_deck())
 
     # -----------------------------
     # Orchestrator
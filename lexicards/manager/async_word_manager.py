@@ -0,0 +1,335 @@
+import asyncio
+import random
+from typing import AsyncIterator, List, Tuple
+
+from lexicards.data.async_data import (
+    AsyncDataRemoverFactory,
+    AsyncDataRetrieverFactory,
+    AsyncDataSaverFactory,
+)
+from lexicards.data.data_paths import resolve_data_path
+from lexicards.data.file_watcher import FileWatcher
+from lexicards.interfaces.manager.i_async_manager import IAsyncWordManager
+from lexicards.interfaces.manager.i_card_sampler import ICardSampler
+from lexicards.interfaces.manager.i_word_store import IWordStore
+from lexicards.manager.source_snapshot import SourceSnapshot
+from lexicards.manager.word_store import WordStore
+
+
+class AsyncWordManager(IAsyncWordManager):
+    """
+    Asyncio variant of WordManager.
+
+    The in-memory card pool is updated synchronously on the event loop, and
+    storage calls are awaited on async data adapters, so callers on the loop
+    never block on file I/O. All methods must be called from the same event
+    loop; create instances with AsyncWordManager.create().
+
+    Attributes:
+        loader_factory (AsyncDataRetrieverFactory): Factory for async data retrievers.
+        saver_factory (AsyncDataSaverFactory): Factory for async data savers.
+        remover_factory (AsyncDataRemoverFactory): Factory for async data removers.
+        source_file (str): CSV file containing all words.
+        known_file (str): CSV file to save known words.
+        unknown_file (str): CSV file to save unknown words.
+        flush_interval (int): Number of marked words before flushing removals.
+        load_batch_size (int | None): Batch size for streaming the deck, or None
+            to load it in one call.
+        loaded (asyncio.Event): Set once the whole deck has been loaded.
+        sampler (ICardSampler | None): Strategy picking the next card, or None
+            for a uniform random pick.
+        words (IWordStore): Pool of active cards, without the header row.
+        current_row (int | None): Stable row id of the current word.
+        current_word (str | None): Current word.
+        current_meaning (str | None): Meaning of the current word.
+    """
+
+    def __init__(
+        self,
+        loader_factory: AsyncDataRetrieverFactory,
+        saver_factory: AsyncDataSaverFactory,
+        data_remover: AsyncDataRemoverFactory,
+        source_file: str,
+        known_file: str = "known_words.csv",
+        unknown_file: str = "unknown_words.csv",
+        flush_interval=5,
+        load_batch_size: int | None = None,
+        sampler: ICardSampler | None = None,
+    ):
+        """
+        Initialize AsyncWordManager without loading the deck.
+
+        Args:
+            loader_factory (AsyncDataRetrieverFactory): Factory for creating IAsyncDataRetriever instances.
+            saver_factory (AsyncDataSaverFactory): Factory for creating IAsyncDataSaver instances.
+            data_remover (AsyncDataRemoverFactory): Factory for creating IAsyncDataRemover instances.
+            source_file (str): CSV file containing all words.
+            known_file (str): CSV file to save known words.
+            unknown_file (str): CSV file to save unknown words.
+            flush_interval (int): Number of marked words before flushing to CSV
+            load_batch_size (int | None): When set, the deck is streamed in
+                batches of this size: the session starts on the first batch
+                while the rest loads in a background task.
+            sampler (ICardSampler | None): Strategy picking the next card;
+                None draws uniformly at random.
+        """
+        self.loader_factory = loader_factory
+        self.saver_factory = saver_factory
+        self.remover_factory = data_remover
+
+        self.source_file = source_file
+        self.known_file = known_file
+        self.unknown_file = unknown_file
+
+        self.remover = self.remover_factory.create_data_remover(self.source_file)
+
+        self.flush_interval = flush_interval
+        self._marked_count = 0
+        self._pending = set()
+
+        self.load_batch_size = load_batch_size
+        self.loaded = asyncio.Event()
+        self.sampler = sampler
+
+        self.words: IWordStore = WordStore(("", ""))
+        self._snapshot = None
+        self.current_row = None
+        self.current_word = None
+        self.current_meaning = None
+
+        self._foreign_language = None
+        self._native_language = None
+
+    @classmethod
+    async def create(cls, *args, **kwargs) -> "AsyncWordManager":
+        """
+        Create an AsyncWordManager and load its deck.
+
+        Takes the same arguments as the constructor.
+
+        Returns:
+            AsyncWordManager: Manager ready to serve words.
+
+        Raises:
+            ValueError: If CSV has fewer than two columns
+        """
+        manager = cls(*args, **kwargs)
+        await manager.load()
+        return manager
+
+    # ==========================================================
+    # IAsyncWordManager Interface
+    # ==========================================================
+
+    @property
+    def foreign_language(self) -> str:
+        return self._foreign_language or "Japanese"
+
+    @property
+    def native_language(self) -> str:
+        return self._native_language or "English"
+
+    async def load(self) -> None:
+        """
+        Load words from the source file into the word store.
+
+        Raises:
+            ValueError: If CSV has fewer than two columns
+        """
+        retriever = self.loader_factory.create_data_retriever(self.source_file)
+
+        if self.load_batch_size is None:
+            data = await retriever.load_data()
+            self.words = (
+                data if isinstance(data, IWordStore) else WordStore.from_rows(data)
+            )
+            self.loaded.set()
+        else:
+            batches = retriever.iter_rows(self.load_batch_size)
+            first = await anext(batches, [])
+            self.words = WordStore.from_rows(first)
+            self._spawn(self._load_remaining(self.words, batches))
+
+        if self.sampler is not None:
+            self.sampler.reset(self.words)
+
+        self._foreign_language, self._native_language = self.words.header
+
+    async def get_random_word(self) -> Tuple[str, str]:
+        """
+        Pick a random word from the current list.
+
+        Returns:
+            tuple[str, str]: (word, meaning)
+        """
+        if not self.words:
+            raise ValueError("No words left to learn.")
+
+        if self.sampler is None:
+            index = random.randrange(len(self.words))
+        else:
+            index = self._draw_index()
+        self.current_row = self.words.row_id(index)
+        self.current_word, self.current_meaning = self.words[index]
+        return self.current_word, self.current_meaning
+
+    async def mark_as_known(self) -> None:
+        """
+        Mark the current word as known:
+            - Retire it from the in-memory word store right away
+            - Save to known_words.csv
+            - Remove from source CSV, flushing in the background
+        """
+        if not self.current_word or not self.current_meaning:
+            return
+
+        word, meaning, row = self.current_word, self.current_meaning, self.current_row
+        self.current_row = None
+        self.current_word = None
+        self.current_meaning = None
+
+        # Remove from memory before awaiting, so the next pick never sees it
+        if row is not None:
+            index = self.words.index_of(row)
+            if index is not None:
+                self.words.pop(index)
+            if self.sampler is not None:
+                self.sampler.remove(row)
+
+        saver = self.saver_factory.create_data_saver(self.known_file)
+        await saver.save_data(word, meaning)
+
+        await self.remover.mark_for_removal(word)
+        self._marked_count += 1
+
+        if self._marked_count >= self.flush_interval:
+            self._spawn(self.remover.flush())
+            self._marked_count = 0
+
+    async def mark_as_unknown(self) -> None:
+        """
+        Mark the current word as unknown:
+            - Save to unknown_words.csv
+        """
+        if not self.current_word or not self.current_meaning:
+            return
+
+        if self.sampler is not None and self.current_row is not None:
+            self.sampler.record(self.current_row, known=False)
+
+        saver = self.saver_factory.create_data_saver(self.unknown_file)
+        await saver.save_data(self.current_word, self.current_meaning)
+
+    async def reload_source(self) -> Tuple[int, int]:
+        """
+        Apply on-disk edits of the source file to the card pool.
+
+        The source is re-read in the executor and diffed row by row against
+        what was loaded: only inserted and deleted entries touch the pool.
+        The current card and the words marked for removal are left as they are.
+
+        Returns:
+            Tuple[int, int]: (inserted, deleted) entry counts.
+
+        Raises:
+            TypeError: If the deck is not held in a WordStore.
+        """
+        await self.loaded.wait()
+        if not isinstance(self.words, WordStore):
+            raise TypeError("Hot reload needs a WordStore-backed deck.")
+
+        retriever = self.loader_factory.create_data_retriever(self.source_file)
+        header = None
+        rows = []
+        async for batch in retriever.iter_rows():
+            if header is None:
+                header, batch = batch[0], batch[1:]
+            rows.extend(batch)
+
+        if self._snapshot is None:
+            self._snapshot = SourceSnapshot(self.words)
+        changes = self._snapshot.apply(SourceSnapshot.count_entries(rows))
+        if self.sampler is not None:
+            self.sampler.reset(self.words)
+
+        if header is not None and len(header) >= 2:
+            self._foreign_language, self._native_language = header[0], header[1]
+        return changes
+
+    async def watch(self, interval: float = 1.0) -> FileWatcher:
+        """
+        Hot-reload the source file whenever it changes on disk.
+
+        Reloads run on this manager's event loop.
+
+        Args:
+            interval (float): Seconds between polls of the source file.
+
+        Returns:
+            FileWatcher: Running watcher; call stop() to end it.
+
+        Raises:
+            TypeError: If the deck is not held in a WordStore.
+        """
+        if not isinstance(self.words, WordStore):
+            raise TypeError("Hot reload needs a WordStore-backed deck.")
+
+        loop = asyncio.get_running_loop()
+
+        def reload() -> None:
+            asyncio.run_coroutine_threadsafe(self.reload_source(), loop).result()
+
+        path = resolve_data_path(self.source_file)
+        return FileWatcher(path, reload, interval).start()
+
+    async def drain(self) -> None:
+        """Wait for background loading and removal flushes to finish."""
+        while self._pending:
+            await asyncio.gather(*self._pending)
+
+    # ==========================================================
+    # Private Utilities
+    # ==========================================================
+
+    def _spawn(self, coroutine) -> None:
+        """Run a coroutine as a background task, keeping a reference to it."""
+        task = asyncio.ensure_future(coroutine)
+        self._pending.add(task)
+        task.add_done_callback(self._pending.discard)
+
+    def _draw_index(self) -> int:
+        """
+        Draw a card position from the sampler.
+
+        Rows the sampler still tracks but the store no longer holds are
+        dropped and drawn again.
+
+        Returns:
+            int: Position of the drawn card.
+        """
+        while True:
+            row = self.sampler.draw()
+            index = self.words.index_of(row)
+            if index is not None:
+                return index
+            self.sampler.remove(row)
+
+    async def _load_remaining(
+        self, words: WordStore, batches: AsyncIterator[List[List[str]]]
+    ) -> None:
+        """
+        Append the remaining streamed batches to the word store.
+
+        Args:
+            words (WordStore): Word store already holding the first batch.
+            batches (AsyncIterator[List[List[str]]]): Remaining batches to load.
+        """
+        try:
+            async for batch in batches:
+                start = len(words)
+                words.extend(batch)
+                if self.sampler is not None:
+                    for index in range(start, len(words)):
+                        self.sampler.add(words.row_id(index))
+        finally:
+            self.loaded.set()
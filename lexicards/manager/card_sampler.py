@@ -0,0 +1,221 @@
+import random
+from array import array
+
+from lexicards.core.fenwick_tree import FenwickTree
+from lexicards.interfaces.manager.i_card_sampler import ICardSampler
+from lexicards.interfaces.manager.i_word_store import IWordStore
+
+# Integer weights: a miss doubles a card's weight up to MAX_WEIGHT, a recall halves it
+DEFAULT_WEIGHT = 8
+MIN_WEIGHT = 1
+MAX_WEIGHT = 256
+
+
+class WeightedCardSampler(ICardSampler):
+    """
+    Difficulty-biased sampler backed by a Fenwick tree.
+
+    Every card has an integer weight indexed by its row id; missed cards
+    gain weight and recalled cards lose it, so the learner sees difficult
+    cards more often. Drawing and reweighting are both O(log n), with no
+    cumulative-weight scan. Retired rows keep a zero-weight slot.
+
+    Attributes:
+        default_weight (int): Weight of a card that was never graded.
+        max_weight (int): Upper bound of a card's weight.
+    """
+
+    def __init__(
+        self,
+        default_weight: int = DEFAULT_WEIGHT,
+        max_weight: int = MAX_WEIGHT,
+        rng: random.Random | None = None,
+    ):
+        """
+        Initialize an empty sampler.
+
+        Args:
+            default_weight (int): Weight of a card that was never graded.
+            max_weight (int): Upper bound of a card's weight.
+            rng (random.Random | None): Random source, the module's by default.
+        """
+        self.default_weight = default_weight
+        self.max_weight = max_weight
+        self._rng = rng or random
+        self._tree = FenwickTree()
+
+    def reset(self, words: IWordStore) -> None:
+        """
+        Track the active cards of a store, keeping the weights already learned.
+
+        Args:
+            words (IWordStore): Store whose active cards are drawn from.
+        """
+        rows = [words.row_id(index) for index in range(len(words))]
+        old = self._tree
+        weights = [0] * (max(rows) + 1 if rows else 0)
+        for row in rows:
+            weight = old[row] if row < len(old) else 0
+            weights[row] = weight or self.default_weight
+        self._tree = FenwickTree(weights)
+
+    def add(self, row_id: int) -> None:
+        while len(self._tree) <= row_id:
+            self._tree.append(0)
+        self._tree.set(row_id, self.default_weight)
+
+    def remove(self, row_id: int) -> None:
+        if row_id < len(self._tree):
+            self._tree.set(row_id, 0)
+
+    def draw(self) -> int:
+        """
+        Draw a row id with probability proportional to its weight.
+
+        Returns:
+            int: Row id of the drawn card.
+
+        Raises:
+            ValueError: If no card is tracked.
+        """
+        total = self._tree.total
+        if not total:
+            raise ValueError("No words left to learn.")
+        return self._tree.find(self._rng.randrange(total))
+
+    def record(self, row_id: int, known: bool) -> None:
+        """
+        Halve a recalled card's weight or double a missed card's weight.
+
+        Args:
+            row_id (int): Row id of the graded card.
+            known (bool): True if the learner knew the card.
+        """
+        if row_id >= len(self._tree) or not self._tree[row_id]:
+            return
+        weight = self._tree[row_id]
+        if known:
+            weight = max(MIN_WEIGHT, weight // 2)
+        else:
+            weight = min(self.max_weight, weight * 2)
+        self._tree.set(row_id, weight)
+
+    def weight_of(self, row_id: int) -> int:
+        """Return the current weight of a row, 0 if it is not tracked."""
+        return self._tree[row_id] if row_id < len(self._tree) else 0
+
+
+class ShuffleBagSampler(ICardSampler):
+    """
+    No-repeat sampler drawing every card once per pass.
+
+    The bag is an array('I') of row ids split at a cursor: rows before it
+    were drawn this pass, rows after it are still waiting. A draw swaps a
+    random waiting row to the cursor (one step of Fisher-Yates), so it is
+    O(1) and never reshuffles or copies the bag; once no row is waiting
+    the cursor goes back to the start and a new pass begins. Cards retired
+    or added mid-pass are removed or appended in O(1) through a row id to
+    position map; added cards are still drawn in the current pass.
+    """
+
+    def __init__(self, rng: random.Random | None = None):
+        """
+        Initialize an empty bag.
+
+        Args:
+            rng (random.Random | None): Random source, the module's by default.
+        """
+        self._rng = rng or random
+        self._bag = array("I")
+        self._positions = array("i")
+        self._cursor = 0
+
+    def __len__(self) -> int:
+        return len(self._bag)
+
+    def reset(self, words: IWordStore) -> None:
+        """
+        Track the active cards of a store.
+
+        An empty bag is filled for a new pass; otherwise only the retired
+        and added cards are applied, so the current pass carries on.
+
+        Args:
+            words (IWordStore): Store whose active cards are drawn from.
+        """
+        rows = array("I", (words.row_id(index) for index in range(len(words))))
+        if self._bag:
+            active = set(rows)
+            for row in [row for row in self._bag if row not in active]:
+                self.remove(row)
+            for row in rows:
+                self.add(row)
+            return
+
+        self._bag = rows
+        self._positions = array("i", [-1]) * (max(rows, default=-1) + 1)
+        for position, row in enumerate(rows):
+            self._positions[row] = position
+        self._cursor = 0
+
+    def add(self, row_id: int) -> None:
+        if row_id < len(self._positions) and self._positions[row_id] >= 0:
+            return
+        if row_id >= len(self._positions):
+            self._positions.extend([-1] * (row_id + 1 - len(self._positions)))
+        self._positions[row_id] = len(self._bag)
+        self._bag.append(row_id)
+
+    def remove(self, row_id: int) -> None:
+        """
+        Take a card out of the bag in O(1), keeping the pass intact.
+
+        Args:
+            row_id (int): Row id of the retired card.
+        """
+        if row_id >= len(self._positions) or self._positions[row_id] < 0:
+            return
+        position = self._positions[row_id]
+        if position < self._cursor:
+            # Fill the hole with the last drawn row, shrinking the drawn part
+            self._cursor -= 1
+            self._move(self._cursor, position)
+            position = self._cursor
+        if position != len(self._bag) - 1:
+            self._move(len(self._bag) - 1, position)
+        self._bag.pop()
+        self._positions[row_id] = -1
+        if self._cursor >= len(self._bag):
+            self._cursor = 0
+
+    def draw(self) -> int:
+        """
+        Draw a card not drawn yet in this pass.
+
+        Returns:
+            int: Row id of the drawn card.
+
+        Raises:
+            ValueError: If the bag is empty.
+        """
+        if not self._bag:
+            raise ValueError("No words left to learn.")
+
+        chosen = self._rng.randrange(self._cursor, len(self._bag))
+        row = self._bag[chosen]
+        self._move(self._cursor, chosen)
+        self._bag[self._cursor] = row
+        self._positions[row] = self._cursor
+        self._cursor += 1
+        if self._cursor == len(self._bag):
+            self._cursor = 0
+        return row
+
+    def record(self, row_id: int, known: bool) -> None:
+        """Grades do not change the order of a shuffle bag."""
+
+    def _move(self, source: int, target: int) -> None:
+        """Copy the row at position source into position target."""
+        row = self._bag[source]
+        self._bag[target] = row
+        self._positions[row] = target
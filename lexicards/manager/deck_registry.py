@@ -0,0 +1,258 @@
+import threading
+from concurrent.futures import Future, ThreadPoolExecutor
+from typing import Dict, Iterator, List
+
+from lexicards.data.data_paths import list_deck_files, resolve_data_path
+from lexicards.data.data_retriever import DataRetrieverFactory
+from lexicards.interfaces.data.i_data_retriever import IDataRetriever
+from lexicards.interfaces.manager.i_word_store import IWordStore
+from lexicards.manager.shared_deck import FrozenDeck
+from lexicards.manager.word_store import WordStore
+
+
+class DeckRegistry:
+    """
+    Registry of every deck in the data directory, loaded in parallel.
+
+    Decks are loaded on a thread pool into word stores. The deck shown first
+    is submitted ahead of the others, so start-up only waits for that one;
+    switching to another deck later is instant once its load has finished.
+
+    Attributes:
+        loader_factory (DataRetrieverFactory): Factory for the deck retrievers.
+        data_dir (str | None): Directory scanned for decks.
+    """
+
+    def __init__(
+        self,
+        loader_factory: DataRetrieverFactory,
+        data_dir: str | None = None,
+        max_workers: int | None = None,
+    ):
+        """
+        Initialize the registry without loading any deck.
+
+        Args:
+            loader_factory (DataRetrieverFactory): Factory for the deck retrievers.
+            data_dir (str | None): Directory to scan, defaults to the data directory.
+            max_workers (int | None): Size of the loading thread pool.
+        """
+        self.loader_factory = loader_factory
+        self.data_dir = data_dir
+        self._executor = ThreadPoolExecutor(
+            max_workers=max_workers, thread_name_prefix="lexicards-decks"
+        )
+        self._futures: Dict[str, Future] = {}
+        self._frozen: Dict[str, FrozenDeck] = {}
+        self._lock = threading.Lock()
+
+    @property
+    def decks(self) -> List[str]:
+        """Return the absolute paths of every deck in the data directory."""
+        return list_deck_files(self.data_dir)
+
+    def start(self, first: str | None = None) -> None:
+        """
+        Start loading every deck in the background.
+
+        Args:
+            first (str | None): Deck to load ahead of the others.
+        """
+        if first is not None:
+            self.prefetch(first)
+        for path in self.decks:
+            self.prefetch(path)
+
+    def prefetch(self, deck: str) -> Future:
+        """
+        Start loading a deck unless it is already loading.
+
+        Args:
+            deck (str): Deck file name or path.
+
+        Returns:
+            Future: Future of the deck's word store.
+        """
+        path = resolve_data_path(deck)
+        with self._lock:
+            future = self._futures.get(path)
+            if future is None:
+                future = self._executor.submit(self._load, path)
+                self._futures[path] = future
+            return future
+
+    def get(self, deck: str) -> IWordStore:
+        """
+        Return a deck's word store, waiting for its load if needed.
+
+        Args:
+            deck (str): Deck file name or path.
+
+        Returns:
+            IWordStore: Pool of cards of the deck.
+
+        Raises:
+            DataFileNotFoundError: If the deck file does not exist.
+            DataCorruptionError: If the deck cannot be read or is corrupted.
+        """
+        return self.prefetch(deck).result()
+
+    def frozen(self, deck: str) -> FrozenDeck:
+        """
+        Return a deck frozen for sharing between sessions.
+
+        The deck is frozen once per process; its word store must not be
+        handed to a manager through RegistryDataRetriever afterwards.
+
+        Args:
+            deck (str): Deck file name or path.
+
+        Returns:
+            FrozenDeck: Immutable deck to open sessions on.
+
+        Raises:
+            DataFileNotFoundError: If the deck file does not exist.
+            DataCorruptionError: If the deck cannot be read or is corrupted.
+        """
+        path = resolve_data_path(deck)
+        store = self.get(path)
+        with self._lock:
+            frozen = self._frozen.get(path)
+            if frozen is None:
+                frozen = FrozenDeck(store)
+                self._frozen[path] = frozen
+            return frozen
+
+    def is_loaded(self, deck: str) -> bool:
+        """Return whether a deck has finished loading."""
+        with self._lock:
+            future = self._futures.get(resolve_data_path(deck))
+        return future is not None and future.done()
+
+    def close(self) -> None:
+        """Stop loading decks that have not started yet."""
+        self._executor.shutdown(wait=False, cancel_futures=True)
+
+    # ==========================================================
+    # Private Utilities
+    # ==========================================================
+
+    def _load(self, path: str) -> IWordStore:
+        """Load a deck into a word store."""
+        data = self.loader_factory.create_data_retriever(path).load_data()
+        if isinstance(data, IWordStore):
+            return data
+        return WordStore.from_rows(data)
+
+
+# --------------------------
+# Concrete Data Retriever
+# --------------------------
+class RegistryDataRetriever(IDataRetriever):
+    """
+    Retriever serving a deck from a DeckRegistry.
+
+    load_data() returns the registry's shared word store, so a WordManager
+    built on it starts without reloading the deck. iter_rows() still reads
+    the source itself, e.g. for hot reloads.
+
+    Attributes:
+        registry (DeckRegistry): Registry holding the deck.
+        filename (str): Deck file name or path.
+    """
+
+    def __init__(self, registry: DeckRegistry, filename: str):
+        """
+        Initialize the retriever.
+
+        Args:
+            registry (DeckRegistry): Registry holding the deck.
+            filename (str): Deck file name or path.
+        """
+        self.registry = registry
+        self.filename = filename
+
+    def load_data(self) -> IWordStore:
+        """Return the deck's word store, waiting for its load if needed."""
+        return self.registry.get(self.filename)
+
+    def iter_rows(self, batch_size: int = 1000) -> Iterator[List[List[str]]]:
+        """
+        Stream the deck fresh from its source, bypassing the shared store.
+
+        Args:
+            batch_size (int): Maximum number of rows per batch.
+
+        Returns:
+            Iterator[List[List[str]]]: Batches of word entries, header row first.
+        """
+        retriever = self.registry.loader_factory.create_data_retriever(self.filename)
+        return retriever.iter_rows(batch_size)
+
+
+# --------------------------
+# Concrete Factory
+# --------------------------
+class RegistryDataRetrieverFactory(DataRetrieverFactory):
+    """
+    Factory for creating RegistryDataRetriever instances.
+    """
+
+    def __init__(self, registry: DeckRegistry):
+        """
+        Initialize the factory.
+
+        Args:
+            registry (DeckRegistry): Registry serving the decks.
+        """
+        self.registry = registry
+
+    def create_data_retriever(self, filename: str) -> IDataRetriever:
+        """
+        Create and return a RegistryDataRetriever for a deck.
+
+        Args:
+            filename (str): Deck file name or path.
+
+        Returns:
+            RegistryDataRetriever: New instance of RegistryDataRetriever.
+        """
+        return RegistryDataRetriever(self.registry, filename)
+
+
+# --------------------------
+# Concrete Data Retriever
+# --------------------------
+class SessionDataRetriever(RegistryDataRetriever):
+    """
+    Retriever opening a new session on a deck shared through a DeckRegistry.
+
+    load_data() returns a SessionDeck over the registry's FrozenDeck, so
+    every WordManager built on it retires and adds cards in its own
+    overlay while the deck itself is held once per process.
+    """
+
+    def load_data(self) -> IWordStore:
+        """Return a new session on the frozen deck, waiting for its load."""
+        return self.registry.frozen(self.filename).session()
+
+
+# --------------------------
+# Concrete Factory
+# --------------------------
+class SessionDataRetrieverFactory(RegistryDataRetrieverFactory):
+    """
+    Factory for creating SessionDataRetriever instances.
+    """
+
+    def create_data_retriever(self, filename: str) -> IDataRetriever:
+        """
+        Create and return a SessionDataRetriever for a deck.
+
+        Args:
+            filename (str): Deck file name or path.
+
+        Returns:
+            SessionDataRetriever: New instance of SessionDataRetriever.
+        """
+        return SessionDataRetriever(self.registry, filename)
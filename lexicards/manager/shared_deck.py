@@ -0,0 +1,211 @@
+from typing import Dict, Iterable, List, Sequence, Tuple
+
+from lexicards.interfaces.manager.i_word_store import IWordStore
+from lexicards.manager.word_store import WordStore
+
+
+class FrozenDeck:
+    """
+    Immutable deck shared by every session of a process.
+
+    Wraps a WordStore that is never modified again: its packed buffer is
+    read-only from here on, so any number of SessionDecks can decode cards
+    from it concurrently without copying or locking.
+
+    Attributes:
+        header (Tuple[str, str]): Header labels of the deck.
+        row_count (int): Number of rows in the deck.
+    """
+
+    __slots__ = ("_store", "_row_count", "_retired")
+
+    def __init__(self, store: IWordStore):
+        """
+        Freeze a deck.
+
+        A WordStore is wrapped as-is and must not be modified afterwards;
+        other stores are copied into a WordStore once.
+
+        Args:
+            store (IWordStore): Deck to freeze.
+        """
+        if not isinstance(store, WordStore):
+            copy = WordStore(store.header)
+            copy.extend(store)
+            store = copy
+        self._store = store
+        self._row_count = store.row_count
+        # Rows already retired when frozen start out retired in every session
+        self._retired = tuple(
+            row for row in range(self._row_count) if store.index_of(row) is None
+        )
+
+    @classmethod
+    def from_rows(cls, rows: Iterable[Sequence[str]]) -> "FrozenDeck":
+        """
+        Build a frozen deck from retriever rows, header row first.
+
+        Raises:
+            ValueError: If the header has fewer than two columns.
+        """
+        return cls(WordStore.from_rows(rows))
+
+    @property
+    def header(self) -> Tuple[str, str]:
+        return self._store.header
+
+    @property
+    def row_count(self) -> int:
+        return self._row_count
+
+    def card(self, row_id: int) -> Tuple[str, str]:
+        """
+        Decode a card by row id.
+
+        Raises:
+            IndexError: If the row is not part of the deck.
+        """
+        if not 0 <= row_id < self._row_count:
+            raise IndexError("row id out of range")
+        return self._store.card(row_id)
+
+    def session(self) -> "SessionDeck":
+        """Return a new session view holding every card of the deck."""
+        return SessionDeck(self)
+
+
+class SessionDeck(IWordStore):
+    """
+    One learner's view of a FrozenDeck, as a copy-on-write overlay.
+
+    The session's card pool is a virtual array that starts as the identity
+    (position i holds row i). Only the changes are stored: positions and
+    row ids that moved (pop is swap-with-last, as in WordStore), retired
+    rows, and the cards added in this session, which get row ids after the
+    frozen deck's. Memory per session is O(changes), not O(deck).
+    """
+
+    __slots__ = ("_base", "_size", "_slots", "_where", "_added")
+
+    def __init__(self, base: FrozenDeck):
+        """
+        Initialize a session holding every active card of a frozen deck.
+
+        Args:
+            base (FrozenDeck): Shared deck.
+        """
+        self._base = base
+        self._size = base.row_count
+        self._slots: Dict[int, int] = {}  # position -> row id, where not identity
+        self._where: Dict[int, int] = {}  # row id -> position (-1 once retired)
+        self._added: List[Tuple[str, str]] = []
+        for row in base._retired:
+            self.pop(self.index_of(row))
+
+    @property
+    def header(self) -> Tuple[str, str]:
+        return self._base.header
+
+    @property
+    def row_count(self) -> int:
+        """Number of rows in the frozen deck plus the cards added in session."""
+        return self._base.row_count + len(self._added)
+
+    @property
+    def overlay_size(self) -> int:
+        """Number of entries this session stores on top of the frozen deck."""
+        return len(self._slots) + len(self._where) + len(self._added)
+
+    def __len__(self) -> int:
+        return self._size
+
+    def __getitem__(self, index: int) -> Tuple[str, str]:
+        return self.card(self.row_id(index))
+
+    def row_id(self, index: int) -> int:
+        index = self._position(index)
+        return self._slots.get(index, index)
+
+    def index_of(self, row_id: int) -> int | None:
+        position = self._where.get(row_id)
+        if position is None:
+            # Untouched rows are still at their own position
+            return row_id if 0 <= row_id < min(self._size, self.row_count) else None
+        return position if position >= 0 else None
+
+    def card(self, row_id: int) -> Tuple[str, str]:
+        """
+        Decode a card by row id, even after it was retired.
+
+        Raises:
+            IndexError: If no row was stored under the id.
+        """
+        if row_id >= self._base.row_count:
+            if row_id - self._base.row_count >= len(self._added):
+                raise IndexError("row id out of range")
+            return self._added[row_id - self._base.row_count]
+        return self._base.card(row_id)
+
+    def pop(self, index: int = -1) -> Tuple[str, str]:
+        """
+        Retire the card at a position in O(1) and return it.
+
+        The last card moves into the freed position; the frozen deck is
+        left untouched.
+
+        Args:
+            index (int): Position among the active cards.
+
+        Returns:
+            Tuple[str, str]: (word, meaning) of the retired card.
+        """
+        index = self._position(index)
+        last = self._size - 1
+        row = self.row_id(index)
+        if index != last:
+            self._place(index, self.row_id(last))
+        self._slots.pop(last, None)
+        self._where[row] = -1
+        self._size -= 1
+        return self.card(row)
+
+    def append(self, word: str, meaning: str) -> None:
+        """
+        Add a card to this session only.
+
+        Args:
+            word (str): Foreign-language word.
+            meaning (str): Translated meaning.
+        """
+        row = self.row_count
+        self._added.append((word, meaning))
+        self._place(self._size, row)
+        self._size += 1
+
+    def extend(self, rows: Iterable[Sequence[str]]) -> None:
+        """
+        Add every entry with at least two columns to this session.
+
+        Args:
+            rows (Iterable[Sequence[str]]): Word entries.
+        """
+        for row in rows:
+            if len(row) >= 2:
+                self.append(row[0], row[1])
+
+    def _position(self, index: int) -> int:
+        """Resolve a possibly negative position, raising IndexError if invalid."""
+        if index < 0:
+            index += self._size
+        if not 0 <= index < self._size:
+            raise IndexError("deck index out of range")
+        return index
+
+    def _place(self, position: int, row: int) -> None:
+        """Record that a row now sits at a position."""
+        if position == row:
+            self._slots.pop(position, None)
+            self._where.pop(row, None)
+        else:
+            self._slots[position] = row
+            self._where[row] = position
@@ -0,0 +1,92 @@
+from typing import Dict, Iterable, List, Sequence, Tuple
+
+from lexicards.manager.word_store import WordStore
+
+
+class SourceSnapshot:
+    """
+    Row-level snapshot of a deck's source file, mapped to word store rows.
+
+    Remembers which store row ids hold each (word, meaning) entry of the
+    source, including cards already retired this session. Diffing a fresh
+    read of the source against it yields only the inserted and deleted
+    entries, so a reload never resurrects retired cards or disturbs the
+    cards that did not change.
+
+    Attributes:
+        words (WordStore): Store the snapshot maps into.
+    """
+
+    def __init__(self, words: WordStore):
+        """
+        Snapshot every row ever loaded into a store.
+
+        Must be taken before any rows are appended from outside the source.
+
+        Args:
+            words (WordStore): Store loaded from the source.
+        """
+        self.words = words
+        self._rows: Dict[Tuple[str, str], List[int]] = {}
+        for row_id in range(words.row_count):
+            self._rows.setdefault(words.card(row_id), []).append(row_id)
+
+    @staticmethod
+    def count_entries(rows: Iterable[Sequence[str]]) -> Dict[Tuple[str, str], int]:
+        """
+        Count the (word, meaning) entries of a fresh read of the source.
+
+        Args:
+            rows (Iterable[Sequence[str]]): Word entries of the source,
+                without the header row.
+
+        Returns:
+            Dict[Tuple[str, str], int]: Number of rows per entry.
+        """
+        counts: Dict[Tuple[str, str], int] = {}
+        for row in rows:
+            if len(row) >= 2:
+                key = (row[0], row[1])
+                counts[key] = counts.get(key, 0) + 1
+        return counts
+
+    def apply(self, counts: Dict[Tuple[str, str], int]) -> Tuple[int, int]:
+        """
+        Bring the store in line with a fresh read of the source.
+
+        Entries that disappeared from the source are retired from the store
+        in O(1) each; new entries are appended. Duplicate entries are
+        matched by count.
+
+        Args:
+            counts (Dict[Tuple[str, str], int]): Entry counts of the source,
+                from count_entries().
+
+        Returns:
+            Tuple[int, int]: (inserted, deleted) entry counts.
+        """
+        deleted = 0
+        for key in [key for key in self._rows if key not in counts]:
+            deleted += self._drop(key, len(self._rows[key]))
+            del self._rows[key]
+
+        inserted = 0
+        for key, count in counts.items():
+            row_ids = self._rows.setdefault(key, [])
+            if count < len(row_ids):
+                deleted += self._drop(key, len(row_ids) - count)
+            while len(row_ids) < count:
+                self.words.append(*key)
+                row_ids.append(self.words.row_count - 1)
+                inserted += 1
+
+        return inserted, deleted
+
+    def _drop(self, key: Tuple[str, str], count: int) -> int:
+        """Forget the last count rows of an entry, retiring them if active."""
+        row_ids = self._rows[key]
+        for _ in range(count):
+            index = self.words.index_of(row_ids.pop())
+            if index is not None:
+                self.words.pop(index)
+        return count
@@ -0,0 +1,270 @@
+import atexit
+import time
+from concurrent.futures import Future
+from typing import Callable, Dict, Tuple
+
+from lexicards.core.due_queue import DueQueue
+from lexicards.data.data_paths import resolve_data_path
+from lexicards.data.data_writer import BackgroundWriter
+from lexicards.data.review_state import (
+    ReviewState,
+    load_review_state,
+    save_review_state,
+)
+from lexicards.manager.word_manager import WordManager
+
+DAY = 86400.0
+
+# SM-2 ease factor bounds and the ease lost on every miss
+START_EASE = 2.5
+MIN_EASE = 1.3
+EASE_PENALTY = 0.2
+
+
+class SpacedRepetitionWordManager(WordManager):
+    """
+    WordManager that picks cards from an SM-2 review schedule.
+
+    Each reviewed card keeps an interval, an ease factor and a repetition
+    count; its due time sits in a DueQueue, so the next due card is found
+    in O(log n). mark_as_known grows the interval (1 day, 6 days, then
+    interval * ease) and only retires the card to the known file once the
+    interval reaches graduate_after. mark_as_unknown resets the card and
+    brings it back after relearn_delay. When nothing is due, unseen cards
+    are introduced; when there are none left, the earliest card is shown
+    ahead of time. Schedules are stored by word in a compact state file
+    next to the progress files.
+
+    Attributes:
+        state_file (str): Review state file, relative to the data directory.
+        clock (Callable[[], float]): Source of the current time in seconds.
+        relearn_delay (float): Seconds before a missed card is due again.
+        skip_delay (float): Seconds a shown but ungraded card is deferred.
+        graduate_after (float): Interval, in seconds, at which a card retires.
+        _states (Dict[int, ReviewState]): Review state by stable row id.
+        _queue (DueQueue): Row ids ordered by due time.
+        _pending (Dict[str, ReviewState] | None): Saved states not yet matched
+            to rows, or None once restored.
+    """
+
+    def __init__(
+        self,
+        *args,
+        state_file: str = "review_state.bin",
+        clock: Callable[[], float] = time.time,
+        relearn_delay: float = 600.0,
+        skip_delay: float = 60.0,
+        graduate_after: float = 365 * DAY,
+        **kwargs,
+    ):
+        """
+        Initialize the manager and read the saved review states.
+
+        Args:
+            *args: Positional arguments of WordManager.
+            state_file (str): Review state file, relative to the data directory.
+            clock (Callable[[], float]): Source of the current time in seconds.
+            relearn_delay (float): Seconds before a missed card is due again.
+            skip_delay (float): Seconds a shown but ungraded card is deferred.
+            graduate_after (float): Interval, in seconds, at which a known
+                card is retired from the deck.
+            **kwargs: Keyword arguments of WordManager.
+
+        Raises:
+            DataCorruptionError: If the state file is corrupted.
+        """
+        super().__init__(*args, **kwargs)
+        self.state_file = state_file
+        self.clock = clock
+        self.relearn_delay = relearn_delay
+        self.skip_delay = skip_delay
+        self.graduate_after = graduate_after
+
+        self._states: Dict[int, ReviewState] = {}
+        self._queue = DueQueue()
+        self._pending = load_review_state(resolve_data_path(state_file))
+        self._new_cursor = 0
+        self._reviews = 0
+
+        # Grades since the last periodic save would be lost with the process
+        atexit.register(self.close)
+
+    # ==========================================================
+    # IWordManager Interface
+    # ==========================================================
+
+    def draw_card(self) -> Tuple[int | None, str, str]:
+        """
+        Pick the next card to review without making it current.
+
+        Due cards come first (earliest due first), then unseen cards, then
+        the card due soonest. The picked card is deferred by skip_delay so
+        skipping it, or drawing ahead, does not pick it again straight away.
+
+        Returns:
+            Tuple[int | None, str, str]: (row id, word, meaning)
+        """
+        with self._lock:
+            if not self.words:
+                raise ValueError("No words left to learn.")
+            if self._pending is not None and self.loaded.is_set():
+                self._restore()
+
+            now = self.clock()
+            row = self._pop_due(now)
+            if row is None:
+                row = self._next_unseen()
+            if row is None:
+                row = self._earliest()
+
+            state = self._states.get(row) or ReviewState(now, 0.0, START_EASE, 0)
+            self._set_state(row, state._replace(due=now + self.skip_delay))
+
+            return (row, *self.words[self.words.index_of(row)])
+
+    def mark_as_known(self) -> None:
+        """
+        Grade the current card as recalled:
+            - Grow its interval and schedule the next review
+            - Once the interval reaches graduate_after, retire it as known
+        """
+        row = self.current_row
+        if row is None:
+            super().mark_as_known()
+            return
+        if not self.current_word or not self.current_meaning:
+            return
+
+        now = self.clock()
+        with self._lock:
+            state = self._states.get(row) or ReviewState(now, 0.0, START_EASE, 0)
+            if state.reps == 0:
+                interval = DAY
+            elif state.reps == 1:
+                interval = 6 * DAY
+            else:
+                interval = state.interval * state.ease
+
+            if interval < self.graduate_after:
+                self._set_state(
+                    row,
+                    ReviewState(now + interval, interval, state.ease, state.reps + 1),
+                )
+            else:
+                self._states.pop(row, None)
+                self._queue.remove(row)
+
+        if interval < self.graduate_after:
+            self.current_row = None
+            self.current_word = None
+            self.current_meaning = None
+        else:
+            super().mark_as_known()
+        self._count_review()
+
+    def mark_as_unknown(self) -> None:
+        """
+        Grade the current card as missed:
+            - Save to unknown_words.csv
+            - Lower its ease and review it again after relearn_delay
+        """
+        super().mark_as_unknown()
+        row = self.current_row
+        if row is None or not self.current_word or not self.current_meaning:
+            return
+
+        now = self.clock()
+        with self._lock:
+            state = self._states.get(row) or ReviewState(now, 0.0, START_EASE, 0)
+            ease = max(MIN_EASE, state.ease - EASE_PENALTY)
+            self._set_state(row, ReviewState(now + self.relearn_delay, 0.0, ease, 0))
+        self._count_review()
+
+    def save_state(self) -> Future:
+        """
+        Write the review states to the state file in the background.
+
+        Returns:
+            Future: Resolved once the file is on disk.
+        """
+        with self._lock:
+            states = dict(self._pending or {})
+            for row, state in self._states.items():
+                index = self.words.index_of(row)
+                if index is not None:
+                    states[self.words[index][0]] = state
+
+        path = resolve_data_path(self.state_file)
+        return BackgroundWriter.for_file(path).call(
+            lambda: save_review_state(path, states)
+        )
+
+    def close(self) -> None:
+        """Save the review states graded since the last save and wait for it."""
+        if self._reviews:
+            self._reviews = 0
+            self.save_state().result()
+
+    # ==========================================================
+    # Private Utilities
+    # ==========================================================
+
+    def _set_state(self, row: int, state: ReviewState) -> None:
+        """Store a card's review state and queue it at its due time."""
+        self._states[row] = state
+        self._queue.schedule(row, state.due)
+
+    def _count_review(self) -> None:
+        """Save the review states every flush_interval grades."""
+        self._reviews += 1
+        if self._reviews >= self.flush_interval:
+            self._reviews = 0
+            self.save_state()
+
+    def _restore(self) -> None:
+        """Match saved states to loaded rows by word; one pass over the deck."""
+        pending, self._pending = self._pending, None
+        if not pending:
+            return
+        for index in range(len(self.words)):
+            row = self.words.row_id(index)
+            state = pending.get(self.words[index][0])
+            if state is not None and row not in self._states:
+                self._set_state(row, state)
+
+    def _pop_due(self, now: float) -> int | None:
+        """Pop the earliest due row still in the deck."""
+        while True:
+            row = self._queue.pop_due(now)
+            if row is None or self.words.index_of(row) is not None:
+                return row
+            self._states.pop(row, None)
+
+    def _next_unseen(self) -> int | None:
+        """
+        Find a row without review state, cycling through positions.
+
+        Returns:
+            int | None: Row id of an unseen card, or None if all were seen.
+        """
+        if len(self._states) >= len(self.words):
+            return None
+        for _ in range(len(self.words)):
+            self._new_cursor %= len(self.words)
+            row = self.words.row_id(self._new_cursor)
+            self._new_cursor += 1
+            if row not in self._states:
+                return row
+        return None
+
+    def _earliest(self) -> int:
+        """Return the row due soonest, dropping rows no longer in the deck."""
+        while True:
+            earliest = self._queue.peek()
+            if earliest is None:
+                return self.words.row_id(0)
+            row = earliest[0]
+            if self.words.index_of(row) is not None:
+                return row
+            self._queue.remove(row)
+            self._states.pop(row, None)
@@ -1,10 +1,20 @@
+import itertools
 import random
-from typing import List, Tuple
+import threading
+from typing import Iterator, List, Tuple
 
+from lexicards.data.data_paths import resolve_data_path
 from lexicards.data.data_remover import DataRemoverFactory
 from lexicards.data.data_retriever import DataRetrieverFactory
 from lexicards.data.data_saver import DataSaverFactory
+from lexicards.data.file_watcher import FileWatcher
+from lexicards.data.session_log import KNOWN, UNKNOWN, SessionLog
+from lexicards.interfaces.manager.i_card_sampler import ICardSampler
 from lexicards.interfaces.manager.i_manager import IWordManager
+from lexicards.interfaces.manager.i_word_store import IWordStore
+from lexicards.interfaces.search.i_card_search import ICardSearchIndex
+from lexicards.manager.source_snapshot import SourceSnapshot
+from lexicards.manager.word_store import WordStore
 
 
 class WordManager(IWordManager):
@@ -22,13 +32,22 @@ class WordManager(IWordManager):
         known_file (str): CSV file to save known words.
         unknown_file (str): CSV file to save unknown words.
         flush_interval (int): Number of marked words before flushing removals to CSV.
+        load_batch_size (int | None): Batch size for streaming the deck, or None
+            to load it in one call.
+        loaded (threading.Event): Set once the whole deck has been loaded.
+        sampler (ICardSampler | None): Strategy picking the next card, or None
+            for a uniform random pick.
+        session_log (SessionLog | None): Event log the progress is recorded in
+            and resumed from, or None.
+        search_index (ICardSearchIndex | None): Index kept in sync with the
+            active cards for find_cards(), or None.
         _marked_count (int): Tracks how many words have been marked for removal.
-        words (List[List[str]]): List of loaded word pairs.
-        current_index (int | None): Index of the current word.
+        words (IWordStore): Pool of active cards, without the header row.
+        current_row (int | None): Stable row id of the current word.
         current_word (str | None): Current word.
         current_meaning (str | None): Meaning of the current word.
-        _foreign_language (str | None): Foreign language label from CSV header.
-        _native_language (str | None): Native language label from CSV header.
+        _foreign_language (str): Foreign language label from CSV header.
+        _native_language (str): Native language label from CSV header.
     """
 
     def __init__(
@@ -40,6 +59,10 @@ class WordManager(IWordManager):
         known_file: str = "known_words.csv",
         unknown_file: str = "unknown_words.csv",
         flush_interval=5,
+        load_batch_size: int | None = None,
+        sampler: ICardSampler | None = None,
+        session_log: SessionLog | None = None,
+        search_index: ICardSearchIndex | None = None,
     ):
         """
         Initialize WordManager.
@@ -52,6 +75,17 @@ class WordManager(IWordManager):
             known_file (str): CSV file to save known words.
             unknown_file (str): CSV file to save unknown words.
             flush_interval (int): Number of marked words before flushing to CSV
+            load_batch_size (int | None): When set, the deck is streamed in
+                batches of this size: the session starts on the first batch
+                while the rest loads in a background thread.
+            sampler (ICardSampler | None): Strategy picking the next card;
+                None draws uniformly at random.
+            session_log (SessionLog | None): Event log to resume from: known
+                words still in the deck are retired again (and re-queued for
+                removal), missed words are fed to the sampler, and known words
+                no longer in the deck are dropped from the log.
+            search_index (ICardSearchIndex | None): Index to keep in sync with
+                the active cards, for find_cards().
         """
 
         self.loader_factory = loader_factory
@@ -67,17 +101,25 @@ class WordManager(IWordManager):
         self.flush_interval = flush_interval
         self._marked_count = 0
 
-        self.words: List[List[str]] = self._load_words()
-        self.current_index = None
+        self.load_batch_size = load_batch_size
+        self.loaded = threading.Event()
+        self._lock = threading.Lock()
+        self.sampler = sampler
+        self.session_log = session_log
+        self.search_index = search_index
+        # Restored known words not yet found among the loaded cards
+        self._unseen_known = set()
+        if session_log is not None:
+            self._unseen_known = set(session_log.restore().known)
+
+        self.words: IWordStore = self._load_words()
+        self._snapshot = None
+        self.current_row = None
         self.current_word = None
         self.current_meaning = None
 
         # Language labels
-        self._foreign_language: None
-        self._native_language: None
-        if self.words:
-            self._foreign_language = self.words[0][0]
-            self._native_language = self.words[0][1]
+        self._foreign_language, self._native_language = self.words.header
 
     # ==========================================================
     # IWordManager Interface
@@ -98,25 +140,62 @@ class WordManager(IWordManager):
         Returns:
             tuple[str, str]: (word, meaning)
         """
-        if not self.words or len(self.words[0]) < 2:
-            raise ValueError("CSV data must contain at least two columns per row.")
+        while True:
+            row, word, meaning = self.draw_card()
+            if self.show_card(row, word, meaning):
+                return word, meaning
+
+    def draw_card(self) -> Tuple[int | None, str, str]:
+        """
+        Pick a random card without making it current.
+
+        Safe to call from a background thread, e.g. to prefetch cards.
+
+        Returns:
+            Tuple[int | None, str, str]: (row id, word, meaning)
+        """
+        with self._lock:
+            if not self.words:
+                raise ValueError("No words left to learn.")
+
+            if self.sampler is None:
+                index = random.randrange(len(self.words))
+            else:
+                index = self._draw_index()
+            return (self.words.row_id(index), *self.words[index])
+
+    def show_card(self, row_id: int | None, word: str, meaning: str) -> bool:
+        """
+        Make a drawn card the current word.
 
-        self.current_index = random.randrange(len(self.words))
-        self.current_word = self.words[self.current_index][0]
-        self.current_meaning = self.words[self.current_index][1]
+        Args:
+            row_id (int | None): Row id returned by draw_card.
+            word (str): Word of the card.
+            meaning (str): Meaning of the card.
 
-        return self.current_word, self.current_meaning
+        Returns:
+            bool: False if the card was retired since it was drawn.
+        """
+        with self._lock:
+            if row_id is not None and self.words.index_of(row_id) is None:
+                return False
+            self.current_row = row_id
+            self.current_word, self.current_meaning = word, meaning
+        return True
 
     def mark_as_known(self) -> None:
         """
         Mark the current word as known:
             - Save to known_words.csv
             - Remove from source CSV
-            - Remove from in-memory list
+            - Retire from the in-memory word store in O(1)
         """
         if not self.current_word or not self.current_meaning:
             return
 
+        if self.session_log is not None:
+            self.session_log.append(KNOWN, self.current_word, self.current_meaning)
+
         # Save to known
         saver = self.saver_factory.create_data_saver(self.known_file)
         saver.save_data(self.current_word, self.current_meaning)
@@ -130,9 +209,16 @@ class WordManager(IWordManager):
             self._marked_count = 0
 
         # Remove from memory
-        if self.current_index is not None:
-            self.words.pop(self.current_index)
-            self.current_index = None
+        if self.current_row is not None:
+            with self._lock:
+                index = self.words.index_of(self.current_row)
+                if index is not None:
+                    self.words.pop(index)
+                if self.sampler is not None:
+                    self.sampler.remove(self.current_row)
+                if self.search_index is not None:
+                    self.search_index.remove(self.current_row)
+            self.current_row = None
             self.current_word = None
             self.current_meaning = None
 
@@ -144,25 +230,236 @@ class WordManager(IWordManager):
         if not self.current_word or not self.current_meaning:
             return
 
+        if self.session_log is not None:
+            self.session_log.append(UNKNOWN, self.current_word, self.current_meaning)
+
         saver = self.saver_factory.create_data_saver(self.unknown_file)
         saver.save_data(self.current_word, self.current_meaning)
 
+        if self.sampler is not None and self.current_row is not None:
+            with self._lock:
+                self.sampler.record(self.current_row, known=False)
+
+    def reload_source(self) -> Tuple[int, int]:
+        """
+        Apply on-disk edits of the source file to the card pool.
+
+        The source is re-read and diffed row by row against what was loaded:
+        only inserted and deleted entries touch the pool. The current card
+        and the words marked for removal are left as they are.
+
+        Returns:
+            Tuple[int, int]: (inserted, deleted) entry counts.
+
+        Raises:
+            TypeError: If the deck is not held in a WordStore.
+        """
+        self.loaded.wait()
+        if not isinstance(self.words, WordStore):
+            raise TypeError("Hot reload needs a WordStore-backed deck.")
+
+        retriever = self.loader_factory.create_data_retriever(self.source_file)
+        rows = itertools.chain.from_iterable(retriever.iter_rows())
+        header = next(rows, None)
+        counts = SourceSnapshot.count_entries(rows)
+
+        with self._lock:
+            if self._snapshot is None:
+                self._snapshot = SourceSnapshot(self.words)
+            changes = self._snapshot.apply(counts)
+            if self.sampler is not None:
+                self.sampler.reset(self.words)
+            if self.search_index is not None:
+                self.search_index.reset(self.words)
+
+        if header is not None and len(header) >= 2:
+            self._foreign_language, self._native_language = header[0], header[1]
+        return changes
+
+    def find_cards(self, query: str, limit: int = 20) -> List[Tuple[str, str]]:
+        """
+        Search the active cards by word prefix, then by meaning.
+
+        Args:
+            query (str): Start of a foreign word or part of a meaning.
+            limit (int): Maximum number of results.
+
+        Returns:
+            List[Tuple[str, str]]: (word, meaning) pairs, word matches first.
+
+        Raises:
+            RuntimeError: If the manager has no search index.
+        """
+        if self.search_index is None:
+            raise RuntimeError("WordManager was created without a search index.")
+        with self._lock:
+            results = self.search_index.find_words(query, limit)
+            if len(results) < limit:
+                seen = set(results)
+                for card in self.search_index.find_meanings(query, limit):
+                    if card not in seen and len(results) < limit:
+                        results.append(card)
+        return results
+
+    def watch(self, interval: float = 1.0) -> FileWatcher:
+        """
+        Hot-reload the source file whenever it changes on disk.
+
+        Args:
+            interval (float): Seconds between polls of the source file.
+
+        Returns:
+            FileWatcher: Running watcher; call stop() to end it.
+
+        Raises:
+            TypeError: If the deck is not held in a WordStore.
+        """
+        if not isinstance(self.words, WordStore):
+            raise TypeError("Hot reload needs a WordStore-backed deck.")
+
+        path = resolve_data_path(self.source_file)
+        return FileWatcher(path, self.reload_source, interval).start()
+
     # ==========================================================
     # Private Utilities
     # ==========================================================
 
-    def _load_words(self) -> List[List[str]]:
+    def _load_words(self) -> IWordStore:
         """
-        Load words from the source CSV file.
+        Load words from the source CSV file into a word store.
+
+        Retrievers that already return an IWordStore (e.g. compiled decks)
+        are used as-is; plain rows are packed into a compact WordStore.
 
         Returns:
-            list[list[str]]: List of word pairs [word, meaning]
+            IWordStore: Pool of cards with the header kept apart.
 
         Raises:
             ValueError: If CSV has fewer than two columns
         """
         retriever = self.loader_factory.create_data_retriever(self.source_file)
-        words = retriever.load_data()
-        if not words or len(words[0]) < 2:
-            raise ValueError("CSV data must contain at least two columns per row.")
+
+        if self.load_batch_size is None:
+            data = retriever.load_data()
+            self.loaded.set()
+            if not isinstance(data, IWordStore):
+                data = WordStore.from_rows(data)
+            if self.sampler is not None:
+                self.sampler.reset(data)
+            if self.search_index is not None:
+                self.search_index.reset(data)
+            self._resume(data, 0)
+            self._prune_session()
+            return data
+
+        batches = retriever.iter_rows(self.load_batch_size)
+        words = WordStore.from_rows(next(batches, []))
+        if self.sampler is not None:
+            self.sampler.reset(words)
+        if self.search_index is not None:
+            self.search_index.reset(words)
+        self._resume(words, 0)
+
+        threading.Thread(
+            target=self._load_remaining, args=(words, batches), daemon=True
+        ).start()
         return words
+
+    def _resume(self, words: IWordStore, start: int) -> None:
+        """
+        Apply the restored session state to newly loaded cards.
+
+        Known words whose removal never reached the source are retired and
+        queued for removal again; missed words gain sampler weight. Each
+        card is checked once, as it is loaded, with set lookups.
+
+        Args:
+            words (IWordStore): Store being loaded.
+            start (int): Position of the first newly loaded card.
+        """
+        if self.session_log is None:
+            return
+        state = self.session_log.state
+        if not state.known and not state.missed:
+            return
+
+        known, missed = [], []
+        for index in range(start, len(words)):
+            row = words.row_id(index)
+            word = words.card(row)[0]
+            if word in state.known:
+                known.append((row, word))
+            elif word in state.missed:
+                missed.append((row, word))
+
+        # Retire after the scan: popping moves cards between positions
+        for row, word in known:
+            words.pop(words.index_of(row))
+            if self.sampler is not None:
+                self.sampler.remove(row)
+            if self.search_index is not None:
+                self.search_index.remove(row)
+            self.remover.mark_for_removal(word)
+            self._unseen_known.discard(word)
+        if self.sampler is not None:
+            for row, word in missed:
+                for _ in range(min(state.missed[word], 8)):
+                    self.sampler.record(row, known=False)
+
+        if known:
+            self.remover.flush_async()
+
+    def _prune_session(self) -> None:
+        """
+        Drop restored known words the loaded deck no longer holds.
+
+        Their removal reached the source, so later starts need not look
+        for them again.
+        """
+        if self.session_log is not None and self._unseen_known:
+            self.session_log.forget_known(self._unseen_known)
+        self._unseen_known = set()
+
+    def _draw_index(self) -> int:
+        """
+        Draw a card position from the sampler.
+
+        Rows the sampler still tracks but the store no longer holds are
+        dropped and drawn again.
+
+        Returns:
+            int: Position of the drawn card.
+        """
+        while True:
+            row = self.sampler.draw()
+            index = self.words.index_of(row)
+            if index is not None:
+                return index
+            self.sampler.remove(row)
+
+    def _load_remaining(
+        self, words: WordStore, batches: Iterator[List[List[str]]]
+    ) -> None:
+        """
+        Append the remaining streamed batches to the word store.
+
+        Args:
+            words (WordStore): Word store already holding the first batch.
+            batches (Iterator[List[List[str]]]): Remaining batches to load.
+        """
+        try:
+            for batch in batches:
+                with self._lock:
+                    start = len(words)
+                    words.extend(batch)
+                    rows = [words.row_id(index) for index in range(start, len(words))]
+                    if self.sampler is not None:
+                        for row in rows:
+                            self.sampler.add(row)
+                    if self.search_index is not None:
+                        self.search_index.extend(rows)
+                    self._resume(words, start)
+            with self._lock:
+                self._prune_session()
+        finally:
+            self.loaded.set()
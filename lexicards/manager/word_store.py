@@ -0,0 +1,151 @@
+from array import array
+from typing import Iterable, Sequence, Tuple
+
+from lexicards.core.active_pool import ActivePool
+from lexicards.interfaces.manager.i_word_store import IWordStore
+
+
+class WordStore(IWordStore):
+    """
+    Compact, array-backed pool of cards.
+
+    All words and meanings are packed as UTF-8 into one contiguous buffer
+    indexed by an array('I') offset table, instead of one Python list and two
+    str objects per card. Strings are only decoded when a card is accessed.
+    Removed cards are dropped from an ActivePool in O(1); their bytes stay
+    in the buffer and their row ids are never reused.
+
+    Attributes:
+        header (Tuple[str, str]): Header labels kept apart from the cards.
+    """
+
+    __slots__ = ("_header", "_blob", "_offsets", "_pool")
+
+    def __init__(self, header: Tuple[str, str]):
+        """
+        Initialize an empty store.
+
+        Args:
+            header (Tuple[str, str]): (foreign language, native language) labels.
+        """
+        self._header = tuple(header[:2])
+        self._blob = bytearray()
+        self._offsets = array("I", [0])
+        self._pool = ActivePool()
+
+    @classmethod
+    def from_rows(cls, rows: Iterable[Sequence[str]]) -> "WordStore":
+        """
+        Build a store from retriever rows, header row first.
+
+        Args:
+            rows (Iterable[Sequence[str]]): Header row followed by word entries.
+
+        Returns:
+            WordStore: Store holding the header and every complete entry.
+
+        Raises:
+            ValueError: If the header has fewer than two columns.
+        """
+        rows = iter(rows)
+        header = next(rows, None)
+        if not header or len(header) < 2:
+            raise ValueError("CSV data must contain at least two columns per row.")
+
+        store = cls((header[0], header[1]))
+        store.extend(rows)
+        return store
+
+    @property
+    def header(self) -> Tuple[str, str]:
+        return self._header
+
+    def __len__(self) -> int:
+        return len(self._pool)
+
+    def __getitem__(self, index: int) -> Tuple[str, str]:
+        """
+        Decode the card at a position.
+
+        Args:
+            index (int): Position among the active cards.
+
+        Returns:
+            Tuple[str, str]: (word, meaning)
+        """
+        return self._decode(self._pool.row_at(index))
+
+    def pop(self, index: int = -1) -> Tuple[str, str]:
+        """
+        Remove the card at a position in O(1) and return it.
+
+        The last card moves into the freed position.
+
+        Args:
+            index (int): Position among the active cards.
+
+        Returns:
+            Tuple[str, str]: (word, meaning) of the removed card.
+        """
+        return self._decode(self._pool.remove_at(index))
+
+    def row_id(self, index: int) -> int:
+        return self._pool.row_at(index)
+
+    def index_of(self, row_id: int) -> int | None:
+        return self._pool.index_of(row_id)
+
+    @property
+    def row_count(self) -> int:
+        """Number of rows ever stored, including removed cards."""
+        return len(self._offsets) // 2
+
+    def card(self, row_id: int) -> Tuple[str, str]:
+        """
+        Decode a card by its stable row id, even after it was removed.
+
+        Args:
+            row_id (int): Stable row id.
+
+        Returns:
+            Tuple[str, str]: (word, meaning)
+
+        Raises:
+            IndexError: If no row was stored under the id.
+        """
+        if not 0 <= row_id < self.row_count:
+            raise IndexError("row id out of range")
+        return self._decode(row_id)
+
+    def append(self, word: str, meaning: str) -> None:
+        """
+        Add a card at the end of the store.
+
+        Args:
+            word (str): Foreign-language word.
+            meaning (str): Translated meaning.
+        """
+        self._pool.add(len(self._offsets) // 2)
+        self._blob += word.encode("utf-8")
+        self._offsets.append(len(self._blob))
+        self._blob += meaning.encode("utf-8")
+        self._offsets.append(len(self._blob))
+
+    def extend(self, rows: Iterable[Sequence[str]]) -> None:
+        """
+        Add every entry with at least two columns.
+
+        Args:
+            rows (Iterable[Sequence[str]]): Word entries.
+        """
+        for row in rows:
+            if len(row) >= 2:
+                self.append(row[0], row[1])
+
+    def _decode(self, row: int) -> Tuple[str, str]:
+        """Decode the word and meaning stored for a row number."""
+        start, middle, end = self._offsets[2 * row : 2 * row + 3]
+        return (
+            self._blob[start:middle].decode("utf-8"),
+            self._blob[middle:end].decode("utf-8"),
+        )
@@ -0,0 +1,111 @@
+from itertools import islice
+from typing import Iterable, List, Tuple
+
+from lexicards.interfaces.manager.i_word_store import IWordStore
+from lexicards.interfaces.search.i_card_search import ICardSearchIndex
+from lexicards.manager.word_store import WordStore
+from lexicards.search.prefix_trie import PrefixTrie
+from lexicards.search.text_normalize import normalize_key
+from lexicards.search.trigram_index import TrigramIndex
+
+
+class CardSearchIndex(ICardSearchIndex):
+    """
+    Search index over the active cards of a word store.
+
+    Foreign words go into a prefix trie and meanings into a trigram index,
+    both keyed by normalize_key(), so lookups ignore case, BOMs and
+    full-width/half-width differences. Only row ids are indexed; results
+    are decoded from the store, which keeps retired rows readable.
+    """
+
+    def __init__(self):
+        """Initialize an index over an empty store."""
+        self._words: IWordStore = WordStore(("", ""))
+        self._trie = PrefixTrie()
+        self._meanings = TrigramIndex(self._meaning_key)
+
+    def __len__(self) -> int:
+        return len(self._trie)
+
+    def reset(self, words: IWordStore) -> None:
+        """
+        Rebuild the index over the active cards of a store.
+
+        Args:
+            words (IWordStore): Store to index.
+        """
+        self._words = words
+        self._trie = PrefixTrie()
+        self._meanings = TrigramIndex(self._meaning_key)
+        meanings = []
+        for index in range(len(words)):
+            row_id = words.row_id(index)
+            word, meaning = words.card(row_id)
+            self._trie.insert(normalize_key(word), row_id)
+            meanings.append((normalize_key(meaning), row_id))
+        self._meanings.extend(meanings)
+
+    def add(self, row_id: int) -> None:
+        word, meaning = self._words.card(row_id)
+        self._trie.insert(normalize_key(word), row_id)
+        self._meanings.insert(normalize_key(meaning), row_id)
+
+    def extend(self, row_ids: Iterable[int]) -> None:
+        """
+        Index a batch of cards added to the store.
+
+        Meanings are packed into the trigram postings once per batch
+        instead of once per card.
+
+        Args:
+            row_ids (Iterable[int]): Row ids of the added cards.
+        """
+        meanings = []
+        for row_id in row_ids:
+            word, meaning = self._words.card(row_id)
+            self._trie.insert(normalize_key(word), row_id)
+            meanings.append((normalize_key(meaning), row_id))
+        self._meanings.extend(meanings)
+
+    def remove(self, row_id: int) -> None:
+        if self._trie.remove(normalize_key(self._words.card(row_id)[0]), row_id):
+            self._meanings.remove(row_id)
+
+    def find_words(self, prefix: str, limit: int = 20) -> List[Tuple[str, str]]:
+        """
+        Look up cards by the start of their foreign word.
+
+        Args:
+            prefix (str): Start of the word, as typed.
+            limit (int): Maximum number of results.
+
+        Returns:
+            List[Tuple[str, str]]: (word, meaning) pairs in word order.
+        """
+        key = normalize_key(prefix)
+        if not key:
+            return []
+        rows = islice(self._trie.iter_prefix(key), limit)
+        return [self._words.card(row) for row in rows]
+
+    def find_meanings(self, text: str, limit: int = 20) -> List[Tuple[str, str]]:
+        """
+        Look up cards whose meaning contains a text.
+
+        Texts of two characters match the start of a word in the meaning;
+        shorter texts match nothing.
+
+        Args:
+            text (str): Part of the meaning, as typed.
+            limit (int): Maximum number of results.
+
+        Returns:
+            List[Tuple[str, str]]: (word, meaning) pairs in deck order.
+        """
+        rows = islice(self._meanings.search(normalize_key(text)), limit)
+        return [self._words.card(row) for row in rows]
+
+    def _meaning_key(self, row_id: int) -> str:
+        """Return the normalized meaning of a row."""
+        return normalize_key(self._words.card(row_id)[1])
@@ -0,0 +1,172 @@
+from bisect import bisect_left, insort
+from typing import Dict, Iterator, List
+
+# Keys a leaf holds before it bursts into child nodes
+BUCKET_SIZE = 64
+
+
+class _Node:
+    """Trie node: a sorted leaf bucket, or children keyed by character."""
+
+    __slots__ = ("children", "keys", "rows")
+
+    def __init__(self):
+        self.children: Dict[str, "_Node"] | None = None
+        self.keys: List[str] | None = []
+        # Remaining key suffix -> row ids; only "" once the node has burst
+        self.rows: Dict[str, List[int]] = {}
+
+
+class PrefixTrie:
+    """
+    Burst trie mapping string keys to row ids, for prefix lookups.
+
+    The upper levels are ordinary trie nodes with one child per character;
+    below them, up to BUCKET_SIZE key suffixes sit in a sorted leaf bucket
+    that bursts into child nodes when it overflows. This keeps the number
+    of Python objects near n / BUCKET_SIZE instead of one per character,
+    while a lookup still walks at most len(prefix) nodes and then bisects
+    one bucket. Results come out in key order.
+    """
+
+    __slots__ = ("_root", "_size")
+
+    def __init__(self):
+        self._root = _Node()
+        self._size = 0
+
+    def __len__(self) -> int:
+        """Return the number of (key, row) entries."""
+        return self._size
+
+    def insert(self, key: str, row_id: int) -> None:
+        """
+        Add a row under a key.
+
+        Args:
+            key (str): Normalized key.
+            row_id (int): Row id stored under the key.
+        """
+        node, depth = self._descend(key, create=True)
+        self._add(node, key[depth:], row_id)
+        self._size += 1
+
+    def remove(self, key: str, row_id: int) -> bool:
+        """
+        Remove a row from a key.
+
+        Args:
+            key (str): Normalized key the row was inserted under.
+            row_id (int): Row id to remove.
+
+        Returns:
+            bool: False if the row was not stored under the key.
+        """
+        node, depth = self._descend(key)
+        if node is None:
+            return False
+        suffix = key[depth:]
+        rows = node.rows.get(suffix)
+        if rows is None or row_id not in rows:
+            return False
+
+        rows.remove(row_id)
+        if not rows:
+            del node.rows[suffix]
+            if node.keys is not None:
+                del node.keys[bisect_left(node.keys, suffix)]
+        self._size -= 1
+        return True
+
+    def iter_prefix(self, prefix: str) -> Iterator[int]:
+        """
+        Yield the row ids of every key starting with a prefix, in key order.
+
+        Args:
+            prefix (str): Normalized prefix.
+
+        Yields:
+            int: Row ids.
+        """
+        node, depth = self._descend(prefix)
+        if node is None:
+            return
+        rest = prefix[depth:]
+        if node.keys is not None:
+            keys = node.keys
+            for position in range(bisect_left(keys, rest), len(keys)):
+                if not keys[position].startswith(rest):
+                    break
+                yield from node.rows[keys[position]]
+        else:
+            yield from self._iter_node(node)
+
+    # ==========================================================
+    # Private Utilities
+    # ==========================================================
+
+    def _descend(self, key: str, create: bool = False, node: _Node | None = None):
+        """
+        Walk trie nodes along a key as far as they go.
+
+        Args:
+            key (str): Key, relative to the start node.
+            create (bool): Create missing nodes instead of stopping.
+            node (_Node | None): Node to start from, defaults to the root.
+
+        Returns:
+            Tuple[_Node | None, int]: Node reached (a leaf, or an inner node
+            once the key is used up) and the number of characters consumed.
+        """
+        node = self._root if node is None else node
+        depth = 0
+        while node.children is not None and depth < len(key):
+            child = node.children.get(key[depth])
+            if child is None:
+                if not create:
+                    return None, depth
+                child = node.children[key[depth]] = _Node()
+            node = child
+            depth += 1
+        return node, depth
+
+    def _add(self, node: _Node, suffix: str, row_id: int) -> None:
+        """Store a row under a suffix at a node, bursting full buckets."""
+        rows = node.rows.get(suffix)
+        if rows is not None:
+            rows.append(row_id)
+            return
+        node.rows[suffix] = [row_id]
+        if node.keys is None:
+            return
+        insort(node.keys, suffix)
+        if len(node.keys) > BUCKET_SIZE:
+            self._burst(node)
+
+    def _burst(self, node: _Node) -> None:
+        """Turn a leaf bucket into child nodes keyed by the next character."""
+        keys, rows = node.keys, node.rows
+        node.keys = None
+        node.children = {}
+        node.rows = {}
+        for suffix in keys:
+            if not suffix:
+                node.rows[""] = rows[""]
+                continue
+            child = node.children.get(suffix[0])
+            if child is None:
+                child = node.children[suffix[0]] = _Node()
+            # The child may burst in turn, so walk down to a bucket each time
+            for row_id in rows[suffix]:
+                target, depth = self._descend(suffix[1:], create=True, node=child)
+                self._add(target, suffix[1 + depth :], row_id)
+
+    def _iter_node(self, node: _Node) -> Iterator[int]:
+        """Yield every row id below a node, in key order."""
+        if node.keys is not None:
+            for key in node.keys:
+                yield from node.rows[key]
+            return
+        yield from node.rows.get("", ())
+        for char in sorted(node.children):
+            yield from self._iter_node(node.children[char])
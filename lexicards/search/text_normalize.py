@@ -0,0 +1,18 @@
+import unicodedata
+
+
+def normalize_key(text: str) -> str:
+    """
+    Normalize text for searching.
+
+    Removes byte order marks (the first header cell of a UTF-8-BOM CSV
+    carries one), applies NFKC so full-width and half-width forms match,
+    trims whitespace and case-folds.
+
+    Args:
+        text (str): Word or meaning as stored in the deck.
+
+    Returns:
+        str: Search key.
+    """
+    return unicodedata.normalize("NFKC", text.replace("\ufeff", "")).strip().casefold()
@@ -0,0 +1,171 @@
+from array import array
+from bisect import bisect_left, insort
+from collections import defaultdict
+from operator import itemgetter
+from typing import Callable, Dict, Iterable, Iterator, List, Set, Tuple
+
+
+def trigrams(text: str) -> Set[str]:
+    """
+    Return the trigrams of a normalized text padded with a space on each side.
+
+    The padding gives word starts and ends trigrams of their own, so
+    two-character queries can still be looked up as word prefixes.
+    """
+    padded = f" {text} "
+    return {padded[i : i + 3] for i in range(len(padded) - 2)}
+
+
+class TrigramIndex:
+    """
+    Inverted index from character trigrams to row ids, for substring search.
+
+    Each trigram maps to a sorted array('I') of the rows containing it. A
+    query intersects the posting lists of its trigrams, walking the shortest
+    one and bisecting the others, then checks each candidate's text, since
+    sharing every trigram does not guarantee a substring match. Retired rows
+    are skipped through a set and dropped from the postings in one pass once
+    they make up a quarter of the index.
+
+    Attributes:
+        text_of (Callable[[int], str]): Returns the normalized text of a row.
+    """
+
+    __slots__ = ("text_of", "_postings", "_rows", "_retired")
+
+    def __init__(self, text_of: Callable[[int], str]):
+        """
+        Initialize an empty index.
+
+        Args:
+            text_of (Callable[[int], str]): Returns the normalized text of a
+                row, used to verify candidates.
+        """
+        self.text_of = text_of
+        self._postings: Dict[str, array] = {}
+        self._rows = 0
+        self._retired: Set[int] = set()
+
+    def __len__(self) -> int:
+        """Return the number of indexed rows, retired ones excluded."""
+        return self._rows - len(self._retired)
+
+    def insert(self, text: str, row_id: int) -> None:
+        """
+        Index a row under the trigrams of its normalized text.
+
+        Args:
+            text (str): Normalized text of the row.
+            row_id (int): Row id.
+        """
+        if row_id in self._retired:
+            # Re-added before compaction: its postings are still in place
+            self._retired.discard(row_id)
+            return
+        for gram in trigrams(text):
+            rows = self._postings.get(gram)
+            if rows is None:
+                self._postings[gram] = array("I", (row_id,))
+            elif rows[-1] < row_id:
+                rows.append(row_id)
+            else:
+                insort(rows, row_id)
+        self._rows += 1
+
+    def extend(self, items: Iterable[Tuple[str, int]]) -> None:
+        """
+        Index many rows at once.
+
+        Postings are gathered in plain lists in row order and packed once,
+        which is several times faster than insert() for a whole deck.
+
+        Args:
+            items (Iterable[Tuple[str, int]]): (normalized text, row id) pairs.
+        """
+        gathered: Dict[str, List[int]] = defaultdict(list)
+        for text, row_id in sorted(items, key=itemgetter(1)):
+            if row_id in self._retired:
+                self._retired.discard(row_id)
+                continue
+            for gram in trigrams(text):
+                gathered[gram].append(row_id)
+            self._rows += 1
+
+        for gram, rows in gathered.items():
+            old = self._postings.get(gram)
+            if old is None:
+                self._postings[gram] = array("I", rows)
+            elif old[-1] < rows[0]:
+                old.extend(rows)
+            else:
+                self._postings[gram] = array("I", sorted(old + array("I", rows)))
+
+    def remove(self, row_id: int) -> None:
+        """
+        Retire a row from the index.
+
+        Args:
+            row_id (int): Row id.
+        """
+        self._retired.add(row_id)
+        if len(self._retired) * 4 > max(self._rows, 4096):
+            self._compact()
+
+    def search(self, text: str) -> Iterator[int]:
+        """
+        Yield the rows whose normalized text contains a query, in row order.
+
+        Queries of two characters match word prefixes only; shorter ones
+        match nothing.
+
+        Args:
+            text (str): Normalized query.
+
+        Yields:
+            int: Row ids.
+        """
+        if len(text) < 2:
+            return
+        query = text if len(text) >= 3 else " " + text
+        grams = {query[i : i + 3] for i in range(len(query) - 2)}
+        lists: List[array] = []
+        for gram in grams:
+            rows = self._postings.get(gram)
+            if rows is None:
+                return
+            lists.append(rows)
+        lists.sort(key=len)
+
+        shortest, others = lists[0], lists[1:]
+        starts = [0] * len(others)
+        for row in shortest:
+            if row in self._retired or not self._in_all(row, others, starts):
+                continue
+            if query in f" {self.text_of(row)} ":
+                yield row
+
+    # ==========================================================
+    # Private Utilities
+    # ==========================================================
+
+    @staticmethod
+    def _in_all(row: int, lists: List[array], starts: List[int]) -> bool:
+        """Check a row is in every sorted list, advancing the search starts."""
+        for i, rows in enumerate(lists):
+            position = bisect_left(rows, row, starts[i])
+            starts[i] = position
+            if position == len(rows) or rows[position] != row:
+                return False
+        return True
+
+    def _compact(self) -> None:
+        """Drop the retired rows from every posting list."""
+        retired = self._retired
+        for gram, rows in list(self._postings.items()):
+            kept = array("I", (row for row in rows if row not in retired))
+            if kept:
+                self._postings[gram] = kept
+            else:
+                del self._postings[gram]
+        self._rows -= len(retired)
+        self._retired = set()
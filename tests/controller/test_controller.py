@@ -1,8 +1,14 @@
+import time
 import unittest
 from unittest.mock import MagicMock
 
+from lexicards.controllers.async_lexical_controller import AsyncLexicalController
+from lexicards.controllers.card_prefetcher import CardPrefetcher
+from lexicards.controllers.deck_switcher import DeckSwitcher
 from lexicards.controllers.lexical_controller import LexicalController
+from lexicards.core.loop_bridge import TkLoopBridge
 from lexicards.interfaces.audio.i_audio_servcie import IAudioService
+from lexicards.interfaces.manager.i_async_manager import IAsyncWordManager
 from lexicards.interfaces.manager.i_manager import IWordManager
 from lexicards.interfaces.ui.manager.i_ui_manager import IUiManager
 
@@ -34,5 +40,134 @@ class TestController(unittest.TestCase):
         self.ui.run_after.assert_called_once()
 
 
+class TestDeckSwitcher(unittest.TestCase):
+    def setUp(self):
+        self.ui = MagicMock(spec=IUiManager)
+        self.decks = ["/decks/french_words.csv", "/decks/japanese_words.csv"]
+        self.managers = {}
+        for path, labels in zip(
+            self.decks, [("French", "English"), ("Japanese", "English")]
+        ):
+            manager = MagicMock(spec=IWordManager)
+            manager.foreign_language, manager.native_language = labels
+            manager.get_random_word.return_value = (labels[0], labels[1])
+            self.managers[path] = manager
+
+        self.open_deck = MagicMock(side_effect=self.managers.get)
+        self.controller = LexicalController(
+            self.ui, self.managers[self.decks[1]], MagicMock(spec=IAudioService)
+        )
+        self.switcher = DeckSwitcher(
+            self.controller, self.decks[1], lambda: self.decks, self.open_deck
+        )
+
+    def test_next_deck_switches_manager_and_shows_a_card(self):
+        self.switcher.next_deck()
+
+        self.assertIs(self.controller.manager, self.managers[self.decks[0]])
+        self.ui.initialize_ui.assert_called_with("French", "English")
+        self.ui.update_word_display.assert_called_with("French")
+
+    def test_managers_are_opened_once_per_deck(self):
+        self.switcher.next_deck()
+        self.switcher.next_deck()
+        self.switcher.next_deck()
+
+        self.assertIs(self.controller.manager, self.managers[self.decks[0]])
+        self.open_deck.assert_called_once_with(self.decks[0])
+
+    def test_switch_stops_the_old_prefetcher(self):
+        old = MagicMock(spec=CardPrefetcher)
+        new = MagicMock(spec=CardPrefetcher)
+        new.next_card.return_value.display_word = "partie"
+        self.controller.prefetcher = old
+        self.switcher.prefetch = lambda manager: new
+
+        self.switcher.switch_to(self.decks[0])
+
+        old.stop.assert_called_once()
+        self.assertIs(self.controller.prefetcher, new)
+        self.ui.update_word_display.assert_called_with("partie")
+
+
+class TestCardPrefetcher(unittest.TestCase):
+    def setUp(self):
+        self.manager = MagicMock(spec=IWordManager)
+        self.manager.foreign_language = "Japanese"
+        self.audio = MagicMock(spec=IAudioService)
+
+    def test_queue_serves_prepared_cards(self):
+        self.manager.draw_card.return_value = (0, "\ufeff川 ", "River")
+        self.manager.show_card.return_value = True
+        prefetcher = CardPrefetcher(self.manager, self.audio, depth=2).start()
+        self.addCleanup(prefetcher.stop)
+
+        deadline = time.monotonic() + 1
+        while not prefetcher._ready.full() and time.monotonic() < deadline:
+            time.sleep(0.001)
+        card = prefetcher.next_card()
+
+        self.assertEqual((card.display_word, card.word), ("川", "\ufeff川 "))
+        self.assertEqual((prefetcher.hits, prefetcher.misses), (1, 0))
+        self.manager.show_card.assert_called_once_with(0, "\ufeff川 ", "River")
+        self.audio.warm.assert_called_with("Japanese")
+
+    def test_retired_card_is_skipped_on_miss(self):
+        self.manager.draw_card.side_effect = [(0, "川", "River"), (1, "山", "Mountain")]
+        self.manager.show_card.side_effect = [False, True]
+        prefetcher = CardPrefetcher(self.manager, self.audio)
+
+        self.assertEqual(prefetcher.next_card().word, "山")
+        self.assertEqual((prefetcher.hits, prefetcher.misses), (0, 2))
+
+    def test_controller_shows_prefetched_card(self):
+        ui = MagicMock(spec=IUiManager)
+        prefetcher = MagicMock(spec=CardPrefetcher)
+        prefetcher.next_card.return_value.display_word = "川"
+        controller = LexicalController(ui, self.manager, self.audio, prefetcher)
+
+        controller.handle_next_word()
+
+        ui.update_word_display.assert_called_once_with("川")
+        self.manager.get_random_word.assert_not_called()
+
+
+class TestAsyncController(unittest.TestCase):
+    def setUp(self):
+        self.ui = MagicMock(spec=IUiManager)
+        self.manager = MagicMock(spec=IAsyncWordManager)
+        self.audio = MagicMock(spec=IAudioService)
+
+        self.manager.foreign_language = "Japanese"
+        self.manager.native_language = "English"
+
+        # Collects Tk-thread callbacks instead of running a Tk main loop
+        self.scheduled = []
+        self.bridge = TkLoopBridge(
+            lambda delay, callback: self.scheduled.append(callback)
+        )
+        self.addCleanup(self.bridge.close)
+
+        self.controller = AsyncLexicalController(
+            ui=self.ui, manager=self.manager, audio=self.audio, bridge=self.bridge
+        )
+
+    def test_handle_next_word_updates_ui_on_tk_thread(self):
+        async def get_random_word():
+            return ("川", "River")
+
+        self.manager.get_random_word.side_effect = get_random_word
+
+        self.controller.handle_next_word().result(timeout=1)
+        self.ui.update_word_display.assert_not_called()
+
+        deadline = time.monotonic() + 1
+        while self.scheduled and time.monotonic() < deadline:
+            self.scheduled.pop(0)()
+
+        self.ui.update_word_display.assert_called_once_with("川")
+        self.assertEqual(self.controller.current_meaning, "River")
+
+
 if __name__ == "__main__":
     unittest.main()
@@ -1,6 +1,34 @@
+import lzma
+import os
+import tempfile
+import time
 import unittest
-from unittest.mock import MagicMock
+from unittest.mock import MagicMock, patch
 
+from lexicards.core.fingerprint_set import FingerprintSet
+from lexicards.data.compiled_deck import CompiledDeckRetriever
+from lexicards.data.data_paths import list_deck_files
+from lexicards.data.data_remover import CSVDataRemover
+from lexicards.data.data_retriever import CSVDataRetriever, read_deck_header
+from lexicards.data.data_saver import CSVDataSaverFactory
+from lexicards.data.data_writer import BackgroundWriter
+from lexicards.data.deck_cache import DeckCache
+from lexicards.data.deck_import import import_deck
+from lexicards.data.file_watcher import FileWatcher
+from lexicards.data.history_merge import consolidate_history, external_sort
+from lexicards.data.session_log import KNOWN, UNKNOWN, SessionLog
+from lexicards.data.sharded_deck import (
+    ShardedDataRemover,
+    ShardedDeckRetriever,
+    read_manifest,
+)
+from lexicards.data.sqlite_storage import (
+    SQLiteDatabase,
+    SQLiteDataRemoverFactory,
+    SQLiteDataRetrieverFactory,
+    SQLiteDataSaverFactory,
+)
+from lexicards.errors.error import DataCorruptionError
 from lexicards.interfaces.data.i_data_retriever import IDataRetriever
 from lexicards.interfaces.data.i_data_saver import IDataSaver
 
@@ -22,5 +50,604 @@ class TestDataServices(unittest.TestCase):
         mock_saver.save_data.assert_called_once_with("川", "River")
 
 
+class TestCSVDataSaver(unittest.TestCase):
+    def setUp(self):
+        self.tmp = tempfile.TemporaryDirectory()
+        self.path = os.path.join(self.tmp.name, "known_words.csv")
+        self.factory = CSVDataSaverFactory("Japanese", "English")
+
+    def tearDown(self):
+        self.tmp.cleanup()
+
+    def read_rows(self):
+        BackgroundWriter.for_file(self.path).drain()
+        with open(self.path, encoding="utf-8") as file:
+            return file.read().splitlines()
+
+    def test_factory_pools_one_saver_per_path(self):
+        saver = self.factory.create_data_saver(self.path)
+
+        self.assertIs(saver, self.factory.create_data_saver(self.path))
+
+    def test_saver_skips_duplicates_across_calls(self):
+        saver = self.factory.create_data_saver(self.path)
+        saver.save_data("川", "River")
+        saver.save_data("川", "River")
+
+        self.assertEqual(self.read_rows(), ["Japanese,English", "川,River"])
+
+    def test_saver_reloads_after_external_change(self):
+        saver = self.factory.create_data_saver(self.path)
+        saver.save_data("川", "River")
+        saver.writer.drain()
+
+        with open(self.path, "w", encoding="utf-8") as file:
+            file.write("Japanese,English\n山,Mountain\n")
+
+        saver.save_data("山", "Mountain")
+        saver.save_data("川", "River")
+
+        self.assertEqual(
+            self.read_rows(), ["Japanese,English", "山,Mountain", "川,River"]
+        )
+
+    def test_buffered_saver_group_commits(self):
+        factory = CSVDataSaverFactory("Japanese", "English", buffer_rows=2)
+        saver = factory.create_data_saver(self.path)
+        saver.save_data("川", "River")
+        saver.save_data("川", "River")
+        saver.writer.drain()
+
+        self.assertFalse(os.path.exists(self.path))
+
+        saver.save_data("山", "Mountain")
+        saver.save_data("空", "Sky")
+        saver.flush()
+
+        self.assertEqual(
+            self.read_rows(),
+            ["Japanese,English", "川,River", "山,Mountain", "空,Sky"],
+        )
+
+    def test_compact_index_skips_duplicates(self):
+        with open(self.path, "w", encoding="utf-8") as file:
+            file.write("Japanese,English\n山,Mountain\n")
+
+        factory = CSVDataSaverFactory("Japanese", "English", compact_index=True)
+        saver = factory.create_data_saver(self.path)
+        saver.save_data("山", "Mountain")
+        saver.save_data("川", "River")
+
+        self.assertIsInstance(saver.existing_words, FingerprintSet)
+        self.assertEqual(
+            self.read_rows(), ["Japanese,English", "山,Mountain", "川,River"]
+        )
+
+
+class TestCompressedStorage(unittest.TestCase):
+    def setUp(self):
+        self.tmp = tempfile.TemporaryDirectory()
+
+    def tearDown(self):
+        self.tmp.cleanup()
+
+    def test_gzip_appends_add_members(self):
+        path = os.path.join(self.tmp.name, "known_words.csv.gz")
+        saver = CSVDataSaverFactory("Japanese", "English").create_data_saver(path)
+        saver.save_data("川", "River")
+        saver.flush()
+        saver.save_data("山", "Mountain")
+        saver.flush()
+
+        with open(path, "rb") as file:
+            self.assertEqual(file.read().count(b"\x1f\x8b\x08"), 2)
+        self.assertEqual(
+            CSVDataRetriever(path).load_data(),
+            [["Japanese", "English"], ["川", "River"], ["山", "Mountain"]],
+        )
+
+    def test_xz_deck_removal_and_discovery(self):
+        path = os.path.join(self.tmp.name, "deck.csv.xz")
+        with lzma.open(path, "wt", encoding="utf-8") as file:
+            file.write("Japanese,English\n川,River\n山,Mountain\n")
+        open(os.path.join(self.tmp.name, "known_words.csv.gz"), "wb").close()
+
+        CSVDataRemover(path).remove_word("川")
+
+        self.assertEqual(
+            CSVDataRetriever(path).load_data(),
+            [["Japanese", "English"], ["山", "Mountain"]],
+        )
+        self.assertEqual(list_deck_files(self.tmp.name), [path])
+
+    def test_per_deck_progress_files_are_not_decks(self):
+        deck = os.path.join(self.tmp.name, "french_words.csv")
+        for name in [
+            "french_words.csv",
+            "french_words.known_words.csv",
+            "french_words.unknown_words.csv.gz",
+        ]:
+            with open(os.path.join(self.tmp.name, name), "w", encoding="utf-8") as file:
+                file.write("French,English\n")
+
+        self.assertEqual(list_deck_files(self.tmp.name), [deck])
+        self.assertEqual(read_deck_header(deck), ("French", "English"))
+
+
+class TestDeckImport(unittest.TestCase):
+    def setUp(self):
+        self.tmp = tempfile.TemporaryDirectory()
+        self.input = os.path.join(self.tmp.name, "dump.tsv")
+        with open(self.input, "w", encoding="utf-8") as file:
+            file.write("Japanese\tEnglish\n")
+            file.write("  川 \tRiver\n山\tMountain   peak\n川\tStream\nbroken\n")
+
+    def tearDown(self):
+        self.tmp.cleanup()
+
+    def test_ranges_normalize_and_deduplicate(self):
+        output = os.path.join(self.tmp.name, "deck.csv")
+        result = import_deck([self.input], output, workers=2, chunk_bytes=7)
+
+        self.assertEqual(
+            CSVDataRetriever(output).load_data(),
+            [["Japanese", "English"], ["川", "River"], ["山", "Mountain peak"]],
+        )
+        self.assertEqual(
+            (result.rows_read, result.duplicates, result.skipped), (4, 1, 1)
+        )
+
+
+class TestHistoryMerge(unittest.TestCase):
+    def setUp(self):
+        self.tmp = tempfile.TemporaryDirectory()
+        self.paths = {}
+        files = {
+            "known": "Japanese,English\n空,Sky\n川,River\n空,Heaven\n山,Mountain\n",
+            "unknown": "Japanese,English\n海,Sea\n川,Stream\n海,Ocean\n",
+            "deck": "Japanese,English\n山,Mountain\n木,Tree\n",
+        }
+        for name, content in files.items():
+            self.paths[name] = os.path.join(self.tmp.name, f"{name}.csv")
+            with open(self.paths[name], "w", encoding="utf-8") as file:
+                file.write(content)
+
+    def tearDown(self):
+        self.tmp.cleanup()
+
+    def test_external_sort_keeps_first_occurrence(self):
+        output = os.path.join(self.tmp.name, "sorted.csv")
+        written = external_sort(self.paths["known"], output, max_rows=1, fan_in=2)
+
+        self.assertEqual(written, 3)
+        self.assertEqual(
+            CSVDataRetriever(output).load_data(),
+            [
+                ["Japanese", "English"],
+                ["山", "Mountain"],
+                ["川", "River"],
+                ["空", "Sky"],
+            ],
+        )
+
+    def test_consolidate_reports_overlap_and_reconciles_deck(self):
+        report = os.path.join(self.tmp.name, "report.csv")
+        result = consolidate_history(
+            self.paths["known"],
+            self.paths["unknown"],
+            self.paths["deck"],
+            report,
+            max_rows=2,
+        )
+
+        self.assertEqual(tuple(result), (3, 2, 1, 1))
+        self.assertEqual(
+            CSVDataRetriever(report).load_data()[1:], [["川", "River", "Stream"]]
+        )
+        self.assertEqual(
+            CSVDataRetriever(self.paths["deck"]).load_data(),
+            [["Japanese", "English"], ["木", "Tree"]],
+        )
+
+
+class TestSessionLog(unittest.TestCase):
+    def setUp(self):
+        self.tmp = tempfile.TemporaryDirectory()
+        self.path = os.path.join(self.tmp.name, "session.log")
+
+    def tearDown(self):
+        self.tmp.cleanup()
+
+    def test_snapshot_then_replay_tail(self):
+        log = SessionLog(self.path, snapshot_every=2)
+        log.restore()
+        log.append(KNOWN, "川", "River")
+        log.append(UNKNOWN, "山", "Mountain")
+        log.append(UNKNOWN, "山", "Mountain")
+        log.close()
+
+        with open(self.path, "ab") as file:
+            file.write(b"\x01torn")
+        restored = SessionLog(self.path)
+        state = restored.restore()
+        self.addCleanup(restored.close)
+
+        self.assertEqual(state.known, {"川"})
+        self.assertEqual(state.missed, {"山": 2})
+        self.assertEqual(state.events, 3)
+        self.assertEqual(restored._since_snapshot, 1)
+
+    def test_log_folded_into_snapshot_is_not_replayed(self):
+        log = SessionLog(self.path)
+        log.restore()
+        log.append(UNKNOWN, "山", "Mountain")
+        log.close()
+        # A crash right after the snapshot leaves the old log behind
+        with open(self.path, "rb") as file:
+            old_log = file.read()
+        log.restore()
+        log.snapshot()
+        log.close()
+        with open(self.path, "wb") as file:
+            file.write(old_log)
+
+        restored = SessionLog(self.path)
+        self.addCleanup(restored.close)
+        self.assertEqual(restored.restore().missed, {"山": 1})
+
+    def test_overlong_field_is_cut_on_a_character_boundary(self):
+        word = "川" * 30000  # 90000 UTF-8 bytes
+        log = SessionLog(self.path)
+        log.restore()
+        log.append(KNOWN, word, "River")
+        log.close()
+
+        restored = SessionLog(self.path)
+        self.addCleanup(restored.close)
+        self.assertEqual(restored.restore().known, {"川" * (0xFFFF // 3)})
+
+    def test_invalid_utf8_record_raises_corruption_error(self):
+        log = SessionLog(self.path)
+        log.restore()
+        log.append(KNOWN, "川", "River")
+        log.close()
+        with open(self.path, "r+b") as file:
+            data = file.read()
+            file.seek(data.index("川".encode("utf-8")))
+            file.write(b"\xff")
+
+        with self.assertRaises(DataCorruptionError):
+            SessionLog(self.path).restore()
+
+
+class TestFingerprintSet(unittest.TestCase):
+    def test_colliding_fingerprints_stay_exact(self):
+        with patch.object(FingerprintSet, "_fingerprint", return_value=42):
+            words = FingerprintSet(["川", "山", "空"])
+            words.discard("山")
+
+            self.assertIn("川", words)
+            self.assertIn("空", words)
+            self.assertNotIn("山", words)
+            self.assertNotIn("海", words)
+            self.assertEqual(len(words), 2)
+
+    def test_grows_past_initial_capacity(self):
+        words = FingerprintSet(f"word{i}" for i in range(1000))
+
+        self.assertEqual(len(words), 1000)
+        self.assertIn("word999", words)
+        self.assertEqual(set(words), {f"word{i}" for i in range(1000)})
+
+
+class TestCSVDataRetriever(unittest.TestCase):
+    def setUp(self):
+        self.tmp = tempfile.TemporaryDirectory()
+        self.path = os.path.join(self.tmp.name, "deck.csv")
+        with open(self.path, "w", encoding="utf-8") as file:
+            file.write("Japanese,English\n川,River\n山,Mountain\n")
+
+    def tearDown(self):
+        self.tmp.cleanup()
+
+    def test_iter_rows_yields_batches(self):
+        batches = list(CSVDataRetriever(self.path).iter_rows(batch_size=2))
+
+        self.assertEqual(
+            batches,
+            [[["Japanese", "English"], ["川", "River"]], [["山", "Mountain"]]],
+        )
+
+    def test_warm_start_skips_csv_parser(self):
+        cache = DeckCache(os.path.join(self.tmp.name, "cache"))
+        rows = CSVDataRetriever(self.path, cache=cache).load_data()
+
+        with patch("lexicards.data.data_retriever.csv.reader") as reader:
+            warm = CSVDataRetriever(self.path, cache=cache).load_data()
+
+        reader.assert_not_called()
+        self.assertEqual(warm, rows)
+
+    def test_cache_invalidated_when_source_changes(self):
+        cache = DeckCache(os.path.join(self.tmp.name, "cache"))
+        CSVDataRetriever(self.path, cache=cache).load_data()
+
+        # Same size and mtime: only the content hash can tell them apart
+        stat = os.stat(self.path)
+        with open(self.path, "w", encoding="utf-8") as file:
+            file.write("Japanese,English\n川,River\n山,Mauntain\n")
+        os.utime(self.path, ns=(stat.st_atime_ns, stat.st_mtime_ns))
+
+        rows = CSVDataRetriever(self.path, cache=cache).load_data()
+        self.assertEqual(rows[2], ["山", "Mauntain"])
+
+
+class TestBackgroundWriter(unittest.TestCase):
+    def setUp(self):
+        self.tmp = tempfile.TemporaryDirectory()
+        self.path = os.path.join(self.tmp.name, "deck.csv")
+        self.writer = BackgroundWriter.for_directory(self.tmp.name)
+
+    def tearDown(self):
+        self.writer.close()
+        self.tmp.cleanup()
+
+    def test_writes_are_applied_in_order(self):
+        header = ["Japanese", "English"]
+        self.writer.append_rows(self.path, [["川", "River"]], header=header)
+        self.writer.append_rows(self.path, [["山", "Mountain"]], header=header)
+        self.writer.remove_rows(self.path, {"川"})
+        self.writer.append_rows(self.path, [["川", "River"]], header=header)
+        self.writer.close()
+
+        with open(self.path, encoding="utf-8") as file:
+            self.assertEqual(
+                file.read().splitlines(),
+                ["Japanese,English", "山,Mountain", "川,River"],
+            )
+
+    def test_remover_flush_async_goes_through_writer(self):
+        with open(self.path, "w", encoding="utf-8") as file:
+            file.write("Japanese,English\n川,River\n山,Mountain\n")
+        remover = CSVDataRemover(self.path)
+        remover.mark_for_removal("川")
+        remover.flush_async()
+        remover.writer.drain()
+
+        self.assertEqual(
+            CSVDataRetriever(self.path).load_data(),
+            [["Japanese", "English"], ["山", "Mountain"]],
+        )
+
+    def test_remover_flushes_marked_words_at_exit(self):
+        with open(self.path, "w", encoding="utf-8") as file:
+            file.write("Japanese,English\n川,River\n山,Mountain\n")
+        with patch("lexicards.data.data_remover.atexit") as mock_atexit:
+            remover = CSVDataRemover(self.path)
+        remover.mark_for_removal("川")
+
+        mock_atexit.register.assert_called_once_with(remover.flush)
+        mock_atexit.register.call_args.args[0]()
+
+        self.assertEqual(
+            CSVDataRetriever(self.path).load_data(),
+            [["Japanese", "English"], ["山", "Mountain"]],
+        )
+
+
+class TestFileWatcher(unittest.TestCase):
+    def setUp(self):
+        self.tmp = tempfile.TemporaryDirectory()
+        self.path = os.path.join(self.tmp.name, "deck.csv")
+        with open(self.path, "w", encoding="utf-8") as file:
+            file.write("Japanese,English\n川,River\n")
+
+    def tearDown(self):
+        self.tmp.cleanup()
+
+    def test_atomic_replace_is_reported_once(self):
+        on_change = MagicMock()
+        watcher = FileWatcher(self.path, on_change)
+        self.assertFalse(watcher.check())
+
+        temp_path = self.path + ".tmp"
+        with open(temp_path, "w", encoding="utf-8") as file:
+            file.write("Japanese,English\n山,Mountain\n")
+        os.replace(temp_path, self.path)
+
+        self.assertTrue(watcher.check())
+        self.assertFalse(watcher.check())
+        on_change.assert_called_once_with()
+
+
+class TestCSVDataRemoverJournal(unittest.TestCase):
+    def setUp(self):
+        self.tmp = tempfile.TemporaryDirectory()
+        self.path = os.path.join(self.tmp.name, "deck.csv")
+        with open(self.path, "w", encoding="utf-8") as file:
+            file.write("Japanese,English\n川,River\n山,Mountain\n")
+
+    def tearDown(self):
+        self.tmp.cleanup()
+
+    def test_journal_filters_removed_words_at_load(self):
+        remover = CSVDataRemover(self.path, journal=True, compact_bytes=1 << 20)
+        remover.compact_ratio = 1.0
+        remover.mark_for_removal("川")
+        remover.flush()
+
+        self.assertTrue(os.path.isfile(remover.journal.path))
+        self.assertEqual(
+            list(CSVDataRetriever(self.path).iter_rows(batch_size=5)),
+            [[["Japanese", "English"], ["山", "Mountain"]]],
+        )
+        self.assertEqual(
+            CSVDataRetriever(self.path).load_data(),
+            [["Japanese", "English"], ["山", "Mountain"]],
+        )
+
+    def test_compaction_folds_journal_into_csv(self):
+        remover = CSVDataRemover(self.path, journal=True, compact_bytes=1)
+        remover.remove_word("川")
+
+        self.assertFalse(os.path.isfile(remover.journal.path))
+        with open(self.path, encoding="utf-8") as file:
+            self.assertEqual(
+                file.read().splitlines(), ["Japanese,English", "山,Mountain"]
+            )
+
+
+class TestCompiledDeckRetriever(unittest.TestCase):
+    def setUp(self):
+        self.tmp = tempfile.TemporaryDirectory()
+        self.path = os.path.join(self.tmp.name, "deck.csv")
+        with open(self.path, "w", encoding="utf-8") as file:
+            file.write("Japanese,English\n川,River\n山,Mountain\n")
+
+    def tearDown(self):
+        self.tmp.cleanup()
+
+    def test_compiled_deck_random_access(self):
+        deck = CompiledDeckRetriever(self.path).load_data()
+
+        self.assertEqual(deck.header, ("Japanese", "English"))
+        self.assertEqual(len(deck), 2)
+        self.assertEqual(deck[1], ("山", "Mountain"))
+        self.assertEqual(deck.pop(0), ("川", "River"))
+        self.assertEqual(list(deck), [("山", "Mountain")])
+
+    def test_compiled_deck_rebuilds_when_source_is_newer(self):
+        retriever = CompiledDeckRetriever(self.path)
+        old_deck = retriever.load_data()
+
+        with open(self.path, "a", encoding="utf-8") as file:
+            file.write("空,Sky\n")
+        future = time.time() + 10
+        os.utime(self.path, (future, future))
+
+        self.assertEqual(retriever.load_data()[2], ("空", "Sky"))
+        self.assertTrue(old_deck._mm.closed)
+
+    def test_journaled_removals_filter_without_rebuild(self):
+        retriever = CompiledDeckRetriever(self.path)
+        retriever.load_data()
+        remover = CSVDataRemover(self.path, journal=True, compact_bytes=1 << 20)
+        remover.compact_ratio = 1.0
+        remover.mark_for_removal("川")
+        remover.flush()
+
+        with patch("lexicards.data.compiled_deck.compile_deck") as compile_deck:
+            deck = CompiledDeckRetriever(self.path).load_data()
+
+        compile_deck.assert_not_called()
+        self.assertEqual(list(deck), [("山", "Mountain")])
+
+
+class TestShardedDeck(unittest.TestCase):
+    def setUp(self):
+        self.tmp = tempfile.TemporaryDirectory()
+        self.path = os.path.join(self.tmp.name, "deck.csv")
+        with open(self.path, "w", encoding="utf-8") as file:
+            file.write("Japanese,English\n")
+            file.writelines(f"word{i},meaning{i}\n" for i in range(40))
+
+        self.retriever = ShardedDeckRetriever(self.path, shards=4)
+
+    def tearDown(self):
+        self.tmp.cleanup()
+
+    def read_shards(self):
+        shards_dir = self.retriever.shards_dir
+        contents = {}
+        for name in read_manifest(shards_dir)["files"]:
+            with open(os.path.join(shards_dir, name), encoding="utf-8") as file:
+                contents[name] = file.read()
+        return contents
+
+    def test_shards_load_on_first_access(self):
+        deck = self.retriever.load_data()
+
+        self.assertEqual(deck.header, ("Japanese", "English"))
+        self.assertEqual(len(deck), 40)
+        self.assertEqual(deck.loaded_shards, 0)
+
+        deck[0]
+        self.assertEqual(deck.loaded_shards, 1)
+        self.assertEqual(sorted(deck)[0], ("word0", "meaning0"))
+
+    def test_removal_rewrites_only_the_affected_shard(self):
+        self.retriever.load_data()
+        before = self.read_shards()
+
+        ShardedDataRemover(self.path).remove_word("word7")
+
+        after = self.read_shards()
+        changed = [name for name in before if before[name] != after[name]]
+        self.assertEqual(len(changed), 1)
+        self.assertNotIn("word7,", after[changed[0]])
+
+        deck = self.retriever.load_data()
+        self.assertEqual(len(deck), 39)
+        self.assertNotIn(("word7", "meaning7"), list(deck))
+
+
+class TestSQLiteStorage(unittest.TestCase):
+    def setUp(self):
+        self.tmp = tempfile.TemporaryDirectory()
+        self.path = os.path.join(self.tmp.name, "deck.csv")
+        with open(self.path, "w", encoding="utf-8") as file:
+            file.write("Japanese,English\n川,River\n山,Mountain\n")
+        self.database = SQLiteDatabase(os.path.join(self.tmp.name, "test.db"))
+
+    def tearDown(self):
+        self.database.close()
+        self.tmp.cleanup()
+
+    def test_retriever_imports_deck_and_remover_batches_deletes(self):
+        retriever = SQLiteDataRetrieverFactory(self.database).create_data_retriever(
+            self.path
+        )
+        remover = SQLiteDataRemoverFactory(self.database).create_data_remover(self.path)
+
+        self.assertEqual(retriever.load_data()[2], ["山", "Mountain"])
+
+        remover.mark_for_removal("川")
+        remover.flush()
+
+        self.assertEqual(
+            list(retriever.iter_rows(batch_size=1)),
+            [[["Japanese", "English"]], [["山", "Mountain"]]],
+        )
+
+    def test_deck_name_and_path_share_one_deck(self):
+        # DeckRegistry hands retrievers absolute paths; removers get the name
+        retriever = SQLiteDataRetrieverFactory(self.database).create_data_retriever(
+            self.path
+        )
+        remover = SQLiteDataRemoverFactory(self.database).create_data_remover(
+            "deck.csv"
+        )
+        retriever.load_data()
+
+        remover.mark_for_removal("川")
+        remover.flush()
+
+        self.assertEqual(
+            retriever.load_data(), [["Japanese", "English"], ["山", "Mountain"]]
+        )
+
+    def test_saver_ignores_duplicates(self):
+        saver = SQLiteDataSaverFactory(self.database).create_data_saver(
+            "known_words.csv"
+        )
+        saver.save_data("川", "River")
+        saver.save_data("川", "River")
+
+        rows = self.database.connection.execute(
+            "SELECT list, word FROM progress"
+        ).fetchall()
+        self.assertEqual(rows, [("known_words", "川")])
+
+
 if __name__ == "__main__":
     unittest.main()
@@ -1,11 +1,39 @@
+import asyncio
+import atexit
+import os
+import random
+import tempfile
 import unittest
 from unittest.mock import MagicMock
 
+from lexicards.core.fenwick_tree import FenwickTree
+from lexicards.data.async_data import (
+    ExecutorDataRemoverFactory,
+    ExecutorDataRetrieverFactory,
+    ExecutorDataSaverFactory,
+)
 from lexicards.data.data_remover import DataRemoverFactory
-from lexicards.data.data_retriever import DataRetrieverFactory
-from lexicards.data.data_saver import DataSaverFactory
+from lexicards.data.data_retriever import CSVDataRetrieverFactory, DataRetrieverFactory
+from lexicards.data.data_saver import CSVDataSaverFactory, DataSaverFactory
+from lexicards.data.session_log import SessionLog
+from lexicards.errors.error import DataCorruptionError
 from lexicards.interfaces.data.i_data_retriever import IDataRetriever
+from lexicards.manager.async_word_manager import AsyncWordManager
+from lexicards.manager.card_sampler import (
+    DEFAULT_WEIGHT,
+    ShuffleBagSampler,
+    WeightedCardSampler,
+)
+from lexicards.manager.deck_registry import (
+    DeckRegistry,
+    RegistryDataRetrieverFactory,
+    SessionDataRetrieverFactory,
+)
+from lexicards.manager.shared_deck import FrozenDeck
+from lexicards.manager.srs_word_manager import DAY, SpacedRepetitionWordManager
 from lexicards.manager.word_manager import WordManager
+from lexicards.manager.word_store import WordStore
+from lexicards.search.card_search import CardSearchIndex
 
 
 class TestWordManager(unittest.TestCase):
@@ -40,7 +68,7 @@ class TestWordManager(unittest.TestCase):
 
     def test_get_random_word(self):
         current_word, current_meaning = self.manager.get_random_word()
-        self.assertIn([current_word, current_meaning], self.manager.words)
+        self.assertIn((current_word, current_meaning), self.manager.words)
 
     def test_mark_as_known(self):
         self.manager.current_word = "川"
@@ -51,6 +79,30 @@ class TestWordManager(unittest.TestCase):
             self.manager.current_word
         )
 
+    def test_mark_as_known_retires_current_card(self):
+        word, meaning = self.manager.get_random_word()
+
+        self.manager.mark_as_known()
+
+        self.assertEqual(len(self.manager.words), 1)
+        self.assertNotIn((word, meaning), self.manager.words)
+
+    def test_failed_known_save_keeps_word_in_deck(self):
+        with tempfile.TemporaryDirectory() as tmp:
+            # A directory in place of the file makes the append fail
+            known_file = os.path.join(tmp, "known_words.csv")
+            os.mkdir(known_file)
+            self.manager.saver_factory = CSVDataSaverFactory("Japanese", "English")
+            self.manager.known_file = known_file
+            self.manager.current_word = "川"
+            self.manager.current_meaning = "River"
+
+            with self.assertRaises(DataCorruptionError):
+                self.manager.mark_as_known()
+
+        self.mock_remover.mark_for_removal.assert_not_called()
+        self.assertIn(("川", "River"), self.manager.words)
+
     def test_mark_as_unknown_called(self):
         self.manager.current_word = "川"
         self.manager.current_meaning = "River"
@@ -67,13 +119,461 @@ class TestWordManager(unittest.TestCase):
 
     def test_load_words(self):
         words = self.manager.words  # Already loaded in __init__
-        self.assertEqual(words[1], ["川", "River"])
-        self.assertEqual(words[2], ["山", "Mountain"])
+        self.assertEqual(len(words), 2)
+        self.assertEqual(words[0], ("川", "River"))
+        self.assertEqual(words[1], ("山", "Mountain"))
         self.mock_loader_factory.create_data_retriever.assert_called_once_with(
             "mock.csv"
         )
         self.mock_retriever.load_data.assert_called_once()
 
+    def test_streaming_load(self):
+        self.mock_retriever.iter_rows.return_value = iter(
+            [[["Japanese", "English"], ["川", "River"]], [["山", "Mountain"]]]
+        )
+
+        manager = WordManager(
+            loader_factory=self.mock_loader_factory,
+            saver_factory=self.mock_saver_factory,
+            data_remover=self.mock_remover_factory,
+            source_file="mock.csv",
+            load_batch_size=2,
+        )
+
+        self.assertTrue(manager.loaded.wait(timeout=1))
+        self.assertEqual(manager.words[1], ("山", "Mountain"))
+        self.mock_retriever.iter_rows.assert_called_once_with(2)
+
+
+class TestWeightedCardSampler(unittest.TestCase):
+    def setUp(self):
+        loader_factory = MagicMock(spec=DataRetrieverFactory)
+        loader_factory.create_data_retriever.return_value.load_data.return_value = [
+            ["Japanese", "English"],
+            *([f"単語{i}", f"word {i}"] for i in range(50)),
+        ]
+        self.sampler = WeightedCardSampler(rng=random.Random(7))
+        self.manager = WordManager(
+            loader_factory=loader_factory,
+            saver_factory=MagicMock(spec=DataSaverFactory),
+            data_remover=MagicMock(spec=DataRemoverFactory),
+            source_file="mock.csv",
+            sampler=self.sampler,
+        )
+
+    def test_fenwick_find_matches_cumulative_weights(self):
+        weights = [3, 0, 5, 1, 0, 2, 7]
+        tree = FenwickTree(weights[:3])
+        for weight in weights[3:]:
+            tree.append(weight)
+        tree.set(1, 4)
+        weights[1] = 4
+
+        expected = [i for i, weight in enumerate(weights) for _ in range(weight)]
+        self.assertEqual([tree.find(t) for t in range(tree.total)], expected)
+
+    def test_marks_update_weights(self):
+        word = self.manager.get_random_word()
+        row = self.manager.current_row
+        self.manager.mark_as_unknown()
+        self.assertEqual(self.sampler.weight_of(row), 2 * DEFAULT_WEIGHT)
+
+        self.manager.mark_as_known()
+        self.assertEqual(self.sampler.weight_of(row), 0)
+        self.assertNotIn(word, self.manager.words)
+
+    def test_missed_card_is_drawn_more_often(self):
+        row = self.manager.words.row_id(0)
+        for _ in range(3):
+            self.sampler.record(row, known=False)
+
+        draws = [self.sampler.draw() for _ in range(2000)]
+        weight = self.sampler.weight_of(row)
+        expected = weight / (weight + DEFAULT_WEIGHT * (len(self.manager.words) - 1))
+        self.assertAlmostEqual(draws.count(row) / len(draws), expected, delta=0.05)
+
+
+class TestShuffleBagSampler(unittest.TestCase):
+    def setUp(self):
+        self.words = WordStore.from_rows(
+            [["Japanese", "English"], *([f"単語{i}", f"word {i}"] for i in range(6))]
+        )
+        self.sampler = ShuffleBagSampler(rng=random.Random(3))
+        self.sampler.reset(self.words)
+
+    def test_each_card_once_per_pass(self):
+        draws = [self.sampler.draw() for _ in range(12)]
+
+        self.assertEqual(sorted(draws[:6]), list(range(6)))
+        self.assertEqual(sorted(draws[6:]), list(range(6)))
+
+    def test_cards_retired_and_added_mid_pass(self):
+        first = [self.sampler.draw() for _ in range(2)]
+        waiting = next(row for row in range(6) if row not in first)
+        self.sampler.remove(first[0])
+        self.sampler.remove(waiting)
+        self.words.append("空", "Sky")
+        self.sampler.add(6)
+
+        rest = [self.sampler.draw() for _ in range(4)]
+
+        self.assertEqual(
+            sorted(first[1:] + rest),
+            sorted({0, 1, 2, 3, 4, 5, 6} - {first[0], waiting}),
+        )
+        self.assertEqual(len(self.sampler), 5)
+
+
+class TestHotReload(unittest.TestCase):
+    def setUp(self):
+        self.tmp = tempfile.TemporaryDirectory()
+        self.path = os.path.join(self.tmp.name, "deck.csv")
+        self.write_deck(["川,River", "山,Mountain", "空,Sky"])
+
+        self.manager = WordManager(
+            loader_factory=CSVDataRetrieverFactory(),
+            saver_factory=MagicMock(spec=DataSaverFactory),
+            data_remover=MagicMock(spec=DataRemoverFactory),
+            source_file=self.path,
+        )
+
+    def tearDown(self):
+        self.tmp.cleanup()
+
+    def write_deck(self, rows):
+        with open(self.path, "w", encoding="utf-8") as file:
+            file.write("\n".join(["Japanese,English", *rows]) + "\n")
+
+    def test_reload_applies_only_inserts_and_deletes(self):
+        # Retire 川, then show 山 as the current card
+        self.manager.current_row = self.manager.words.row_id(0)
+        self.manager.current_word, self.manager.current_meaning = "川", "River"
+        self.manager.mark_as_known()
+        self.manager.current_word, self.manager.current_meaning = "山", "Mountain"
+
+        self.write_deck(["川,River", "山,Mountain", "海,Sea"])
+
+        self.assertEqual(self.manager.reload_source(), (1, 1))
+        self.assertEqual(
+            sorted(self.manager.words), [("山", "Mountain"), ("海", "Sea")]
+        )
+        self.assertEqual(self.manager.current_word, "山")
+        self.manager.remover.mark_for_removal.assert_called_once_with("川")
+
+
+class TestSessionResume(unittest.TestCase):
+    def setUp(self):
+        self.tmp = tempfile.TemporaryDirectory()
+        self.log_path = os.path.join(self.tmp.name, "session.log")
+        self.remover_factory = MagicMock(spec=DataRemoverFactory)
+
+    def tearDown(self):
+        self.tmp.cleanup()
+
+    def create_manager(self, sampler=None, rows=None):
+        loader_factory = MagicMock(spec=DataRetrieverFactory)
+        loader_factory.create_data_retriever.return_value.load_data.return_value = [
+            ["Japanese", "English"]
+        ] + (rows or [["川", "River"], ["山", "Mountain"], ["空", "Sky"]])
+        log = SessionLog(self.log_path)
+        self.addCleanup(log.close)
+        return WordManager(
+            loader_factory=loader_factory,
+            saver_factory=MagicMock(spec=DataSaverFactory),
+            data_remover=self.remover_factory,
+            source_file="mock.csv",
+            sampler=sampler,
+            session_log=log,
+        )
+
+    def test_resume_retires_known_and_weights_missed(self):
+        manager = self.create_manager()
+        manager.show_card(0, "川", "River")
+        manager.mark_as_known()
+        manager.show_card(1, "山", "Mountain")
+        manager.mark_as_unknown()
+        manager.session_log.close()
+
+        # The removal of 川 never reached the source, so it is loaded again
+        sampler = WeightedCardSampler()
+        resumed = self.create_manager(sampler)
+
+        self.assertEqual(sorted(resumed.words), [("山", "Mountain"), ("空", "Sky")])
+        resumed.remover.mark_for_removal.assert_called_with("川")
+        self.assertEqual(sampler.weight_of(1), 2 * DEFAULT_WEIGHT)
+
+    def test_resume_forgets_known_words_gone_from_deck(self):
+        manager = self.create_manager()
+        manager.show_card(0, "川", "River")
+        manager.mark_as_known()
+        manager.session_log.close()
+        self.remover_factory.reset_mock()
+
+        # The removal of 川 reached the source this time
+        resumed = self.create_manager(rows=[["山", "Mountain"], ["空", "Sky"]])
+        resumed.session_log.close()
+
+        self.assertEqual(resumed.session_log.state.known, set())
+        self.assertEqual(SessionLog(self.log_path).restore().known, set())
+        resumed.remover.mark_for_removal.assert_not_called()
+
+    def test_streamed_resume_retires_known_words_in_later_batches(self):
+        manager = self.create_manager()
+        manager.show_card(2, "空", "Sky")
+        manager.mark_as_known()
+        manager.session_log.close()
+
+        loader_factory = MagicMock(spec=DataRetrieverFactory)
+        loader_factory.create_data_retriever.return_value.iter_rows.return_value = iter(
+            [
+                [["Japanese", "English"], ["川", "River"]],
+                [["山", "Mountain"], ["空", "Sky"]],
+            ]
+        )
+        log = SessionLog(self.log_path)
+        self.addCleanup(log.close)
+        resumed = WordManager(
+            loader_factory=loader_factory,
+            saver_factory=MagicMock(spec=DataSaverFactory),
+            data_remover=self.remover_factory,
+            source_file="mock.csv",
+            load_batch_size=2,
+            session_log=log,
+            search_index=CardSearchIndex(),
+        )
+
+        self.assertTrue(resumed.loaded.wait(timeout=1))
+        self.assertEqual(sorted(resumed.words), [("山", "Mountain"), ("川", "River")])
+        self.assertEqual(resumed.find_cards("sky"), [])
+        self.assertEqual(log.state.known, {"空"})
+
+
+class TestSpacedRepetitionWordManager(unittest.TestCase):
+    def setUp(self):
+        self.tmp = tempfile.TemporaryDirectory()
+        self.now = 1000.0
+        self.loader_factory = MagicMock(spec=DataRetrieverFactory)
+        self.loader_factory.create_data_retriever.return_value.load_data.return_value = [
+            ["Japanese", "English"],
+            ["川", "River"],
+            ["山", "Mountain"],
+        ]
+        self.manager = self.create_manager()
+
+    def tearDown(self):
+        self.tmp.cleanup()
+
+    def create_manager(self):
+        manager = SpacedRepetitionWordManager(
+            loader_factory=self.loader_factory,
+            saver_factory=MagicMock(spec=DataSaverFactory),
+            data_remover=MagicMock(spec=DataRemoverFactory),
+            source_file="mock.csv",
+            state_file=os.path.join(self.tmp.name, "review_state.bin"),
+            clock=lambda: self.now,
+        )
+        self.addCleanup(atexit.unregister, manager.close)
+        return manager
+
+    def test_missed_card_comes_back_before_known_card(self):
+        first = self.manager.get_random_word()
+        self.manager.mark_as_unknown()
+        second = self.manager.get_random_word()
+        self.manager.mark_as_known()
+
+        self.now += self.manager.relearn_delay
+        self.assertEqual(self.manager.get_random_word(), first)
+        self.assertNotEqual(first, second)
+        self.assertEqual(len(self.manager.words), 2)
+
+    def test_state_survives_restart(self):
+        word = self.manager.get_random_word()
+        self.manager.mark_as_known()
+        self.manager.save_state().result()
+
+        self.now += 1
+        restarted = self.create_manager()
+        self.assertNotEqual(restarted.get_random_word(), word)
+        restarted.mark_as_known()
+
+        self.now += DAY - 1
+        self.assertEqual(restarted.get_random_word(), word)
+
+    def test_close_saves_grades_since_last_save(self):
+        word = self.manager.get_random_word()
+        self.manager.mark_as_known()
+        # One grade, below flush_interval: only close() writes it
+        self.manager.close()
+
+        self.now += 1
+        restarted = self.create_manager()
+        self.assertNotEqual(restarted.get_random_word(), word)
+
+    def test_card_retires_once_interval_reaches_graduate_after(self):
+        self.manager.graduate_after = 6 * DAY
+        word = self.manager.get_random_word()
+        self.manager.mark_as_known()
+        self.now += DAY
+        self.assertEqual(self.manager.get_random_word(), word)
+        self.manager.mark_as_known()
+
+        self.assertEqual(len(self.manager.words), 1)
+        self.manager.remover.mark_for_removal.assert_called_once_with(word[0])
+
+
+class TestAsyncWordManager(unittest.TestCase):
+    def setUp(self):
+        self.mock_loader_factory = MagicMock(spec=DataRetrieverFactory)
+        self.mock_retriever = MagicMock(spec=IDataRetriever)
+        self.mock_loader_factory.create_data_retriever.return_value = (
+            self.mock_retriever
+        )
+        self.mock_retriever.iter_rows.return_value = iter(
+            [[["Japanese", "English"], ["川", "River"]], [["山", "Mountain"]]]
+        )
+
+        self.mock_saver_factory = MagicMock(spec=DataSaverFactory)
+        self.mock_saver = MagicMock()
+        self.mock_saver_factory.create_data_saver.return_value = self.mock_saver
+
+        self.mock_remover_factory = MagicMock(spec=DataRemoverFactory)
+        self.mock_remover = MagicMock()
+        self.mock_remover_factory.create_data_remover.return_value = self.mock_remover
+
+    def create_manager(self):
+        return AsyncWordManager.create(
+            loader_factory=ExecutorDataRetrieverFactory(self.mock_loader_factory),
+            saver_factory=ExecutorDataSaverFactory(self.mock_saver_factory),
+            data_remover=ExecutorDataRemoverFactory(self.mock_remover_factory),
+            source_file="mock.csv",
+            flush_interval=1,
+            load_batch_size=1,
+        )
+
+    def test_streaming_load_and_mark_as_known(self):
+        async def session():
+            manager = await self.create_manager()
+            await manager.loaded.wait()
+            self.assertEqual(manager.foreign_language, "Japanese")
+            self.assertEqual(len(manager.words), 2)
+
+            word, meaning = await manager.get_random_word()
+            await manager.mark_as_known()
+            await manager.drain()
+            return manager, word, meaning
+
+        manager, word, meaning = asyncio.run(session())
+
+        self.assertNotIn((word, meaning), manager.words)
+        self.mock_saver.save_data.assert_called_once_with(word, meaning)
+        self.mock_remover.mark_for_removal.assert_called_once_with(word)
+        self.mock_remover.flush.assert_called_once()
+
+
+class TestDeckRegistry(unittest.TestCase):
+    def setUp(self):
+        self.tmp = tempfile.TemporaryDirectory()
+        decks = {
+            "french_words.csv": "French,English\npartie,part\n",
+            "japanese_words.csv": "Japanese,English\n川,River\n山,Mountain\n",
+            "known_words.csv": "Japanese,English\n",
+        }
+        for name, content in decks.items():
+            with open(os.path.join(self.tmp.name, name), "w", encoding="utf-8") as file:
+                file.write(content)
+
+        self.registry = DeckRegistry(CSVDataRetrieverFactory(), self.tmp.name)
+        self.addCleanup(self.registry.close)
+
+    def tearDown(self):
+        self.tmp.cleanup()
+
+    def test_discovers_decks_without_progress_files(self):
+        names = [os.path.basename(path) for path in self.registry.decks]
+        self.assertEqual(names, ["french_words.csv", "japanese_words.csv"])
+
+    def test_word_manager_shares_registry_deck(self):
+        japanese = os.path.join(self.tmp.name, "japanese_words.csv")
+        self.registry.start(first=japanese)
+
+        manager = WordManager(
+            loader_factory=RegistryDataRetrieverFactory(self.registry),
+            saver_factory=MagicMock(spec=DataSaverFactory),
+            data_remover=MagicMock(spec=DataRemoverFactory),
+            source_file=japanese,
+        )
+
+        self.assertIs(manager.words, self.registry.get(japanese))
+        self.assertEqual(manager.foreign_language, "Japanese")
+        french = self.registry.get(os.path.join(self.tmp.name, "french_words.csv"))
+        self.assertEqual(list(french), [("partie", "part")])
+
+    def test_sessions_share_one_frozen_deck(self):
+        japanese = os.path.join(self.tmp.name, "japanese_words.csv")
+        managers = [
+            WordManager(
+                loader_factory=SessionDataRetrieverFactory(self.registry),
+                saver_factory=MagicMock(spec=DataSaverFactory),
+                data_remover=MagicMock(spec=DataRemoverFactory),
+                source_file=japanese,
+            )
+            for _ in range(2)
+        ]
+
+        managers[0].get_random_word()
+        managers[0].mark_as_known()
+
+        self.assertEqual(len(managers[0].words), 1)
+        self.assertEqual(len(managers[1].words), 2)
+        self.assertEqual(len(self.registry.get(japanese)), 2)
+        self.assertIs(managers[0].words._base, managers[1].words._base)
+
+
+class TestSessionDeck(unittest.TestCase):
+    def setUp(self):
+        self.deck = FrozenDeck.from_rows(
+            [["Japanese", "English"], *([f"単語{i}", f"word {i}"] for i in range(1000))]
+        )
+
+    def test_overlay_grows_with_changes_only(self):
+        session = self.deck.session()
+        self.assertEqual(session.overlay_size, 0)
+
+        session.pop(10)
+        session.append("空", "Sky")
+
+        self.assertEqual(len(session), 1000)
+        self.assertEqual(session[10], ("単語999", "word 999"))
+        self.assertEqual(session[999], ("空", "Sky"))
+        self.assertIsNone(session.index_of(10))
+        self.assertEqual(session.index_of(999), 10)
+        self.assertEqual(session.overlay_size, 6)
+        self.assertEqual(len(self.deck.session()), 1000)
+
+
+class TestWordStore(unittest.TestCase):
+    def setUp(self):
+        self.store = WordStore.from_rows(
+            [["Japanese", "English"], ["川", "River"], [], ["山", "Mountain"]]
+        )
+
+    def test_header_is_kept_apart(self):
+        self.assertEqual(self.store.header, ("Japanese", "English"))
+        self.assertEqual(list(self.store), [("川", "River"), ("山", "Mountain")])
+
+    def test_pop_moves_last_card_and_keeps_row_ids(self):
+        self.store.append("空", "Sky")
+        sky_row = self.store.row_id(2)
+
+        self.assertEqual(self.store.pop(0), ("川", "River"))
+        self.assertEqual(len(self.store), 2)
+        self.assertEqual(self.store[0], ("空", "Sky"))
+        self.assertEqual(self.store.index_of(sky_row), 0)
+        self.assertIsNone(self.store.index_of(0))
+
+    def test_store_has_no_instance_dict(self):
+        self.assertFalse(hasattr(self.store, "__dict__"))
+
 
 if __name__ == "__main__":
     unittest.main()
@@ -0,0 +1,223 @@
+import os
+import random
+import tempfile
+import unittest
+from unittest.mock import MagicMock
+
+from lexicards.data.compiled_deck import CompiledDeckRetrieverFactory
+from lexicards.data.data_remover import DataRemoverFactory
+from lexicards.data.data_retriever import DataRetrieverFactory
+from lexicards.data.data_saver import DataSaverFactory
+from lexicards.data.sharded_deck import ShardedDeckRetrieverFactory
+from lexicards.manager.word_manager import WordManager
+from lexicards.manager.word_store import WordStore
+from lexicards.search.card_search import CardSearchIndex
+from lexicards.search.prefix_trie import BUCKET_SIZE, PrefixTrie
+from lexicards.search.text_normalize import normalize_key
+from lexicards.search.trigram_index import TrigramIndex
+
+
+class TestPrefixTrie(unittest.TestCase):
+    def setUp(self):
+        rng = random.Random(7)
+        self.keys = [
+            "".join(rng.choice("abcde") for _ in range(rng.randint(0, 6)))
+            for _ in range(40 * BUCKET_SIZE)
+        ]
+        self.trie = PrefixTrie()
+        for row, key in enumerate(self.keys):
+            self.trie.insert(key, row)
+
+    def expected(self, prefix):
+        rows = [row for row, key in enumerate(self.keys) if key.startswith(prefix)]
+        return sorted(rows, key=lambda row: (self.keys[row], row))
+
+    def test_prefix_lookup_matches_scan_in_key_order(self):
+        for prefix in ["", "a", "ab", "cde", "eeeee", "abcdef", "z"]:
+            self.assertEqual(list(self.trie.iter_prefix(prefix)), self.expected(prefix))
+
+    def test_remove_updates_lookups(self):
+        for row in range(0, len(self.keys), 3):
+            self.assertTrue(self.trie.remove(self.keys[row], row))
+        self.assertFalse(self.trie.remove(self.keys[0], 0))
+
+        for prefix in ["", "b", "dd"]:
+            kept = [row for row in self.expected(prefix) if row % 3]
+            self.assertEqual(list(self.trie.iter_prefix(prefix)), kept)
+        self.assertEqual(len(self.trie), len(self.keys) - len(self.keys[::3]))
+
+    def test_cascading_burst_keeps_duplicate_keys(self):
+        trie = PrefixTrie()
+        for row in range(BUCKET_SIZE - 1):
+            trie.insert("a%02d" % row, row)
+        trie.insert("az", 100)
+        trie.insert("az", 101)
+        # Bursts the root, and the "a" child bursts while rows move into it
+        trie.insert("a-", 102)
+
+        self.assertEqual(list(trie.iter_prefix("az")), [100, 101])
+        self.assertEqual(len(list(trie.iter_prefix(""))), len(trie))
+        self.assertTrue(trie.remove("az", 101))
+        self.assertEqual(list(trie.iter_prefix("az")), [100])
+
+
+class TestTrigramIndex(unittest.TestCase):
+    def test_search_matches_scan_through_retire_and_compaction(self):
+        rng = random.Random(3)
+        texts = [
+            " ".join(
+                "".join(rng.choice("abc") for _ in range(rng.randint(1, 4)))
+                for _ in range(rng.randint(1, 3))
+            )
+            for _ in range(6000)
+        ]
+        index = TrigramIndex(texts.__getitem__)
+        index.extend((text, row) for row, text in enumerate(texts[:5000]))
+        for row in range(5000, len(texts)):
+            index.insert(texts[row], row)
+
+        active = set(range(len(texts)))
+        # Retiring half the rows triggers a compaction on the way
+        for row in [0] + rng.sample(range(1, len(texts)), 2999):
+            index.remove(row)
+            active.discard(row)
+        index.insert(texts[0], 0)
+        active.add(0)
+
+        self.assertEqual(len(index), len(active))
+        for query in ["ab", "abc", "ca b", "bbb", "cc a"]:
+            padded = query if len(query) >= 3 else " " + query
+            expected = [row for row in sorted(active) if padded in f" {texts[row]} "]
+            self.assertEqual(list(index.search(query)), expected)
+
+
+class TestCardSearchIndex(unittest.TestCase):
+    def setUp(self):
+        self.words = WordStore.from_rows(
+            [
+                ["\ufeffJapanese", "English"],
+                ["\ufeffカメラ", "Camera"],
+                ["ｶﾒ", "Turtle"],
+                ["川", "River"],
+                ["川口", "River mouth"],
+                ["Straße", "Street"],
+            ]
+        )
+        self.index = CardSearchIndex()
+        self.index.reset(self.words)
+
+    def test_normalize_key(self):
+        self.assertEqual(normalize_key("\ufeff ＡＢＣ "), "abc")
+        self.assertEqual(normalize_key("ｶﾒ"), "カメ")
+
+    def test_find_words_by_normalized_prefix(self):
+        self.assertEqual(
+            self.index.find_words("カメ"),
+            [("ｶﾒ", "Turtle"), ("\ufeffカメラ", "Camera")],
+        )
+        self.assertEqual(
+            self.index.find_words("川"), [("川", "River"), ("川口", "River mouth")]
+        )
+        self.assertEqual(self.index.find_words("STRASSE"), [("Straße", "Street")])
+        self.assertEqual(self.index.find_words("川", limit=1), [("川", "River")])
+
+    def test_find_meanings_by_substring(self):
+        self.assertEqual(self.index.find_meanings("mouth"), [("川口", "River mouth")])
+        self.assertEqual(
+            self.index.find_meanings("RIVER"),
+            [("川", "River"), ("川口", "River mouth")],
+        )
+        # Two characters match word starts only
+        self.assertEqual(self.index.find_meanings("mo"), [("川口", "River mouth")])
+        self.assertEqual(self.index.find_meanings("ou"), [])
+        self.assertEqual(self.index.find_meanings("r"), [])
+
+    def test_retired_cards_leave_the_index(self):
+        row = self.words.row_id(2)
+        self.words.pop(2)
+        self.index.remove(row)
+
+        self.assertEqual(self.index.find_words("川"), [("川口", "River mouth")])
+        self.assertEqual(self.index.find_meanings("river"), [("川口", "River mouth")])
+
+        self.words.append("川", "River")
+        self.index.add(self.words.row_id(len(self.words) - 1))
+        self.assertEqual(len(self.index.find_meanings("river")), 2)
+
+
+class TestWordManagerSearch(unittest.TestCase):
+    def test_find_cards_tracks_known_words(self):
+        loader_factory = MagicMock(spec=DataRetrieverFactory)
+        loader_factory.create_data_retriever.return_value.load_data.return_value = [
+            ["Japanese", "English"],
+            ["川", "River"],
+            ["山", "Mountain"],
+            ["山川", "Mountains and rivers"],
+        ]
+        manager = WordManager(
+            loader_factory=loader_factory,
+            saver_factory=MagicMock(spec=DataSaverFactory),
+            data_remover=MagicMock(spec=DataRemoverFactory),
+            source_file="mock.csv",
+            search_index=CardSearchIndex(),
+        )
+
+        self.assertEqual(
+            manager.find_cards("山"),
+            [("山", "Mountain"), ("山川", "Mountains and rivers")],
+        )
+        self.assertEqual(
+            manager.find_cards("river"),
+            [("川", "River"), ("山川", "Mountains and rivers")],
+        )
+
+        manager.show_card(0, "川", "River")
+        manager.mark_as_known()
+        self.assertEqual(
+            manager.find_cards("river"), [("山川", "Mountains and rivers")]
+        )
+
+
+class TestSearchOverDeckFormats(unittest.TestCase):
+    def setUp(self):
+        self.tmp = tempfile.TemporaryDirectory()
+        self.path = os.path.join(self.tmp.name, "deck.csv")
+        with open(self.path, "w", encoding="utf-8") as file:
+            file.write(
+                "Japanese,English\n川,River\n山,Mountain\n山川,Mountains and rivers\n"
+            )
+            file.writelines(f"語{i},word {i}\n" for i in range(40))
+
+    def tearDown(self):
+        self.tmp.cleanup()
+
+    def check_manager(self, loader_factory):
+        manager = WordManager(
+            loader_factory=loader_factory,
+            saver_factory=MagicMock(spec=DataSaverFactory),
+            data_remover=MagicMock(spec=DataRemoverFactory),
+            source_file=self.path,
+            search_index=CardSearchIndex(),
+        )
+        self.assertEqual(
+            sorted(manager.find_cards("river")),
+            [("山川", "Mountains and rivers"), ("川", "River")],
+        )
+        self.assertEqual(len(manager.find_cards("語", limit=50)), 40)
+
+        index = list(manager.words).index(("川", "River"))
+        manager.show_card(manager.words.row_id(index), "川", "River")
+        manager.mark_as_known()
+        self.assertEqual(
+            manager.find_cards("river"), [("山川", "Mountains and rivers")]
+        )
+
+    def test_compiled_deck(self):
+        self.check_manager(CompiledDeckRetrieverFactory())
+
+    def test_sharded_deck(self):
+        self.check_manager(ShardedDeckRetrieverFactory(shards=4))
+
+
+if __name__ == "__main__":
+    unittest.main()